@@ -1,80 +1,438 @@
+import atexit
+import copy
 import csv
+import gzip
 import json
+import locale
 import os
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from file_lock import FileLock
+from tracker_events import (
+    APPLIED,
+    BASELINE,
+    CLAIMED,
+    FOUND,
+    RELEASED,
+    ROLLUP_SNAPSHOT,
+    STATUS_COUNTERS,
+    STATUS_EVENTS,
+    EventLog,
+    apply_event,
+    empty_statistics
+)
+
+CSV_COLUMNS = [
+    'job_id', 
+    'title', 
+    'company', 
+    'location',
+    'applied_date', 
+    'resume_file', 
+    'cover_letter_file',
+    'status',
+    'notes'
+]
+
+def create_tracker(base_dir: Path, backend: str = 'csv', mirror_csv: bool = True) -> 'ApplicationTracker':
+    """Create an application tracker using the configured storage backend ('csv' or 'sqlite')"""
+    if backend == 'sqlite':
+        from sqlite_tracker import SQLiteApplicationTracker
+        return SQLiteApplicationTracker(base_dir, mirror_csv=mirror_csv)
+    return ApplicationTracker(base_dir)
 
 class ApplicationTracker:
     """Enhanced tracker for job applications with improved duplicate detection"""
     
+    # Rewrite the job ID log once it holds this many times more lines than unique IDs
+    JOB_ID_LOG_COMPACT_RATIO = 2
+    
+    # Job ID log lines starting with this remove a released claim
+    RELEASE_MARKER = '-'
+    
+    # Buffered events are flushed after this many events or seconds, whichever comes first
+    STATS_FLUSH_EVERY = 50
+    STATS_FLUSH_INTERVAL = 30
+    
     def __init__(self, base_dir: Path):
         self.base_dir = base_dir
         self.tracking_file = base_dir / 'tracking' / 'applications.csv'
         self.stats_file = base_dir / 'tracking' / 'statistics.json'
-        self.job_ids_file = base_dir / 'tracking' / 'job_ids.json'
+        self.job_ids_file = base_dir / 'tracking' / 'job_ids.log'
+        self.legacy_job_ids_file = base_dir / 'tracking' / 'job_ids.json'
+        self.job_ids_state_file = base_dir / 'tracking' / 'job_ids.state.json'
+        self.archive_dir = base_dir / 'tracking' / 'archive'
+        self.events = EventLog(base_dir / 'tracking' / 'events.log')
+        self.job_id_log_lines = 0
+        self.job_id_log_offset = 0
+        self.job_id_log_inode = None
         
         # Create tracking directory
         tracking_dir = base_dir / 'tracking'
         tracking_dir.mkdir(parents=True, exist_ok=True)
         
-        # Initialize tracking file
-        if not self.tracking_file.exists():
-            with open(self.tracking_file, 'w', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow([
-                    'job_id', 
-                    'title', 
-                    'company', 
-                    'location',
-                    'applied_date', 
-                    'resume_file', 
-                    'cover_letter_file',
-                    'status',
-                    'notes'
-                ])
-        
-        # Initialize stats file
+        # All writers (other bot processes, main.py commands) serialize through this lock
+        self.lock = FileLock(tracking_dir / 'tracker.lock')
+        
+        with self.lock:
+            # Initialize tracking file
+            if not self.tracking_file.exists():
+                with open(self.tracking_file, 'w', newline='') as f:
+                    writer = csv.writer(f)
+                    writer.writerow(CSV_COLUMNS)
+            
+            # Statistics are a projection of the event log, caught up at load time;
+            # new events are buffered in memory and flushed in batches
+            self.pending_events = []
+            self.last_stats_flush = time.monotonic()
+            
+            self._load_job_ids()
+            self._load_projection()
+            self._ensure_rollups()
+        
+        atexit.register(self.flush)
+    
+    def _load_statistics(self) -> Optional[Dict]:
+        """Read the statistics projection, or None if it is missing or unreadable"""
         if not self.stats_file.exists():
-            stats = {
-                'total_jobs_found': 0,
-                'total_applications': 0,
-                'successful_applications': 0,
-                'failed_applications': 0,
-                'skipped_applications': 0,
-                'daily_stats': {},
-                'last_updated': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            }
-            with open(self.stats_file, 'w') as f:
-                json.dump(stats, f, indent=2)
+            return None
+        try:
+            with open(self.stats_file, 'r') as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"Error loading statistics, replaying the event log: {str(e)}")
+            return None
+    
+    def _write_statistics(self, stats: Dict) -> None:
+        """Atomically replace statistics.json"""
+        stats['last_updated'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        temp_file = self.stats_file.with_suffix('.tmp')
+        with open(temp_file, 'w') as f:
+            json.dump(stats, f, indent=2)
+        os.replace(temp_file, self.stats_file)
+    
+    def _catch_up(self, stats: Dict) -> bool:
+        """Apply events appended since the projection's offset; True if any were applied"""
+        applied = False
+        for event, offset in self.events.read_from(stats.get('events_offset', 0)):
+            apply_event(stats, event)
+            stats['events_offset'] = offset
+            applied = True
+        return applied
+    
+    def _load_projection(self) -> None:
+        """Load statistics.json and bring it up to date with the event log; call with the lock held"""
+        stats = self._load_statistics()
+        
+        if not self.events.exists():
+            # Seed the log with the aggregates that predate it so replays start from them;
+            # installs without statistics.json get them recomputed from the tracked rows
+            baseline = stats or self._statistics_from_rows()
+            baseline.pop('events_offset', None)
+            self.events.append([{'ts': datetime.now().strftime("%Y-%m-%d %H:%M:%S"), 'type': BASELINE, 'stats': baseline}])
+            stats = None
+        
+        if stats is None:
+            stats = empty_statistics()
+        
+        if self._catch_up(stats) or not self.stats_file.exists():
+            self._write_statistics(stats)
+        self.stats = stats
+    
+    def _statistics_from_rows(self) -> Dict:
+        """Recompute the statistics projection from every tracked row
+        
+        Each row counts as a found job plus its outcome, dated by applied_date.
+        """
+        stats = empty_statistics()
+        rows = 0
+        for row in self._iter_rows():
+            if not row.get('job_id'):
+                continue
+            ts = row.get('applied_date', '')
+            status = row.get('status', '')
+            apply_event(stats, {'ts': ts, 'type': FOUND})
+            apply_event(stats, {
+                'ts': ts,
+                'type': STATUS_EVENTS.get(status, APPLIED),
+                'status': status,
+                'title': row.get('title', ''),
+                'company': row.get('company', ''),
+                'reason': row.get('notes', '')
+            })
+            rows += 1
+        if rows:
+            print(f"Rebuilt statistics from {rows} tracked applications")
+        return stats
+    
+    def flush_statistics(self) -> None:
+        """Append buffered events to the log and update statistics.json from it
+        
+        The projection is caught up from its stored offset, so events written
+        by other processes are included and nothing is counted twice.
+        """
+        with self.lock:
+            try:
+                if self.pending_events:
+                    self.events.append(self.pending_events)
+                    self.pending_events = []
                 
+                stats = self._load_statistics() or empty_statistics()
+                self._catch_up(stats)
+                self._write_statistics(stats)
+                self.stats = stats
+                self.last_stats_flush = time.monotonic()
+            except Exception as e:
+                print(f"Error saving statistics: {str(e)}")
+    
+    def rebuild_projections(self) -> None:
+        """Rebuild statistics.json and the job ID index by replaying the whole event log"""
+        with self.lock:
+            self.flush_statistics()
+            
+            stats = empty_statistics()
+            self._catch_up(stats)
+            self._write_statistics(stats)
+            self.stats = stats
+            
+            self._rebuild_job_ids_cache()
+            self._save_job_ids_state()
+            print(f"Rebuilt statistics and {len(self.applied_job_ids)} job IDs from {self.events.log_file.name}")
+    
+    def record_event(self, event_type: str, job_details: Optional[Dict] = None, **fields) -> None:
+        """Record a lifecycle event and apply it to the in-memory statistics"""
+        event = {'ts': datetime.now().strftime("%Y-%m-%d %H:%M:%S"), 'type': event_type}
+        if job_details:
+            event['job_id'] = job_details.get('job_id', '')
+            event['title'] = job_details.get('title', '')
+            event['company'] = job_details.get('company', '')
+            event['location'] = job_details.get('location', '')
+        event.update(fields)
+        
+        apply_event(self.stats, event)
+        self.pending_events.append(event)
+        if (len(self.pending_events) >= self.STATS_FLUSH_EVERY
+                or time.monotonic() - self.last_stats_flush >= self.STATS_FLUSH_INTERVAL):
+            self.flush_statistics()
+    
+    def _ensure_rollups(self) -> None:
+        """Backfill the per-title and per-company rollups once for histories that predate them"""
+        if self.stats.get('title_stats'):
+            return
+        # The counters can be zero when the log was seeded without statistics.json
+        if not self.stats.get('total_applications') and next(self._iter_rows(), None) is None:
+            return
+        self._rebuild_rollups()
+    
+    def _rebuild_rollups(self) -> None:
+        """Recompute the per-title and per-company rollups from every tracked row"""
+        with self.lock:
+            title_stats = {}
+            company_stats = {}
+            for row in self._iter_rows():
+                counts = title_stats.setdefault(row.get('title', ''), {})
+                counts['total'] = counts.get('total', 0) + 1
+                if row.get('status') in STATUS_COUNTERS:
+                    counts[row['status']] = counts.get(row['status'], 0) + 1
+                company = row.get('company', '')
+                company_stats[company] = company_stats.get(company, 0) + 1
+            
+            self.record_event(ROLLUP_SNAPSHOT, title_stats=title_stats, company_stats=company_stats)
+            self.flush_statistics()
+    
+    def _iter_rows(self) -> Iterator[Dict]:
+        """Stream every tracked application row as a dict, archived segments first"""
+        for segment in self._archive_segments():
+            with gzip.open(segment, 'rt', newline='', encoding='utf-8') as f:
+                for row in csv.DictReader(f):
+                    yield row
+        
+        if not self.tracking_file.exists():
+            return
+        with open(self.tracking_file, 'r', newline='') as f:
+            for row in csv.DictReader(f):
+                yield row
+    
+    def flush(self) -> None:
+        """Persist everything kept in memory (buffered events and the job ID cache state)"""
+        self.flush_statistics()
+        self._save_job_ids_state()
+    
+    def _load_job_ids(self):
+        """Load the applied job IDs used for duplicate detection"""
         # Initialize or load job IDs cache
         self.applied_job_ids = set()
         if self.job_ids_file.exists():
+            self._refresh_job_ids()
+        elif self.legacy_job_ids_file.exists():
+            # One-time migration from the old JSON cache
             try:
-                with open(self.job_ids_file, 'r') as f:
+                with open(self.legacy_job_ids_file, 'r') as f:
                     self.applied_job_ids = set(json.load(f))
+                self._compact_job_id_log()
             except Exception as e:
                 print(f"Error loading job IDs cache: {str(e)}")
         
-        # If cache doesn't exist, build it from tracking file
-        if not self.applied_job_ids and self.tracking_file.exists():
+        # Validate the cache against the tracking file so that it can answer
+        # "not applied" on its own, without scanning the CSV
+        self._sync_job_ids_with_tracking_file()
+    
+    def _sync_job_ids_with_tracking_file(self):
+        """Bring the job ID cache up to date with applications.csv
+        
+        job_ids.state.json records the CSV size and mtime the cache was last in
+        sync with. A matching CSV needs no work, a CSV that only grew is read
+        from the recorded offset, and anything else triggers a full rebuild.
+        """
+        if not self.tracking_file.exists():
+            return
+        
+        state = {}
+        if self.job_ids_state_file.exists():
+            try:
+                with open(self.job_ids_state_file, 'r') as f:
+                    state = json.load(f)
+            except Exception as e:
+                print(f"Error loading job IDs cache state: {str(e)}")
+        
+        csv_stat = self.tracking_file.stat()
+        recorded_size = state.get('csv_size', -1)
+        if recorded_size == csv_stat.st_size and state.get('csv_mtime') == csv_stat.st_mtime:
+            return
+        
+        if 0 < recorded_size < csv_stat.st_size and self.job_ids_file.exists():
+            try:
+                with open(self.tracking_file, 'r', newline='') as f:
+                    f.seek(recorded_size)
+                    added = 0
+                    for row in csv.reader(f):
+                        if row and row[0] and row[0] not in self.applied_job_ids:
+                            self._remember_job_id(row[0])
+                            added += 1
+                print(f"Caught up job IDs cache with {added} entries from {self.tracking_file.name}")
+            except Exception as e:
+                print(f"Error catching up job IDs cache, rebuilding: {str(e)}")
+                self._rebuild_job_ids_cache()
+        else:
             self._rebuild_job_ids_cache()
+        
+        self._save_job_ids_state()
+    
+    def _save_job_ids_state(self) -> None:
+        """Record the CSV size and mtime that the job ID cache now reflects"""
+        with self.lock:
+            if not self.tracking_file.exists():
+                return
+            
+            # Pick up IDs other processes logged for rows they appended
+            self._refresh_job_ids()
+            csv_stat = self.tracking_file.stat()
+            state = {'csv_size': csv_stat.st_size, 'csv_mtime': csv_stat.st_mtime}
+            temp_file = self.job_ids_state_file.with_suffix('.tmp')
+            try:
+                with open(temp_file, 'w') as f:
+                    json.dump(state, f)
+                os.replace(temp_file, self.job_ids_state_file)
+            except Exception as e:
+                print(f"Error saving job IDs cache state: {str(e)}")
+    
+    def _job_id_log_changed(self) -> bool:
+        """Cheap check for appends or compactions of the job ID log by another process"""
+        try:
+            log_stat = self.job_ids_file.stat()
+        except FileNotFoundError:
+            return False
+        return log_stat.st_ino != self.job_id_log_inode or log_stat.st_size != self.job_id_log_offset
+    
+    def _refresh_job_ids(self):
+        """Read job IDs appended to the log since the last read; call with the lock held
+        
+        A compacted (replaced) log is re-read from the start into an empty cache.
+        A partial last line can only be left by a crash, since writers hold the
+        lock, and is dropped.
+        """
+        try:
+            log_stat = self.job_ids_file.stat()
+        except FileNotFoundError:
+            return
+        
+        if log_stat.st_ino != self.job_id_log_inode or log_stat.st_size < self.job_id_log_offset:
+            # A compacted log holds every live ID and none that were released
+            self.applied_job_ids = set()
+            self.job_id_log_inode = log_stat.st_ino
+            self.job_id_log_offset = 0
+            self.job_id_log_lines = 0
+        
+        partial_tail = False
+        try:
+            with open(self.job_ids_file, 'rb') as f:
+                f.seek(self.job_id_log_offset)
+                for line in f:
+                    if not line.endswith(b'\n'):
+                        partial_tail = True
+                        break
+                    self.job_id_log_offset += len(line)
+                    self.job_id_log_lines += 1
+                    job_id = line.decode('utf-8').strip()
+                    if job_id.startswith(self.RELEASE_MARKER):
+                        self.applied_job_ids.discard(job_id[len(self.RELEASE_MARKER):])
+                    elif job_id:
+                        self.applied_job_ids.add(job_id)
+        except Exception as e:
+            print(f"Error loading job IDs cache: {str(e)}")
+        
+        # Drop the torn line so the next append starts on a fresh line
+        if partial_tail:
+            self._compact_job_id_log()
+    
+    def _compact_job_id_log(self):
+        """Atomically rewrite the job ID log with one line per unique ID"""
+        with self.lock:
+            temp_file = self.job_ids_file.with_suffix('.tmp')
+            try:
+                with open(temp_file, 'wb') as f:
+                    for job_id in self.applied_job_ids:
+                        f.write(job_id.encode('utf-8') + b'\n')
+                os.replace(temp_file, self.job_ids_file)
+                log_stat = self.job_ids_file.stat()
+                self.job_id_log_inode = log_stat.st_ino
+                self.job_id_log_offset = log_stat.st_size
+                self.job_id_log_lines = len(self.applied_job_ids)
+            except Exception as e:
+                print(f"Error compacting job IDs cache: {str(e)}")
+    
+    def _claimed_job_ids(self) -> Set[str]:
+        """Job IDs reserved in the event log and not released since
+        
+        Only events that the live claim path also records reserve a job ID;
+        a job that was merely found must stay eligible.
+        """
+        claiming_events = {CLAIMED, *STATUS_EVENTS.values()}
+        claimed = set()
+        events = [event for event, _ in self.events.read_from(0)] + self.pending_events
+        for event in events:
+            job_id = event.get('job_id')
+            if not job_id:
+                continue
+            if event.get('type') in claiming_events:
+                claimed.add(job_id)
+            elif event.get('type') == RELEASED:
+                claimed.discard(job_id)
+        return claimed
     
     def _rebuild_job_ids_cache(self):
-        """Rebuild the job IDs cache from the tracking file"""
+        """Rebuild the job IDs cache from the tracked rows and the claims still held"""
         try:
-            with open(self.tracking_file, 'r', newline='') as f:
-                reader = csv.reader(f)
-                next(reader)  # Skip header
-                self.applied_job_ids = set()
-                for row in reader:
-                    if row and row[0]:  # job_id is in first column
-                        self.applied_job_ids.add(row[0])
+            self.applied_job_ids = self._claimed_job_ids()
+            for row in self._iter_rows():
+                if row.get('job_id'):
+                    self.applied_job_ids.add(row['job_id'])
             
             # Save the rebuilt cache
-            with open(self.job_ids_file, 'w') as f:
-                json.dump(list(self.applied_job_ids), f)
+            self._compact_job_id_log()
                 
             print(f"Rebuilt job IDs cache with {len(self.applied_job_ids)} entries")
         except Exception as e:
@@ -85,10 +443,10 @@ class ApplicationTracker:
         """Add a new application to the tracking file with enhanced caching"""
         job_id = job_details.get('job_id', '')
         
-        # Add to tracking file
-        with open(self.tracking_file, 'a', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow([
+        # Row and job ID are written under one lock so other processes never see one without the other
+        with self.lock:
+            # Add to tracking storage
+            self._append_row([
                 job_id,
                 job_details.get('title', ''),
                 job_details.get('company', ''),
@@ -99,77 +457,145 @@ class ApplicationTracker:
                 status,
                 notes
             ])
+            
+            # Update job IDs cache
+            if job_id:
+                self._remember_job_id(job_id)
         
-        # Update job IDs cache
-        if job_id:
+        # Update statistics
+        self._update_statistics(status, job_details, notes)
+    
+    def _append_row(self, row: List[str]) -> None:
+        """Append one application row (in CSV_COLUMNS order) to the tracking file"""
+        with self.lock:
+            with open(self.tracking_file, 'a', newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(row)
+    
+    def _remember_job_id(self, job_id: str) -> bool:
+        """Add a job ID to the cache and the job ID log; False if any process already recorded it"""
+        with self.lock:
+            self._refresh_job_ids()
+            if job_id in self.applied_job_ids:
+                return False
+            
             self.applied_job_ids.add(job_id)
+            self._append_job_id_line(job_id)
+            return True
+    
+    def _append_job_id_line(self, line: str) -> None:
+        """Append one line to the job ID log, compacting it once it grows too long"""
+        with self.lock:
             try:
-                with open(self.job_ids_file, 'w') as f:
-                    json.dump(list(self.applied_job_ids), f)
+                with open(self.job_ids_file, 'ab') as f:
+                    f.write(line.encode('utf-8') + b'\n')
+                    self.job_id_log_offset = f.tell()
+                self.job_id_log_inode = self.job_ids_file.stat().st_ino
+                self.job_id_log_lines += 1
             except Exception as e:
                 print(f"Error updating job IDs cache: {str(e)}")
+            
+            if self.job_id_log_lines > self.JOB_ID_LOG_COMPACT_RATIO * max(1, len(self.applied_job_ids)):
+                self._compact_job_id_log()
+    
+    def claim_job_id(self, job_id: str) -> bool:
+        """Atomically reserve a job ID before applying
         
-        # Update statistics
-        self._update_statistics(status)
+        Returns True for exactly one caller across all processes sharing the
+        tracking directory; everyone else gets False and must skip the job.
+        """
+        if not job_id:
+            return True
+        claimed = self._remember_job_id(job_id)
+        if claimed:
+            self.record_event(CLAIMED, job_id=job_id)
+        return claimed
+    
+    def release_job_id(self, job_id: str) -> None:
+        """Give up a claim whose application ended without a recorded outcome
+        
+        A claim holds until it is released or an outcome row is added for the
+        job; released jobs become eligible again in every process, and stay so
+        when the job ID index is rebuilt from the event log.
+        """
+        if not job_id:
+            return
+        with self.lock:
+            self._refresh_job_ids()
+            if job_id not in self.applied_job_ids:
+                return
+            self.applied_job_ids.discard(job_id)
+            self._append_job_id_line(self.RELEASE_MARKER + job_id)
+            self.record_event(RELEASED, job_id=job_id)
+            # Other processes rebuilding the index must see the release
+            self.flush_statistics()
+    
+    def get_job_id_count(self) -> int:
+        """Number of distinct job IDs in the tracker"""
+        return len(self.applied_job_ids)
     
     def is_job_applied(self, job_id: str) -> bool:
-        """Check if a job has already been applied to using optimized cache"""
+        """Check if a job has already been applied to with a single set lookup"""
         if not job_id:
             return False
             
-        # First check the cached set for performance
-        if job_id in self.applied_job_ids:
-            return True
-            
-        # Fall back to CSV check if needed
-        if self.tracking_file.exists():
-            with open(self.tracking_file, 'r', newline='') as f:
-                reader = csv.reader(f)
-                next(reader)  # Skip header
-                for row in reader:
-                    if row and row[0] == job_id:
-                        # Update cache for future checks
-                        self.applied_job_ids.add(job_id)
-                        try:
-                            with open(self.job_ids_file, 'w') as f:
-                                json.dump(list(self.applied_job_ids), f)
-                        except:
-                            pass
-                        return True
-                        
-        return False
+        # The cache was validated against the tracking file at load time and
+        # every new application or released claim goes through the shared job
+        # ID log, so the cache is authoritative once the log is known to be unchanged
+        if self._job_id_log_changed():
+            with self.lock:
+                self._refresh_job_ids()
+        return job_id in self.applied_job_ids
     
     def get_application_stats(self) -> Dict:
         """Get application statistics"""
-        if self.stats_file.exists():
-            with open(self.stats_file, 'r') as f:
-                return json.load(f)
-        return {}
+        return copy.deepcopy(self.stats)
     
     def get_recent_applications(self, limit: int = 10) -> List[Dict]:
-        """Get the most recent applications"""
-        applications = []
-        if not self.tracking_file.exists():
-            return applications
-            
-        with open(self.tracking_file, 'r', newline='') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                applications.append(dict(row))
-                if len(applications) >= limit:
-                    break
-        
+        """Get the most recent applications, newest first, reading archived segments only if needed"""
+        applications = self._read_recent_rows(limit)
+        for segment in reversed(self._archive_segments()):
+            if len(applications) >= limit:
+                break
+            rows = self._read_segment(segment)[1:]
+            missing = limit - len(applications)
+            applications.extend(dict(zip(CSV_COLUMNS, row)) for row in reversed(rows[-missing:]))
         return applications
     
+    def _read_recent_rows(self, limit: int) -> List[Dict]:
+        """Newest rows of the live tracking file, found by reading it backwards in blocks"""
+        if limit <= 0 or not self.tracking_file.exists():
+            return []
+        
+        block_size = 8192
+        with open(self.tracking_file, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            position = f.tell()
+            data = b''
+            # One extra line, since the first line of a block may be cut off
+            while position > 0 and data.count(b'\n') <= limit + 1:
+                read_size = min(block_size, position)
+                position -= read_size
+                f.seek(position)
+                data = f.read(read_size) + data
+        
+        lines = data.decode(locale.getpreferredencoding(False), errors='replace').splitlines()
+        if position > 0:
+            lines = lines[1:]
+        rows = [row for row in csv.reader(lines) if row]
+        if position == 0 and rows:
+            rows = rows[1:]  # Skip header
+        
+        return [dict(zip(CSV_COLUMNS, row)) for row in reversed(rows[-limit:])]
+    
     def get_daily_stats(self, date: Optional[str] = None) -> Dict:
         """Get stats for a specific day (YYYY-MM-DD format)"""
         if date is None:
             date = datetime.now().strftime("%Y-%m-%d")
             
-        stats = self.get_application_stats()
-        daily_stats = stats.get('daily_stats', {})
+        daily_stats = self.stats.get('daily_stats', {})
         
-        return daily_stats.get(date, {
+        return dict(daily_stats.get(date) or {
             'jobs_found': 0,
             'applications': 0,
             'successful': 0,
@@ -177,125 +603,21 @@ class ApplicationTracker:
             'skipped': 0
         })
     
-    def _update_statistics(self, status: str) -> None:
-        """Update the statistics file with new application data"""
-        today = datetime.now().strftime("%Y-%m-%d")
-        
-        if self.stats_file.exists():
-            with open(self.stats_file, 'r') as f:
-                stats = json.load(f)
-        else:
-            stats = {
-                'total_jobs_found': 0,
-                'total_applications': 0,
-                'successful_applications': 0,
-                'failed_applications': 0,
-                'skipped_applications': 0,
-                'daily_stats': {},
-                'last_updated': ''
-            }
-        
-        # Update total counts
-        stats['total_applications'] += 1
-        
-        if status == 'success':
-            stats['successful_applications'] += 1
-        elif status == 'failed':
-            stats['failed_applications'] += 1
-        elif status == 'skipped':
-            stats['skipped_applications'] += 1
-        
-        # Update daily stats
-        if today not in stats['daily_stats']:
-            stats['daily_stats'][today] = {
-                'jobs_found': 0,
-                'applications': 0,
-                'successful': 0,
-                'failed': 0,
-                'skipped': 0
-            }
-        
-        stats['daily_stats'][today]['applications'] += 1
-        
-        if status == 'success':
-            stats['daily_stats'][today]['successful'] += 1
-        elif status == 'failed':
-            stats['daily_stats'][today]['failed'] += 1
-        elif status == 'skipped':
-            stats['daily_stats'][today]['skipped'] += 1
-        
-        stats['last_updated'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        
-        with open(self.stats_file, 'w') as f:
-            json.dump(stats, f, indent=2)
+    def _update_statistics(self, status: str, job_details: Dict, notes: str = '') -> None:
+        """Record the application outcome as a lifecycle event"""
+        event_type = STATUS_EVENTS.get(status, APPLIED)
+        self.record_event(event_type, job_details, status=status, reason=notes)
     
-    def increment_jobs_found(self) -> None:
+    def increment_jobs_found(self, job_id: str = '') -> None:
         """Increment the count of jobs found"""
-        today = datetime.now().strftime("%Y-%m-%d")
-        
-        if self.stats_file.exists():
-            with open(self.stats_file, 'r') as f:
-                stats = json.load(f)
-        else:
-            stats = {
-                'total_jobs_found': 0,
-                'total_applications': 0,
-                'successful_applications': 0,
-                'failed_applications': 0,
-                'skipped_applications': 0,
-                'daily_stats': {},
-                'last_updated': ''
-            }
-        
-        # Update total jobs found
-        stats['total_jobs_found'] += 1
-        
-        # Update daily stats
-        if today not in stats['daily_stats']:
-            stats['daily_stats'][today] = {
-                'jobs_found': 0,
-                'applications': 0,
-                'successful': 0,
-                'failed': 0,
-                'skipped': 0
-            }
-        
-        stats['daily_stats'][today]['jobs_found'] += 1
-        stats['last_updated'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        
-        with open(self.stats_file, 'w') as f:
-            json.dump(stats, f, indent=2)
+        self.record_event(FOUND, job_id=job_id)
     
     def generate_report(self, output_path: Optional[str] = None) -> str:
         """Generate a detailed report of application activities"""
         stats = self.get_application_stats()
         today_stats = self.get_daily_stats()
         
-        # Calculate job titles applied to
-        job_titles = {}
-        companies = {}
-        
-        with open(self.tracking_file, 'r', newline='') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                title = row.get('title', 'Unknown')
-                company = row.get('company', 'Unknown')
-                status = row.get('status', '')
-                
-                if title not in job_titles:
-                    job_titles[title] = {'total': 0, 'success': 0, 'failed': 0, 'skipped': 0}
-                
-                job_titles[title]['total'] += 1
-                if status == 'success':
-                    job_titles[title]['success'] += 1
-                elif status == 'failed':
-                    job_titles[title]['failed'] += 1
-                elif status == 'skipped':
-                    job_titles[title]['skipped'] += 1
-                    
-                if company not in companies:
-                    companies[company] = 0
-                companies[company] += 1
+        job_titles, companies = self._get_title_and_company_counts()
         
         # Sort titles by total applications
         sorted_titles = sorted(job_titles.items(), key=lambda x: x[1]['total'], reverse=True)
@@ -364,10 +686,23 @@ class ApplicationTracker:
         
         return report_text
         
+    def _get_title_and_company_counts(self) -> Tuple[Dict, Dict]:
+        """Per-title status counts and per-company application counts from the rollups"""
+        job_titles = {
+            title: {
+                'total': counts.get('total', 0),
+                'success': counts.get('success', 0),
+                'failed': counts.get('failed', 0),
+                'skipped': counts.get('skipped', 0)
+            }
+            for title, counts in self.stats.get('title_stats', {}).items()
+        }
+        companies = dict(self.stats.get('company_stats', {}))
+        return job_titles, companies
+    
     def _get_weekly_stats(self) -> Dict:
         """Calculate statistics for the past 7 days"""
-        stats = self.get_application_stats()
-        daily_stats = stats.get('daily_stats', {})
+        daily_stats = self.stats.get('daily_stats', {})
         
         weekly_stats = {
             'jobs_found': 0,
@@ -393,42 +728,103 @@ class ApplicationTracker:
         
         return weekly_stats
         
-    def clean_duplicates(self) -> int:
-        """Clean duplicate entries from tracking file"""
-        if not self.tracking_file.exists():
-            return 0
-            
-        # Read all entries
-        entries = []
-        seen_job_ids = set()
-        duplicates = 0
+    def _archive_segments(self) -> List[Path]:
+        """Compressed monthly archive segments, oldest first"""
+        if not self.archive_dir.exists():
+            return []
+        return sorted(self.archive_dir.glob('applications-*.csv.gz'))
+    
+    @staticmethod
+    def _read_segment(segment: Path) -> List[List[str]]:
+        """All rows of an archive segment, header included"""
+        with gzip.open(segment, 'rt', newline='', encoding='utf-8') as f:
+            return [row for row in csv.reader(f) if row]
+    
+    def _write_segment(self, month: str, header: List[str], rows: List[List[str]]) -> int:
+        """Merge rows into a month's archive segment and swap it in atomically
         
-        with open(self.tracking_file, 'r', newline='') as f:
-            reader = csv.reader(f)
-            header = next(reader)
+        Rows already in the segment are skipped, so re-archiving after an
+        interrupted compaction does not duplicate them.
+        """
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        segment = self.archive_dir / f'applications-{month}.csv.gz'
+        
+        existing = self._read_segment(segment)[1:] if segment.exists() else []
+        known = {(row[0], row[4] if len(row) > 4 else '') for row in existing}
+        new_rows = [row for row in rows if (row[0], row[4]) not in known]
+        
+        temp_file = segment.with_suffix('.tmp')
+        with gzip.open(temp_file, 'wt', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(header)
+            writer.writerows(existing)
+            writer.writerows(new_rows)
+        os.replace(temp_file, segment)
+        return len(new_rows)
+    
+    def compact(self, archive_after_days: Optional[int] = None) -> Dict:
+        """Deduplicate the live tracking file and archive old rows into monthly segments
+        
+        Rows applied more than archive_after_days ago move to
+        tracking/archive/applications-YYYY-MM.csv.gz. Segments are written
+        before the live file is swapped, and every file is replaced
+        atomically, so an interrupted run loses nothing. Archived job IDs
+        stay in the job ID cache and reports read across all segments.
+        """
+        result = {'duplicates': 0, 'archived': 0, 'live': 0}
+        with self.lock:
+            if not self.tracking_file.exists():
+                return result
+            
+            cutoff = None
+            if archive_after_days is not None:
+                cutoff = (datetime.now() - timedelta(days=archive_after_days)).strftime("%Y-%m-%d")
             
-            for row in reader:
-                if not row or not row[0]:  # Skip empty rows
-                    continue
+            live_rows = []
+            archive_rows = {}
+            seen_job_ids = set()
+            with open(self.tracking_file, 'r', newline='') as f:
+                reader = csv.reader(f)
+                header = next(reader, CSV_COLUMNS)
+                
+                for row in reader:
+                    if not row or not row[0]:  # Skip empty rows
+                        continue
                     
-                job_id = row[0]
-                if job_id in seen_job_ids:
-                    duplicates += 1
-                    continue
+                    job_id = row[0]
+                    if job_id in seen_job_ids:
+                        result['duplicates'] += 1
+                        continue
+                    seen_job_ids.add(job_id)
                     
-                seen_job_ids.add(job_id)
-                entries.append(row)
-        
-        # Write back without duplicates
-        if duplicates > 0:
-            with open(self.tracking_file, 'w', newline='') as f:
+                    applied_date = row[4] if len(row) > 4 else ''
+                    if cutoff and len(applied_date) >= 10 and applied_date[:10] < cutoff:
+                        archive_rows.setdefault(applied_date[:7], []).append(row)
+                    else:
+                        live_rows.append(row)
+            
+            result['live'] = len(live_rows)
+            if not result['duplicates'] and not archive_rows:
+                return result
+            
+            for month, rows in sorted(archive_rows.items()):
+                self._write_segment(month, header, rows)
+                result['archived'] += len(rows)
+            
+            temp_file = self.tracking_file.with_suffix('.tmp')
+            with open(temp_file, 'w', newline='') as f:
                 writer = csv.writer(f)
                 writer.writerow(header)
-                writer.writerows(entries)
+                writer.writerows(live_rows)
+            os.replace(temp_file, self.tracking_file)
             
-            # Update job IDs cache
-            self.applied_job_ids = seen_job_ids
-            with open(self.job_ids_file, 'w') as f:
-                json.dump(list(self.applied_job_ids), f)
+            # Rebuild the indexes that depend on the live file
+            if result['duplicates']:
+                self._rebuild_rollups()
+            self._save_job_ids_state()
         
-        return duplicates
\ No newline at end of file
+        return result
+    
+    def clean_duplicates(self) -> int:
+        """Clean duplicate entries from tracking file"""
+        return self.compact()['duplicates']
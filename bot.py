@@ -4,6 +4,7 @@ import time
 import random
 import logging
 import hashlib
+import threading
 from pathlib import Path
 from typing import Dict, Optional, Tuple, List, Set
 from urllib.parse import quote
@@ -25,6 +26,19 @@ from config import (
     MAX_RETRIES, 
     JOB_TITLES,
     DICE_SEARCH_URL,
+    HTTP_SEARCH_MODE,
+    MAX_PAGES_PER_TITLE,
+    PAGES_PER_CYCLE,
+    SCHEDULER_EXPLORATION,
+    MAX_CYCLES,
+    PROMPT_BETWEEN_CYCLES,
+    IDLE_CYCLE_WAIT,
+    SEEN_JOBS_USE_BLOOM,
+    NEAR_DUPLICATE_THRESHOLD,
+    BROWSER_PROFILE_DIR,
+    SESSION_MAX_AGE_HOURS,
+    TRACKER_BACKEND,
+    TRACKER_MIRROR_CSV,
     JOBS_DIR,
     RESUME_DIR,
     DATA_DIR,
@@ -32,18 +46,41 @@ from config import (
 )
 from resume_handler import ResumeHandler
 from gemini_service import GeminiService
-from application_tracker import ApplicationTracker
+from application_tracker import create_tracker
+from tracker_events import RESUME_GENERATED
+from dice_search_client import DiceSearchClient
+from crawl_state import CrawlStateStore
+from title_scheduler import TitleScheduler
+from seen_jobs import SeenJobStore
+from near_duplicates import NearDuplicateIndex, stable_card_hash
+from browser_session import BrowserSessionStore, acquire_profile_dir
 
 class DiceBot:
     """Improved automated job application bot for Dice.com"""
     
-    def __init__(self):
+    def __init__(self, prewarm_driver: bool = False):
         self.setup_logging()
-        self.resume_handler = ResumeHandler()
-        self.gemini = GeminiService()
-        self.tracker = ApplicationTracker(DATA_DIR)
         self.driver = None
         self.wait = None
+        # Held for the life of the process (released by the OS on exit)
+        self.profile_dir = None
+        self.profile_lock = None
+        
+        # Serializes Chrome startup so a warm-up and a direct setup_driver() share one driver
+        self._driver_lock = threading.Lock()
+        self._driver_thread = None
+        if prewarm_driver:
+            # Start Chrome in the background while the services below initialize
+            self._driver_thread = threading.Thread(target=self.setup_driver, daemon=True)
+            self._driver_thread.start()
+        
+        self.resume_handler = ResumeHandler()
+        self.gemini = GeminiService()
+        self.tracker = create_tracker(DATA_DIR, TRACKER_BACKEND, TRACKER_MIRROR_CSV)
+        self.session_store = BrowserSessionStore(
+            DATA_DIR / 'tracking' / 'dice_session.json',
+            max_age_hours=SESSION_MAX_AGE_HOURS
+        )
         self.jobs_processed = 0
         self.jobs_applied = 0
         self.jobs_skipped = 0
@@ -51,9 +88,35 @@ class DiceBot:
         # Keep track of processed job IDs to avoid duplicates
         self.processed_job_ids = set()
         
+        # Job IDs already evaluated on a search page, in this or earlier runs
+        self.seen_jobs = SeenJobStore(
+            DATA_DIR / 'tracking' / 'seen_job_ids.txt',
+            use_bloom=SEEN_JOBS_USE_BLOOM
+        )
+        # Reposts of jobs already applied to, matched on normalized fields and description
+        self.near_duplicates = NearDuplicateIndex(
+            DATA_DIR / 'tracking' / 'near_duplicates.jsonl',
+            threshold=NEAR_DUPLICATE_THRESHOLD
+        )
+        self.jobs_duplicates = 0
+        
         # Track processed job titles and pages
         self.processed_titles = {}  # Format: {title: last_page_processed}
         
+        # HTTP client for browserless search result discovery
+        self.search_client = None
+        
+        # Job IDs seen on the page currently being processed (first one is the newest)
+        self.page_job_ids = []
+        
+        # Per-page counts fed to the title scheduler
+        self.page_stats = self._empty_page_stats()
+        
+    @staticmethod
+    def _empty_page_stats() -> Dict:
+        """Counters for one search results page"""
+        return {'cards': 0, 'new': 0, 'easy_apply': 0, 'duplicates': 0}
+        
     def setup_logging(self):
         """Configure logging"""
         self.logger = logging.getLogger(__name__)
@@ -80,7 +143,22 @@ class DiceBot:
             ch.setFormatter(formatter)
             self.logger.addHandler(ch)
 
+    def wait_for_driver(self) -> bool:
+        """Wait for the pre-warmed driver, or start one now if there was no warm-up or it failed"""
+        if self._driver_thread is not None:
+            self._driver_thread.join()
+            if self.driver is None:
+                self.logger.warning("Pre-warmed Chrome is not available, starting a new one")
+        return self.setup_driver()
+    
     def setup_driver(self) -> bool:
+        """Start Chrome once; later calls reuse the running driver"""
+        with self._driver_lock:
+            if self.driver is not None:
+                return True
+            return self._start_driver()
+    
+    def _start_driver(self) -> bool:
         """Chrome WebDriver initialization with configurable headless mode"""
         try:
             from config import HEADLESS_MODE
@@ -90,6 +168,18 @@ class DiceBot:
             
             options = Options()
             
+            # A persistent profile keeps the Dice login between runs; parallel
+            # bot processes each lock their own profile directory
+            profile_dir = None
+            if BROWSER_PROFILE_DIR:
+                if self.profile_lock is None:
+                    self.profile_dir, self.profile_lock = acquire_profile_dir(Path(BROWSER_PROFILE_DIR))
+                profile_dir = self.profile_dir
+                if profile_dir:
+                    options.add_argument(f'--user-data-dir={profile_dir.resolve()}')
+                else:
+                    self.logger.warning("All browser profiles are in use, starting with a fresh profile")
+            
             if HEADLESS_MODE:
                 options.add_argument('--headless')
                 options.add_argument('--window-size=1920,1080')
@@ -104,19 +194,48 @@ class DiceBot:
             options.add_experimental_option("excludeSwitches", ["enable-automation"])
             options.add_experimental_option('useAutomationExtension', False)
             
-            self.driver = webdriver.Chrome(options=options)
+            # Use a local chromedriver when present to skip driver resolution on every start
+            if CHROMEDRIVER_PATH and os.path.exists(CHROMEDRIVER_PATH):
+                self.driver = webdriver.Chrome(service=Service(CHROMEDRIVER_PATH), options=options)
+            else:
+                self.driver = webdriver.Chrome(options=options)
             self.wait = WebDriverWait(self.driver, 15)
             
             # Hide the fact that this is automated (helps with detection)
             self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
             
-            self.logger.info("Chrome started successfully with fresh profile")
+            profile_text = f"persistent profile {profile_dir.name}" if profile_dir else "fresh profile"
+            self.logger.info(f"Chrome started successfully with {profile_text}")
             return True
             
         except Exception as e:
             self.logger.error(f"Failed to start Chrome: {str(e)}")
+            if self.driver:
+                # Do not let a half-started driver be reused by the next setup_driver() call
+                try:
+                    self.driver.quit()
+                except Exception:
+                    pass
+                self.driver = None
             return False
 
+    def ensure_logged_in(self) -> bool:
+        """Reuse a saved Dice session when it is still valid, otherwise log in again"""
+        try:
+            # An expired or missing jar also clears the profile's cookies, forcing a login
+            if self.session_store.restore(self.driver) and self.session_store.is_session_valid(self.driver):
+                self.logger.info("Reusing saved Dice session - skipping login")
+                return True
+        except Exception as e:
+            self.logger.warning(f"Could not reuse saved session: {str(e)}")
+        
+        self.session_store.clear()
+        if not self.login_to_dice():
+            return False
+        
+        self.session_store.save(self.driver)
+        return True
+
     def login_to_dice(self) -> bool:
         """Handle the two-step Dice login process"""
         try:
@@ -335,9 +454,9 @@ class DiceBot:
             except NoSuchElementException:
                 pass
             
-            # Method 5: Create a hash from the card text as last resort
-            card_text = card.text
-            job_id = hashlib.md5(card_text.encode()).hexdigest()
+            # Method 5: Create a hash from the card text as last resort,
+            # ignoring relative dates so the ID is stable across visits
+            job_id = stable_card_hash(card.text)
             self.logger.debug(f"Generated hash-based job ID: {job_id}")
             return job_id
             
@@ -345,6 +464,55 @@ class DiceBot:
             self.logger.warning(f"Could not extract job ID from card: {str(e)}")
             return None
     
+    def is_duplicate_job(self, job_id: Optional[str]) -> bool:
+        """Check if a job ID was already seen under any title, without touching the page"""
+        if not job_id:
+            return False
+        return (
+            job_id in self.processed_job_ids
+            or job_id in self.seen_jobs
+            or self.tracker.is_job_applied(job_id)
+        )
+    
+    def claim_job(self, job_details: Dict) -> bool:
+        """Decide whether to apply, before any resume is generated for the job
+        
+        Reposts of jobs already applied to are skipped, then the job ID is
+        claimed so a parallel bot process cannot submit it too.
+        """
+        job_id = job_details.get('job_id', '')
+        duplicate_of = self.near_duplicates.find_duplicate(job_details)
+        if duplicate_of:
+            self.logger.info(f"Skipping near duplicate of job {duplicate_of}: {job_details.get('title')}")
+            self.tracker.add_application(job_details, 'skipped', notes=f"Near duplicate of {duplicate_of}")
+            self.seen_jobs.add(job_id)
+            self.jobs_skipped += 1
+            self.jobs_duplicates += 1
+            return False
+        
+        if not self.tracker.claim_job_id(job_id):
+            self.logger.info(f"Job {job_id} was claimed by another process, skipping")
+            self.jobs_skipped += 1
+            return False
+        
+        return True
+    
+    def apply_to_claimed_job(self, job_details: Dict) -> bool:
+        """Submit a claimed job, releasing the claim if the attempt raises before recording an outcome
+        
+        Only a successful application enters the near-duplicate index, so reposts
+        of a job whose application failed are still tried.
+        """
+        try:
+            applied = self.submit_application(job_details)
+        except BaseException:
+            self.tracker.release_job_id(job_details.get('job_id', ''))
+            raise
+        
+        if applied:
+            self.near_duplicates.add(job_details)
+        return applied
+    
     def check_easy_apply_available(self, card) -> bool:
         """Check if Easy Apply is available with improved detection for new UI"""
         max_retries = MAX_RETRIES.get('status_check', 3)
@@ -783,6 +951,47 @@ class DiceBot:
                 self.logger.error("Timeout waiting for new window")
                 return None
             
+            return self._extract_details_from_open_page(job_details, original_window)
+            
+        except Exception as e:
+            self.logger.error(f"Error extracting job details: {str(e)}")
+            if len(self.driver.window_handles) > 1:
+                self.driver.close()
+                self.driver.switch_to.window(original_window)
+            return None
+    
+    def extract_job_details_from_listing(self, listing: Dict) -> Optional[Tuple[Dict, str]]:
+        """Open a job fetched over HTTP in a new tab and extract its details"""
+        original_window = self.driver.current_window_handle
+        
+        try:
+            job_details = {
+                'job_id': listing.get('job_id'),
+                'title': listing.get('title') or 'Unknown Job',
+                'company': listing.get('company') or 'Unknown Company',
+                'location': listing.get('location') or 'Unknown Location',
+                'url': listing.get('url', '')
+            }
+            
+            if not job_details['url']:
+                self.logger.error(f"No detail URL for job: {job_details['title']}")
+                return None
+            
+            self.driver.switch_to.new_window('tab')
+            self.driver.get(job_details['url'])
+            
+            return self._extract_details_from_open_page(job_details, original_window)
+            
+        except Exception as e:
+            self.logger.error(f"Error extracting job details from listing: {str(e)}")
+            if len(self.driver.window_handles) > 1:
+                self.driver.close()
+                self.driver.switch_to.window(original_window)
+            return None
+    
+    def _extract_details_from_open_page(self, job_details: Dict, original_window: str) -> Optional[Tuple[Dict, str]]:
+        """Verify Easy Apply and extract full details from the job page in the current window"""
+        try:
             # Wait for job details page to load
             time.sleep(5)
             WebDriverWait(self.driver, 15).until(
@@ -796,7 +1005,7 @@ class DiceBot:
                 self.logger.warning(f"Job details page shows already applied or no Easy Apply available: {job_details['title']}")
                 
                 # Create basic job info for tracking
-                job_id = self._extract_job_id_from_url()
+                job_id = self._extract_job_id_from_url() or job_details.get('job_id')
                 job_details['job_id'] = job_id or hashlib.md5(f"{job_details['title']}{job_details['company']}".encode()).hexdigest()
                 
                 # Record this as already applied
@@ -1049,6 +1258,7 @@ class DiceBot:
                 self.logger.error("Failed to generate resume")
                 self.tracker.add_application(job_details, 'failed', notes="Failed to generate resume")
                 return False
+            self.tracker.record_event(RESUME_GENERATED, job_details, resume_file=os.path.basename(resume_path))
                 
             # Generate cover letter
             self.logger.info("Generating cover letter")
@@ -1586,6 +1796,8 @@ class DiceBot:
     def process_search_results(self) -> int:
         """Process all jobs on current page with enhanced debugging for new UI"""
         new_jobs_found = 0
+        self.page_job_ids = []
+        self.page_stats = self._empty_page_stats()
         try:
             self.logger.info("Starting to process search results...")
             
@@ -1666,8 +1878,22 @@ class DiceBot:
                 try:
                     self.logger.info(f"Processing job card {i+1}/{len(job_cards)}")
                     
+                    card_job_id = self.get_job_id_from_card(card)
+                    if card_job_id:
+                        self.page_job_ids.append(card_job_id)
+                    self.page_stats['cards'] += 1
+                    
+                    # Repeats from other titles cost no further WebDriver calls and are not counted as found
+                    if self.is_duplicate_job(card_job_id):
+                        self.logger.info(f"Skipping duplicate job ID {card_job_id}")
+                        self.page_stats['duplicates'] += 1
+                        self.jobs_duplicates += 1
+                        continue
+                    # Persisted as seen only once the job has a final outcome below
+                    self.seen_jobs.visit(card_job_id)
+                    
                     self.jobs_processed += 1
-                    self.tracker.increment_jobs_found()
+                    self.tracker.increment_jobs_found(card_job_id)
                     new_jobs_found += 1
                     
                     # Scroll to the card to ensure it's in view
@@ -1693,8 +1919,11 @@ class DiceBot:
                     # Check if already applied first
                     if self.is_already_applied(card):
                         self.logger.info(f"Skipping already applied job: {job_title}")
+                        self.seen_jobs.add(card_job_id)
+                        self.page_stats['duplicates'] += 1
                         self.jobs_skipped += 1
                         continue
+                    self.page_stats['new'] += 1
                     
                     # Then check if Easy Apply is available
                     if not self.check_easy_apply_available(card):
@@ -1724,11 +1953,13 @@ class DiceBot:
                         self.tracker.add_application(
                             job_info, 'skipped', notes="No Easy Apply available"
                         )
+                        self.seen_jobs.add(card_job_id)
                         
                         self.jobs_skipped += 1
                         continue
                     
                     # Process job with Easy Apply
+                    self.page_stats['easy_apply'] += 1
                     self.logger.info(f"Found Easy Apply job, extracting details: {job_title}")
                     result = self.extract_job_details(card)
                     if not result:
@@ -1738,9 +1969,16 @@ class DiceBot:
                         
                     job_details, original_window = result
                     
+                    if not self.claim_job(job_details):
+                        if len(self.driver.window_handles) > 1:
+                            self.driver.close()
+                            self.driver.switch_to.window(original_window)
+                        continue
+                    
                     # Submit application
                     self.logger.info(f"Submitting application for: {job_details['title']}")
-                    application_result = self.submit_application(job_details)
+                    application_result = self.apply_to_claimed_job(job_details)
+                    self.seen_jobs.add(card_job_id)
                     
                     if application_result:
                         self.logger.info(f"Successfully applied to {job_details['title']}")
@@ -1773,6 +2011,99 @@ class DiceBot:
                 self.driver.switch_to.window(self.driver.window_handles[0])
             return new_jobs_found
 
+    def process_search_results_http(self, title: str, page: int) -> Tuple[int, bool]:
+        """Process a page of jobs fetched over HTTP; only Easy Apply jobs touch the browser"""
+        new_jobs_found = 0
+        self.page_job_ids = []
+        self.page_stats = self._empty_page_stats()
+        
+        result = self.search_client.fetch_page(title, page)
+        if result is None:
+            return new_jobs_found, False
+        
+        listings = result['jobs']
+        self.page_job_ids = [listing['job_id'] for listing in listings]
+        self.logger.info(f"Processing {len(listings)} jobs fetched over HTTP...")
+        
+        for i, listing in enumerate(listings):
+            try:
+                job_id = listing['job_id']
+                job_title = listing.get('title') or 'Unknown'
+                self.logger.info(f"Processing job {i+1}/{len(listings)}: {job_title}")
+                
+                self.page_stats['cards'] += 1
+                
+                # Repeats from other titles are not counted as found
+                if self.is_duplicate_job(job_id):
+                    self.logger.info(f"Skipping duplicate job ID {job_id}")
+                    self.page_stats['duplicates'] += 1
+                    self.jobs_duplicates += 1
+                    continue
+                # Persisted as seen only once the job has a final outcome below
+                self.seen_jobs.visit(job_id)
+                
+                self.jobs_processed += 1
+                self.tracker.increment_jobs_found(job_id)
+                new_jobs_found += 1
+                
+                if listing['applied']:
+                    self.logger.info(f"Skipping already applied job: {job_title}")
+                    self.seen_jobs.add(job_id)
+                    self.page_stats['duplicates'] += 1
+                    self.jobs_skipped += 1
+                    continue
+                self.page_stats['new'] += 1
+                
+                if not listing['easy_apply']:
+                    self.logger.info(f"Skipping job without Easy Apply: {job_title}")
+                    self.tracker.add_application(
+                        listing, 'skipped', notes="No Easy Apply available"
+                    )
+                    self.seen_jobs.add(job_id)
+                    self.jobs_skipped += 1
+                    continue
+                self.page_stats['easy_apply'] += 1
+                
+                self.logger.info(f"Found Easy Apply job, opening details: {job_title}")
+                details = self.extract_job_details_from_listing(listing)
+                if not details:
+                    self.logger.warning(f"Failed to extract job details for: {job_title}")
+                    self.jobs_skipped += 1
+                    continue
+                
+                job_details, original_window = details
+                
+                if not self.claim_job(job_details):
+                    if len(self.driver.window_handles) > 1:
+                        self.driver.close()
+                        self.driver.switch_to.window(original_window)
+                    continue
+                
+                self.logger.info(f"Submitting application for: {job_details['title']}")
+                applied = self.apply_to_claimed_job(job_details)
+                self.seen_jobs.add(job_id)
+                if applied:
+                    self.logger.info(f"Successfully applied to {job_details['title']}")
+                else:
+                    self.logger.warning(f"Failed to apply to {job_details['title']}")
+                
+                # Close detail tab and return to the original window
+                if len(self.driver.window_handles) > 1:
+                    self.driver.close()
+                    self.driver.switch_to.window(original_window)
+                    
+                self.random_delay('between_applications')
+                
+            except Exception as e:
+                self.logger.error(f"Error processing job {i+1}: {str(e)}")
+                if len(self.driver.window_handles) > 1:
+                    self.driver.close()
+                    self.driver.switch_to.window(self.driver.window_handles[0])
+                continue
+        
+        self.logger.info(f"Completed processing {len(listings)} jobs. Found {new_jobs_found} new jobs.")
+        return new_jobs_found, result['has_next']
+
     def next_page_exists(self) -> bool:
         """Check if next page exists with updated selectors for new UI"""
         try:
@@ -1837,10 +2168,12 @@ class DiceBot:
         except:
             return False
 
-    def search_jobs(self, title: str) -> bool:
+    def search_jobs(self, title: str, page: int = 1) -> bool:
         """Search for jobs with given title and enhanced debugging"""
         try:
             search_url = DICE_SEARCH_URL.format(quote(title))
+            if page > 1:
+                search_url += f"&page={page}"
             self.logger.info(f"Navigating to search URL: {search_url}")
             self.driver.get(search_url)
             self.random_delay('page_load')
@@ -1899,6 +2232,7 @@ class DiceBot:
             f"- Jobs processed: {self.jobs_processed}",
             f"- Jobs applied: {self.jobs_applied}",
             f"- Jobs skipped: {self.jobs_skipped}",
+            f"- Duplicates suppressed: {self.jobs_duplicates}",
             f"- Success rate: {(self.jobs_applied / max(1, self.jobs_processed)) * 100:.1f}%",
             "",
             "Processed Job Titles:",
@@ -1990,35 +2324,40 @@ class DiceBot:
     def run(self):
         """Main execution flow with improved job title handling and API key monitoring"""
         try:
-            if not self.setup_driver():
+            if not self.wait_for_driver():
                 return
-            
                 
-            # Login to Dice
-            if not self.login_to_dice():
+            # Login to Dice (reusing the saved session when possible)
+            if not self.ensure_logged_in():
                 self.logger.error("Failed to login to Dice")
                 return
                 
             self.logger.info("Successfully logged in - proceeding with job search...")
+            
+            # Discover jobs over plain HTTP, keeping the browser for Easy Apply only
+            if HTTP_SEARCH_MODE:
+                self.search_client = DiceSearchClient()
+                self.search_client.load_cookies_from_driver(self.driver)
+                self.logger.info("Using HTTP search mode for job discovery")
             # Initialize the Gemini service for API key monitoring
             gemini_service = GeminiService()
                 
-            # Load tracking data if it exists
-            tracking_file = DATA_DIR / 'tracking' / 'title_tracking.json'
-            if tracking_file.exists():
-                try:
-                    with open(tracking_file, 'r') as f:
-                        self.processed_titles = json.load(f)
-                    self.logger.info(f"Loaded tracking data: {self.processed_titles}")
-                except:
-                    self.processed_titles = {}
-            
-            # Create a copy of job titles for this run
-            available_titles = list(JOB_TITLES)
-            random.shuffle(available_titles)
+            # Load per-title page cursors (imports the old title_tracking.json once)
+            crawl_state = CrawlStateStore(
+                DATA_DIR / 'tracking' / 'crawl_state.json',
+                legacy_file=DATA_DIR / 'tracking' / 'title_tracking.json'
+            )
             
-            # Process all titles with cycling instead of exhausting one at a time
-            max_pages_per_title = 50  # Limit pages per title before cycling
+            # Split each cycle's page budget across titles by observed yield
+            scheduler = TitleScheduler(
+                crawl_state,
+                pages_per_cycle=PAGES_PER_CYCLE,
+                max_pages_per_title=MAX_PAGES_PER_TITLE,
+                exploration=SCHEDULER_EXPLORATION
+            )
+            available_titles = scheduler.plan_cycle(JOB_TITLES)
+            cycles_completed = 0
+            cycle_new_jobs = 0
             
             # Track API check frequency
             last_api_check_time = time.time()
@@ -2058,35 +2397,51 @@ class DiceBot:
                             
                     self.logger.info(f"Current key {current_key}: {current_usage}/{current_limit} ({current_percentage:.1f}%)")
                 
-                # Get next title to process
-                current_title = available_titles.pop(0)
-                self.logger.info(f"Processing job title: {current_title}")
+                # Get next title and its page budget for this cycle
+                current_title, page_budget = available_titles.pop(0)
+                self.logger.info(f"Processing job title: {current_title} (budget: {page_budget} pages)")
+                
+                # Resume from the first unprocessed page for this title
+                current_page = crawl_state.get_start_page(current_title)
+                if current_page > 1:
+                    self.logger.info(f"Resuming '{current_title}' at page {current_page}")
                 
-                # Search for this title
-                if not self.search_jobs(current_title):
+                # Search for this title (HTTP mode fetches each page on demand)
+                if not self.search_client and not self.search_jobs(current_title, current_page):
+                    if current_page > 1:
+                        # The saved page may no longer exist; start over next time
+                        crawl_state.reset_cursor(current_title)
                     continue
                 
-                # Get starting page (default to 1)
-                current_page = 1
-                max_page = current_page + max_pages_per_title
+                max_page = current_page + page_budget
+                has_more_pages = False
                 
                 # Process pages for this title
                 while current_page < max_page:
                     self.logger.info(f"Processing page {current_page} for '{current_title}'")
-                    new_jobs = self.process_search_results()
                     
-                    self.logger.info(f"Found {new_jobs} new jobs on page {current_page}")
+                    if self.search_client:
+                        new_jobs, has_more_pages = self.process_search_results_http(current_title, current_page)
+                    else:
+                        new_jobs = self.process_search_results()
+                        has_more_pages = self.next_page_exists()
                     
-                    # Update processed titles tracking
-                    self.processed_titles[current_title] = current_page
+                    self.logger.info(f"Found {new_jobs} jobs on page {current_page}: {self.page_stats}")
+                    cycle_new_jobs += self.page_stats['new']
                     
-                    # Save tracking data
-                    try:
-                        tracking_file.parent.mkdir(parents=True, exist_ok=True)
-                        with open(tracking_file, 'w') as f:
-                            json.dump(self.processed_titles, f)
-                    except Exception as e:
-                        self.logger.warning(f"Error saving tracking data: {str(e)}")
+                    # A first page identical to the last full crawl means nothing new was posted
+                    if current_page == 1 and crawl_state.is_unchanged(current_title, self.page_job_ids):
+                        self.logger.info(f"No new postings for '{current_title}' since last full crawl")
+                        crawl_state.record_unchanged(current_title, self.page_stats)
+                        self.processed_titles[current_title] = current_page
+                        has_more_pages = False
+                        break
+                    
+                    # Advance and persist the page cursor for this title
+                    crawl_state.record_page(
+                        current_title, current_page, self.page_job_ids, self.page_stats, has_more_pages
+                    )
+                    self.processed_titles[current_title] = current_page
                     
                     # Check if all API keys are exhausted after processing each page
                     if gemini_service.are_all_keys_exhausted():
@@ -2100,32 +2455,38 @@ class DiceBot:
                         return
                     
                     # Check if we should move to next page
-                    if not self.next_page_exists():
+                    if not has_more_pages:
                         break
                         
-                    if not self.go_to_next_page():
+                    if not self.search_client and not self.go_to_next_page():
                         break
                         
                     current_page += 1
                     self.random_delay('between_pages')
                 
-                # Put this title back at the end of the queue if it had more pages
-                if self.next_page_exists():
-                    available_titles.append(current_title)
-                
                 self.random_delay('between_actions')
                 
-                # If we've processed all titles once, shuffle and restart
+                # If we've processed all titles once, plan the next cycle
                 if not available_titles:
-                    available_titles = list(JOB_TITLES)
-                    random.shuffle(available_titles)
-                    self.logger.info("Processed all job titles, cycling back to beginning with shuffled order")
+                    cycles_completed += 1
+                    self.logger.info(f"Completed cycle {cycles_completed} with {cycle_new_jobs} new jobs")
                     
-                    # Ask user if they want to continue
-                    print("\nProcessed all job titles. Continue with another cycle? (y/n)")
-                    user_input = input().strip().lower()
-                    if user_input != 'y':
+                    if MAX_CYCLES and cycles_completed >= MAX_CYCLES:
+                        self.logger.info(f"Reached MAX_CYCLES ({MAX_CYCLES}), stopping")
                         break
+                    
+                    if PROMPT_BETWEEN_CYCLES:
+                        print("\nProcessed all job titles. Continue with another cycle? (y/n)")
+                        user_input = input().strip().lower()
+                        if user_input != 'y':
+                            break
+                    elif cycle_new_jobs == 0:
+                        # Every title is saturated; wait for new postings instead of re-scanning duplicates
+                        self.logger.info(f"No new jobs this cycle, waiting {IDLE_CYCLE_WAIT}s before the next one")
+                        time.sleep(IDLE_CYCLE_WAIT)
+                    
+                    available_titles = scheduler.plan_cycle(JOB_TITLES)
+                    cycle_new_jobs = 0
             
             # Generate summary report
             report_path = self.generate_summary_report()
@@ -2135,6 +2496,7 @@ class DiceBot:
             self.logger.error(f"Error in main execution: {str(e)}")
             
         finally:
+            self.tracker.flush()
             if self.driver:
                 self.driver.quit()
                 self.logger.info("Browser closed")
\ No newline at end of file
@@ -0,0 +1,128 @@
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from file_lock import FileLock
+
+DICE_HOME_URL = "https://www.dice.com/"
+DICE_SESSION_CHECK_URL = "https://www.dice.com/dashboard"
+
+
+def acquire_profile_dir(base_dir: Path, max_profiles: int = 16) -> Tuple[Optional[Path], Optional[FileLock]]:
+    """Lock a Chrome profile directory for this process
+
+    Chrome refuses to start twice on one profile, so parallel bot processes
+    each take the first free directory of base_dir, base_dir_2, base_dir_3...
+    Keep the returned lock referenced while Chrome runs; the directory is None
+    when all are taken.
+    """
+    base_dir = Path(base_dir)
+    for n in range(1, max_profiles + 1):
+        profile_dir = base_dir if n == 1 else base_dir.with_name(f"{base_dir.name}_{n}")
+        lock = FileLock(profile_dir.with_name(profile_dir.name + '.lock'), timeout=0)
+        try:
+            lock.acquire()
+        except TimeoutError:
+            continue
+        profile_dir.mkdir(parents=True, exist_ok=True)
+        return profile_dir, lock
+    return None, None
+
+
+class BrowserSessionStore:
+    """Cookie jar that lets the bot reuse an authenticated Dice session across runs"""
+
+    def __init__(self, cookie_file: Path, max_age_hours: float = 24):
+        self.logger = logging.getLogger(__name__)
+        self.cookie_file = cookie_file
+        self.cookie_file.parent.mkdir(parents=True, exist_ok=True)
+        self.max_age_seconds = max_age_hours * 3600
+
+    def save(self, driver) -> None:
+        """Persist the driver's current cookies after a successful login"""
+        data = {'saved_at': time.time(), 'cookies': driver.get_cookies()}
+        temp_file = self.cookie_file.with_suffix('.tmp')
+        try:
+            with open(temp_file, 'w') as f:
+                json.dump(data, f)
+            os.replace(temp_file, self.cookie_file)
+            self.logger.info(f"Saved {len(data['cookies'])} session cookies")
+        except Exception as e:
+            self.logger.warning(f"Error saving session cookies: {str(e)}")
+
+    def load(self) -> List[dict]:
+        """Return saved cookies that have not expired, or an empty list"""
+        if not self.cookie_file.exists():
+            return []
+
+        try:
+            with open(self.cookie_file, 'r') as f:
+                data = json.load(f)
+        except Exception as e:
+            self.logger.warning(f"Error loading session cookies: {str(e)}")
+            return []
+
+        now = time.time()
+        if now - data.get('saved_at', 0) > self.max_age_seconds:
+            self.logger.info("Saved session is older than the maximum age, ignoring it")
+            return []
+
+        return [c for c in data.get('cookies', []) if not c.get('expiry') or c['expiry'] > now]
+
+    def restore(self, driver) -> int:
+        """Add saved cookies to the driver; returns how many were restored
+
+        Without a usable saved session the browser's own cookies are cleared
+        too, so a persistent profile cannot outlive the session's maximum age.
+        """
+        cookies = self.load()
+        if not cookies:
+            self.clear_browser_cookies(driver)
+            return 0
+
+        # Cookies can only be set for the domain currently loaded
+        driver.get(DICE_HOME_URL)
+        restored = 0
+        for cookie in cookies:
+            try:
+                driver.add_cookie({k: v for k, v in cookie.items() if k != 'sameSite' or v in ('Strict', 'Lax', 'None')})
+                restored += 1
+            except Exception as e:
+                self.logger.debug(f"Could not restore cookie {cookie.get('name')}: {str(e)}")
+
+        self.logger.info(f"Restored {restored}/{len(cookies)} session cookies")
+        return restored
+
+    def is_session_valid(self, driver) -> bool:
+        """Cheap authentication check: an expired session is redirected to the login page"""
+        try:
+            driver.get(DICE_SESSION_CHECK_URL)
+            time.sleep(2)
+            current_url = driver.current_url.lower()
+            valid = 'login' not in current_url and 'dice.com' in current_url
+            self.logger.info(f"Saved session {'is valid' if valid else 'has expired'} ({driver.current_url})")
+            return valid
+        except Exception as e:
+            self.logger.warning(f"Error checking saved session: {str(e)}")
+            return False
+
+    def clear_browser_cookies(self, driver) -> None:
+        """Delete every cookie in the browser profile, not only the current domain's"""
+        try:
+            driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+        except Exception:
+            try:
+                driver.get(DICE_HOME_URL)
+                driver.delete_all_cookies()
+            except Exception as e:
+                self.logger.warning(f"Error clearing browser cookies: {str(e)}")
+
+    def clear(self) -> None:
+        """Forget the saved session"""
+        try:
+            self.cookie_file.unlink()
+        except FileNotFoundError:
+            pass
@@ -35,6 +35,10 @@ CHROME_PROFILE = {
     'profile_directory': 'Profile 2'
 }
 
+# Persistent Chrome profile for the bot so the Dice login survives restarts
+# (set to None to start every run with a fresh profile)
+BROWSER_PROFILE_DIR = DATA_DIR / 'chrome_profile'
+SESSION_MAX_AGE_HOURS = 24  # Re-login when the saved session cookies are older than this
 # ChromeDriver path
 CHROMEDRIVER_PATH = "webdriver\\chromedriver.exe"
 
@@ -89,10 +93,32 @@ JOB_TITLES = [
 # Search URL template
 DICE_SEARCH_URL = "https://www.dice.com/jobs?q={}&countryCode=US&radius=30&radiusUnit=mi&pageSize=20&filters.workplaceTypes=Remote&filters.easyApply=true&language=en"
 
+# Fetch search result pages over plain HTTP (reusing the browser's cookies)
+# instead of rendering them in Chrome. The browser is only used for Easy Apply.
+HTTP_SEARCH_MODE = False
+
 # Application Limits
 MAX_APPLICATIONS_PER_DAY = 2
 MAX_PAGES_PER_TITLE = 3  # How many pages to process before moving to next title
 
+# Title Scheduling - each cycle's page budget is split across JOB_TITLES by yield
+PAGES_PER_CYCLE = 30  # Total search pages per cycle across all titles
+SCHEDULER_EXPLORATION = 0.3  # Higher values give low-yield titles more pages
+MAX_CYCLES = 0  # Stop after this many cycles (0 = run until API keys are exhausted)
+PROMPT_BETWEEN_CYCLES = False  # Ask before starting each new cycle
+IDLE_CYCLE_WAIT = 1800  # Seconds to wait after a cycle that found no new jobs
+
+# Keep previously seen job IDs in a Bloom filter instead of a set (for very large histories)
+SEEN_JOBS_USE_BLOOM = False
+
+# Skip reposts whose description MinHash similarity to an applied job is at least this
+NEAR_DUPLICATE_THRESHOLD = 0.85
+
+# Application tracking storage: 'csv' (applications.csv) or 'sqlite' (indexed applications.db)
+TRACKER_BACKEND = 'csv'
+TRACKER_MIRROR_CSV = True  # With the sqlite backend, keep appending rows to applications.csv too
+TRACKER_ARCHIVE_AFTER_DAYS = 90  # Compaction moves older applications into compressed monthly archives
+
 # Debug Mode - Set to True for additional debugging information
 DEBUG_MODE = False
 
@@ -0,0 +1,165 @@
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+class CrawlStateStore:
+    """Durable per-title crawl state: page cursors, newest-job watermarks and yield statistics"""
+
+    # Weight of the latest page in the per-title yield moving average
+    YIELD_SMOOTHING = 0.3
+    # Leading page-1 job ids compared to detect an unchanged title; more than one so a
+    # pinned or sponsored first card cannot hide new postings below it
+    WATERMARK_SIZE = 5
+
+    def __init__(self, state_file: Path, legacy_file: Optional[Path] = None):
+        self.logger = logging.getLogger(__name__)
+        self.state_file = state_file
+        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        self.titles: Dict[str, Dict] = {}
+
+        if self.state_file.exists():
+            try:
+                with open(self.state_file, 'r') as f:
+                    self.titles = json.load(f).get('titles', {})
+            except Exception as e:
+                self.logger.warning(f"Error loading crawl state, starting fresh: {str(e)}")
+                self.titles = {}
+        elif legacy_file and legacy_file.exists():
+            self._import_legacy(legacy_file)
+
+    def _import_legacy(self, legacy_file: Path):
+        """Seed cursors from the old {title: last_page_processed} tracking file"""
+        try:
+            with open(legacy_file, 'r') as f:
+                processed_titles = json.load(f)
+            for title, last_page in processed_titles.items():
+                self._get(title)['next_page'] = int(last_page) + 1
+            self.logger.info(f"Imported page cursors for {len(processed_titles)} titles from {legacy_file.name}")
+            self.save()
+        except Exception as e:
+            self.logger.warning(f"Error importing legacy title tracking: {str(e)}")
+
+    def _get(self, title: str) -> Dict:
+        if title not in self.titles:
+            self.titles[title] = {
+                'next_page': 1,
+                'watermark_job_id': '',
+                'watermark_job_ids': [],
+                'completed_crawls': 0,
+                'pages_crawled': 0,
+                'cards_seen': 0,
+                'new_jobs': 0,
+                'easy_apply_jobs': 0,
+                'duplicate_jobs': 0,
+                'reward_sum': 0.0,
+                'yield_rate': None,
+                'last_crawled': ''
+            }
+        state = self.titles[title]
+        # Older state files predate the per-page statistics
+        for key in ('cards_seen', 'easy_apply_jobs', 'duplicate_jobs'):
+            state.setdefault(key, 0)
+        state.setdefault('reward_sum', 0.0)
+        state.setdefault('watermark_job_ids', [])
+        return state
+
+    def get_start_page(self, title: str) -> int:
+        """Page to resume a title from"""
+        return self._get(title)['next_page']
+
+    def get_yield_rate(self, title: str) -> Optional[float]:
+        """Smoothed number of new jobs per page, or None before the first page"""
+        return self._get(title)['yield_rate']
+
+    def get_title_stats(self, title: str) -> Dict:
+        """Per-title scheduling statistics derived from all crawled pages"""
+        state = self._get(title)
+        pages = state['pages_crawled']
+        return {
+            'pages_crawled': pages,
+            'new_jobs_per_page': state['new_jobs'] / pages if pages else None,
+            'easy_apply_ratio': state['easy_apply_jobs'] / state['new_jobs'] if state['new_jobs'] else 0.0,
+            'duplicate_ratio': state['duplicate_jobs'] / state['cards_seen'] if state['cards_seen'] else 0.0,
+            'mean_reward': state['reward_sum'] / pages if pages else None,
+            'yield_rate': state['yield_rate']
+        }
+
+    def is_unchanged(self, title: str, job_ids: List[str]) -> bool:
+        """True if page 1 still starts with the same jobs as at the end of the last full crawl"""
+        state = self._get(title)
+        leading_ids = job_ids[:self.WATERMARK_SIZE]
+        return bool(
+            leading_ids
+            and state['completed_crawls'] > 0
+            and state['watermark_job_ids'] == leading_ids
+        )
+
+    def record_page(self, title: str, page: int, job_ids: List[str], page_stats: Dict, has_more: bool) -> None:
+        """Advance the cursor past a processed page and update the title's statistics
+
+        page_stats holds the page's 'cards', 'new', 'easy_apply' and 'duplicates' counts.
+        """
+        state = self._get(title)
+
+        if page == 1 and job_ids:
+            state['watermark_job_id'] = job_ids[0]
+            state['watermark_job_ids'] = job_ids[:self.WATERMARK_SIZE]
+
+        if has_more:
+            state['next_page'] = page + 1
+        else:
+            # Title exhausted; the next visit starts over to pick up new postings
+            state['next_page'] = 1
+            state['completed_crawls'] += 1
+
+        self._add_page_stats(state, page_stats)
+        self.save()
+
+    def record_unchanged(self, title: str, page_stats: Dict) -> None:
+        """Count an unchanged first page as a pull of the title and send it back to page 1
+
+        Without this the scheduler would keep the title's old mean reward and an
+        exploration bonus that never shrinks, and pick a saturated title every cycle.
+        """
+        state = self._get(title)
+        state['next_page'] = 1
+        self._add_page_stats(state, page_stats)
+        self.save()
+
+    def _add_page_stats(self, state: Dict, page_stats: Dict) -> None:
+        new_jobs = page_stats.get('new', 0)
+        state['pages_crawled'] += 1
+        state['cards_seen'] += page_stats.get('cards', 0)
+        state['new_jobs'] += new_jobs
+        state['easy_apply_jobs'] += page_stats.get('easy_apply', 0)
+        state['duplicate_jobs'] += page_stats.get('duplicates', 0)
+        # Reward in [0, 1]: share of the page that was new and Easy Apply
+        state['reward_sum'] += page_stats.get('easy_apply', 0) / max(1, page_stats.get('cards', 0))
+        if state['yield_rate'] is None:
+            state['yield_rate'] = float(new_jobs)
+        else:
+            state['yield_rate'] = round(
+                self.YIELD_SMOOTHING * new_jobs + (1 - self.YIELD_SMOOTHING) * state['yield_rate'], 3
+            )
+        state['last_crawled'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    def reset_cursor(self, title: str) -> None:
+        """Send a title back to page 1, e.g. when a resume page fails to load"""
+        state = self._get(title)
+        state['next_page'] = 1
+        state['last_crawled'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.save()
+
+    def save(self) -> None:
+        """Atomically write the crawl state to disk"""
+        temp_file = self.state_file.with_suffix('.tmp')
+        try:
+            with open(temp_file, 'w') as f:
+                json.dump({'titles': self.titles}, f, indent=2)
+            os.replace(temp_file, self.state_file)
+        except Exception as e:
+            self.logger.warning(f"Error saving crawl state: {str(e)}")
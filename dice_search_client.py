@@ -0,0 +1,211 @@
+import logging
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Union
+from urllib.parse import quote, urljoin
+
+import requests
+
+from config import DICE_SEARCH_URL
+
+DICE_BASE_URL = "https://www.dice.com"
+
+
+class SearchResultsParser(HTMLParser):
+    """Streaming parser that extracts job cards from a Dice search results page"""
+
+    CARD_TESTID = 'job-search-serp-card'
+    LINK_TESTID = 'job-search-job-detail-link'
+    DATE_INDICATORS = ["ago", "yesterday", "today", "•"]
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.jobs: List[Dict] = []
+        self.has_next = False
+        self._card: Optional[Dict] = None
+        self._div_depth = 0
+        self._card_depth = 0
+        self._capture: Optional[str] = None
+        self._capture_tag: Optional[str] = None
+        self._buffer: List[str] = []
+        self._card_text: List[str] = []
+
+    def handle_starttag(self, tag, attrs):
+        attributes = dict(attrs)
+
+        if tag == 'div':
+            self._div_depth += 1
+            if self._card is None and attributes.get('data-testid') == self.CARD_TESTID:
+                self._card = {
+                    'job_id': attributes.get('data-id') or attributes.get('data-job-guid') or '',
+                    'title': '',
+                    'company': '',
+                    'location': '',
+                    'url': '',
+                    'easy_apply': False,
+                    'applied': False
+                }
+                self._card_depth = self._div_depth
+                self._card_text = []
+            return
+
+        # Pagination lives outside the cards
+        if attributes.get('aria-label') == 'Next':
+            disabled = ('disabled' in (attributes.get('class') or '')
+                        or attributes.get('aria-disabled') == 'true')
+            self.has_next = not disabled
+            return
+
+        if self._card is None or self._capture:
+            return
+
+        href = attributes.get('href') or ''
+        if tag == 'a' and attributes.get('data-testid') == self.LINK_TESTID:
+            self._card['url'] = urljoin(DICE_BASE_URL, href)
+            self._start_capture('title', tag)
+        elif tag == 'a' and 'company-profile' in href:
+            self._start_capture('company', tag)
+        elif tag == 'p' and 'text-zinc-600' in (attributes.get('class') or '') and not self._card['location']:
+            self._start_capture('location', tag)
+
+    def handle_endtag(self, tag):
+        if self._capture and tag == self._capture_tag:
+            self._finish_capture()
+
+        if tag != 'div':
+            return
+
+        if self._card is not None and self._div_depth == self._card_depth:
+            self._finish_card()
+        self._div_depth = max(0, self._div_depth - 1)
+
+    def handle_data(self, data):
+        if self._card is None:
+            return
+        if self._capture:
+            self._buffer.append(data)
+        self._card_text.append(data)
+
+    def _start_capture(self, field: str, tag: str):
+        self._capture = field
+        self._capture_tag = tag
+        self._buffer = []
+
+    def _finish_capture(self):
+        text = ' '.join(''.join(self._buffer).split())
+        field = self._capture
+        self._capture = None
+        self._capture_tag = None
+        self._buffer = []
+
+        if not text:
+            return
+        if field == 'location':
+            # Cards render the posted date in the same style as the location
+            if len(text) <= 2 or any(indicator in text.lower() for indicator in self.DATE_INDICATORS):
+                return
+        self._card[field] = text
+
+    def _finish_card(self):
+        card = self._card
+        self._card = None
+        self._capture = None
+
+        card_text = ' '.join(''.join(self._card_text).split()).lower()
+        card['easy_apply'] = 'easy apply' in card_text
+        card['applied'] = any(indicator in card_text for indicator in
+                              ["applied", "application submitted", "app submitted"])
+
+        if not card['job_id'] and '/job-detail/' in card['url']:
+            card['job_id'] = card['url'].split('/job-detail/')[1].split('?')[0]
+
+        if card['job_id']:
+            self.jobs.append(card)
+
+
+def parse_search_results(source: Union[str, Iterable[str]]) -> Dict:
+    """Parse search results HTML given as a string or an iterable of text chunks"""
+    parser = SearchResultsParser()
+    chunks = [source] if isinstance(source, str) else source
+    for chunk in chunks:
+        parser.feed(chunk)
+    parser.close()
+    return {'jobs': parser.jobs, 'has_next': parser.has_next}
+
+
+def parse_search_results_file(path: Union[str, Path], chunk_size: int = 65536) -> Dict:
+    """Parse a saved search results page (e.g. a debug dump) without loading it whole"""
+    def read_chunks():
+        with open(path, 'r', encoding='utf-8') as f:
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+
+    return parse_search_results(read_chunks())
+
+
+class DiceSearchClient:
+    """Fetches Dice search results over plain HTTP using the browser's session cookies"""
+
+    def __init__(self, timeout: int = 30, chunk_size: int = 16384):
+        self.logger = logging.getLogger(__name__)
+        self.timeout = timeout
+        self.chunk_size = chunk_size
+        self.session = requests.Session()
+        self.session.headers.update({
+            'Accept': 'text/html,application/xhtml+xml',
+            'Accept-Language': 'en-US,en;q=0.9'
+        })
+
+    def load_cookies_from_driver(self, driver) -> int:
+        """Copy cookies and user agent from a logged-in WebDriver session"""
+        cookies = driver.get_cookies()
+        for cookie in cookies:
+            self.session.cookies.set(
+                cookie['name'],
+                cookie['value'],
+                domain=cookie.get('domain'),
+                path=cookie.get('path', '/')
+            )
+
+        try:
+            user_agent = driver.execute_script("return navigator.userAgent")
+            if user_agent:
+                self.session.headers['User-Agent'] = user_agent
+        except Exception as e:
+            self.logger.debug(f"Could not read user agent from driver: {str(e)}")
+
+        self.logger.info(f"Loaded {len(cookies)} cookies from browser session")
+        return len(cookies)
+
+    def build_search_url(self, title: str, page: int = 1) -> str:
+        """Build the search URL for a title and page number"""
+        url = DICE_SEARCH_URL.format(quote(title))
+        if page > 1:
+            url += f"&page={page}"
+        return url
+
+    def fetch_page(self, title: str, page: int = 1) -> Optional[Dict]:
+        """Fetch and parse one page of search results, or None on failure"""
+        url = self.build_search_url(title, page)
+        self.logger.info(f"Fetching search results over HTTP: {url}")
+
+        try:
+            with self.session.get(url, timeout=self.timeout, stream=True) as response:
+                response.raise_for_status()
+                if 'login' in response.url.lower():
+                    self.logger.error("Search request was redirected to login - session cookies expired")
+                    return None
+
+                response.encoding = response.encoding or 'utf-8'
+                result = parse_search_results(
+                    response.iter_content(chunk_size=self.chunk_size, decode_unicode=True)
+                )
+        except requests.RequestException as e:
+            self.logger.error(f"HTTP search request failed: {str(e)}")
+            return None
+
+        self.logger.info(f"Parsed {len(result['jobs'])} jobs from page {page} (has next: {result['has_next']})")
+        return result
@@ -0,0 +1,80 @@
+import os
+import threading
+import time
+from pathlib import Path
+
+if os.name == 'nt':
+    import msvcrt
+else:
+    import fcntl
+
+
+class FileLock:
+    """Cross-process advisory lock on a lock file, re-entrant within one process
+
+    Uses fcntl.flock on POSIX and msvcrt.locking on Windows, so every process
+    sharing the tracking directory (bot runs, main.py commands) serializes its
+    writes through the same lock file.
+    """
+
+    def __init__(self, lock_file: Path, timeout: float = 30, poll_interval: float = 0.05):
+        self.lock_file = lock_file
+        self.lock_file.parent.mkdir(parents=True, exist_ok=True)
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self._thread_lock = threading.RLock()
+        self._depth = 0
+        self._fd = None
+
+    def _try_lock(self) -> bool:
+        try:
+            if os.name == 'nt':
+                msvcrt.locking(self._fd, msvcrt.LK_NBLCK, 1)
+            else:
+                fcntl.flock(self._fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return True
+        except OSError:
+            return False
+
+    def acquire(self) -> None:
+        self._thread_lock.acquire()
+        if self._depth > 0:
+            self._depth += 1
+            return
+
+        try:
+            self._fd = os.open(str(self.lock_file), os.O_RDWR | os.O_CREAT)
+            deadline = time.monotonic() + self.timeout
+            while not self._try_lock():
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(f"Timed out waiting for lock {self.lock_file}")
+                time.sleep(self.poll_interval)
+        except BaseException:
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+            self._thread_lock.release()
+            raise
+
+        self._depth = 1
+
+    def release(self) -> None:
+        self._depth -= 1
+        if self._depth == 0:
+            try:
+                if os.name == 'nt':
+                    os.lseek(self._fd, 0, os.SEEK_SET)
+                    msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+                else:
+                    fcntl.flock(self._fd, fcntl.LOCK_UN)
+            finally:
+                os.close(self._fd)
+                self._fd = None
+        self._thread_lock.release()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
@@ -10,8 +10,8 @@ import hashlib
 from bot import DiceBot
 from resume_handler import ResumeHandler
 from gemini_service import GeminiService
-from application_tracker import ApplicationTracker
-from config import JOBS_DIR, RESUME_DIR, DATA_DIR, DEBUG_MODE
+from application_tracker import create_tracker
+from config import JOBS_DIR, RESUME_DIR, DATA_DIR, DEBUG_MODE, TRACKER_BACKEND, TRACKER_MIRROR_CSV, TRACKER_ARCHIVE_AFTER_DAYS
 
 def setup_logging():
     """Configure logging"""
@@ -58,8 +58,8 @@ def run_auto_apply():
     
     print("\n")
     
-    # Create bot and run
-    bot = DiceBot()
+    # Create bot and run, starting Chrome while the services initialize
+    bot = DiceBot(prewarm_driver=True)
     bot.run()
     
 def generate_progress_bar(percentage, width=20):
@@ -317,7 +317,7 @@ def generate_cover_letter(job_description_file: str, resume_path: str) -> Option
 def list_applications():
     """List all tracked job applications"""
     try:
-        tracker = ApplicationTracker(DATA_DIR)
+        tracker = create_tracker(DATA_DIR, TRACKER_BACKEND, TRACKER_MIRROR_CSV)
         
         # Clean duplicates first
         duplicates = tracker.clean_duplicates()
@@ -381,7 +381,7 @@ def list_applications():
 def generate_report():
     """Generate comprehensive application report"""
     try:
-        tracker = ApplicationTracker(DATA_DIR)
+        tracker = create_tracker(DATA_DIR, TRACKER_BACKEND, TRACKER_MIRROR_CSV)
         report_path = Path('reports') / f'application_report_{datetime.now():%Y%m%d_%H%M%S}.txt'
         
         # Create reports directory if needed
@@ -405,6 +405,32 @@ def generate_report():
     except Exception as e:
         print(f"\nError generating report: {str(e)}")
 
+def compact_tracking():
+    """Deduplicate the tracking file and archive old applications"""
+    try:
+        tracker = create_tracker(DATA_DIR, TRACKER_BACKEND, TRACKER_MIRROR_CSV)
+        result = tracker.compact(TRACKER_ARCHIVE_AFTER_DAYS)
+        
+        print(f"\nRemoved {result['duplicates']} duplicate application entries.")
+        print(f"Archived {result['archived']} applications older than {TRACKER_ARCHIVE_AFTER_DAYS} days.")
+        print(f"{result['live']} applications remain in the live tracking file.")
+        
+    except Exception as e:
+        print(f"\nError compacting tracking data: {str(e)}")
+
+def rebuild_statistics():
+    """Rebuild statistics and the job ID index from the event log"""
+    try:
+        tracker = create_tracker(DATA_DIR, TRACKER_BACKEND, TRACKER_MIRROR_CSV)
+        tracker.rebuild_projections()
+        
+        stats = tracker.get_application_stats()
+        print(f"\nTotal jobs found: {stats.get('total_jobs_found', 0)}")
+        print(f"Total applications: {stats.get('total_applications', 0)}")
+        
+    except Exception as e:
+        print(f"\nError rebuilding statistics: {str(e)}")
+
 def debug_mode():
     """Run system in debug mode with extended diagnostics"""
     try:
@@ -416,10 +442,10 @@ def debug_mode():
         debug_dir.mkdir(exist_ok=True)
         
         # Initialize application tracker
-        tracker = ApplicationTracker(DATA_DIR)
+        tracker = create_tracker(DATA_DIR, TRACKER_BACKEND, TRACKER_MIRROR_CSV)
         
         # Check for applied jobs
-        job_count = len(tracker.applied_job_ids)
+        job_count = tracker.get_job_id_count()
         print(f"\nFound {job_count} previously applied jobs in tracker.")
         
         # Test Gemini API
@@ -434,7 +460,7 @@ def debug_mode():
         # Initialize bot for diagnostic checks only
         print("\nInitializing browser for diagnostics...")
         bot = DiceBot()
-        if bot.setup_driver():
+        if bot.wait_for_driver():
             print("✓ Browser initialization successful.")
             
             # Test a search query
@@ -467,7 +493,7 @@ def main():
     
     parser.add_argument(
         '--mode',
-        choices=['auto', 'resume', 'cover', 'list', 'report', 'debug', 'process-description'],
+        choices=['auto', 'resume', 'cover', 'list', 'report', 'compact', 'rebuild-stats', 'debug', 'process-description'],
         default='auto',
         help='Operation mode'
     )
@@ -542,6 +568,12 @@ def main():
     elif args.mode == 'report':
         generate_report()
         
+    elif args.mode == 'compact':
+        compact_tracking()
+        
+    elif args.mode == 'rebuild-stats':
+        rebuild_statistics()
+        
     elif args.mode == 'debug':
         debug_mode()
         
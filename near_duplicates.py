@@ -0,0 +1,181 @@
+import hashlib
+import json
+import logging
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+# Words that vary between reposts of the same role without changing it
+TITLE_NOISE = {
+    'remote', 'hybrid', 'onsite', 'on', 'site', 'contract', 'contractor', 'fulltime', 'full',
+    'parttime', 'part', 'time', 'permanent', 'temp', 'w2', 'c2c', 'c2h', '1099', 'urgent',
+    'immediate', 'hiring', 'need', 'needed', 'only', 'locals', 'local', 'position', 'role', 'job'
+}
+COMPANY_SUFFIXES = {'inc', 'llc', 'ltd', 'corp', 'corporation', 'co', 'company', 'incorporated', 'limited', 'group'}
+
+# Relative dates on search cards ("Posted 2 days ago", "2d ago", "Updated today") change between visits
+RELATIVE_DATE_PATTERN = re.compile(
+    r'\b(posted|updated|reposted)?\s*(\d+\+?\s*(second|minute|min|hour|hr|day|week|wk|month|mo|[smhdw])s?\s+ago'
+    r'|today|yesterday|just now|moments? ago)\b',
+    re.IGNORECASE
+)
+
+PRIME = (1 << 61) - 1
+
+
+def _words(text: str) -> List[str]:
+    return re.sub(r'[^a-z0-9+#]+', ' ', (text or '').lower()).split()
+
+
+def normalize_title(title: str) -> str:
+    return ' '.join(w for w in _words(title) if w not in TITLE_NOISE)
+
+
+def normalize_company(company: str) -> str:
+    words = _words(company)
+    while words and words[-1] in COMPANY_SUFFIXES:
+        words.pop()
+    return ' '.join(words)
+
+
+def normalize_location(location: str) -> str:
+    # Unlike titles, "remote" is the location of most jobs this bot sees, so it is kept
+    return ' '.join(_words(location))
+
+
+def stable_card_hash(card_text: str) -> str:
+    """Hash of a search card's text that survives changes in its relative posting date"""
+    text = RELATIVE_DATE_PATTERN.sub(' ', card_text or '')
+    return hashlib.md5(' '.join(text.split()).encode()).hexdigest()
+
+
+class MinHasher:
+    """MinHash signatures over word shingles, for estimating description similarity"""
+
+    def __init__(self, num_perm: int = 64, shingle_size: int = 3, seed: int = 1):
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        # Deterministic (a, b) pairs so signatures stay comparable across runs
+        self.params = []
+        for i in range(num_perm):
+            digest = hashlib.blake2b(f'{seed}:{i}'.encode(), digest_size=16).digest()
+            a = int.from_bytes(digest[:8], 'little') % (PRIME - 1) + 1
+            b = int.from_bytes(digest[8:], 'little') % PRIME
+            self.params.append((a, b))
+
+    def signature(self, text: str) -> Optional[List[int]]:
+        """MinHash signature of a text, or None if it is too short to compare"""
+        words = _words(text)
+        if len(words) < self.shingle_size * 4:
+            return None
+
+        shingles = {
+            int.from_bytes(hashlib.blake2b(' '.join(words[i:i + self.shingle_size]).encode(), digest_size=8).digest(), 'little')
+            for i in range(len(words) - self.shingle_size + 1)
+        }
+        return [min((a * h + b) % PRIME for h in shingles) for a, b in self.params]
+
+    @staticmethod
+    def similarity(sig1: List[int], sig2: List[int]) -> float:
+        """Estimated Jaccard similarity of two signatures"""
+        return sum(1 for x, y in zip(sig1, sig2) if x == y) / len(sig1)
+
+
+class NearDuplicateIndex:
+    """Persistent index of jobs already applied to, matched by normalized fields and description MinHash
+
+    Catches reposts of the same role under a new job ID and hash-based ID
+    variants before any resume is generated for them. LSH banding keeps the
+    description lookup to a handful of candidates. A matching title/company/
+    location key only counts once the descriptions are at least key_threshold
+    similar, since staffing companies post many distinct reqs under one title.
+    """
+
+    def __init__(self, index_file: Path, threshold: float = 0.85, num_perm: int = 64, bands: int = 16,
+                 key_threshold: float = 0.6):
+        self.logger = logging.getLogger(__name__)
+        self.index_file = index_file
+        self.index_file.parent.mkdir(parents=True, exist_ok=True)
+        self.threshold = threshold
+        self.key_threshold = min(key_threshold, threshold)
+        self.hasher = MinHasher(num_perm)
+        self.bands = bands
+        self.rows_per_band = num_perm // bands
+
+        self.keys: Dict[str, List[str]] = {}
+        self.signatures: Dict[str, List[int]] = {}
+        self.buckets: Dict[str, Set[str]] = {}
+
+        if self.index_file.exists():
+            try:
+                with open(self.index_file, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        if line.endswith('\n'):
+                            entry = json.loads(line)
+                            self._index(entry['job_id'], entry.get('key'), entry.get('sig'))
+                self.logger.info(f"Loaded {len(self.keys)} job keys and {len(self.signatures)} description signatures")
+            except Exception as e:
+                self.logger.warning(f"Error loading near-duplicate index: {str(e)}")
+
+    @staticmethod
+    def job_key(job_details: Dict) -> Optional[str]:
+        """Normalized title|company|location key, or None without a known company"""
+        company = normalize_company(job_details.get('company', ''))
+        title = normalize_title(job_details.get('title', ''))
+        if not company or company == 'unknown' or not title:
+            return None
+        return f"{title}|{company}|{normalize_location(job_details.get('location', ''))}"
+
+    def _band_keys(self, sig: List[int]) -> List[str]:
+        r = self.rows_per_band
+        return [f"{i}:" + ','.join(map(str, sig[i * r:(i + 1) * r])) for i in range(self.bands)]
+
+    def _index(self, job_id: str, key: Optional[str], sig: Optional[List[int]]) -> None:
+        if key:
+            job_ids = self.keys.setdefault(key, [])
+            if job_id not in job_ids:
+                job_ids.append(job_id)
+        if sig:
+            self.signatures[job_id] = sig
+            for band_key in self._band_keys(sig):
+                self.buckets.setdefault(band_key, set()).add(job_id)
+
+    def find_duplicate(self, job_details: Dict) -> Optional[str]:
+        """Return the ID of an indexed job this one duplicates, or None"""
+        job_id = job_details.get('job_id', '')
+        sig = self.hasher.signature(job_details.get('description', ''))
+        if not sig:
+            return None  # Nothing to confirm a match with
+
+        key = self.job_key(job_details)
+        for candidate in self.keys.get(key, []) if key else []:
+            candidate_sig = self.signatures.get(candidate)
+            if (candidate != job_id and candidate_sig
+                    and MinHasher.similarity(sig, candidate_sig) >= self.key_threshold):
+                return candidate
+
+        candidates = set()
+        for band_key in self._band_keys(sig):
+            candidates |= self.buckets.get(band_key, set())
+        candidates.discard(job_id)
+        for candidate in candidates:
+            if MinHasher.similarity(sig, self.signatures[candidate]) >= self.threshold:
+                return candidate
+
+        return None
+
+    def add(self, job_details: Dict) -> None:
+        """Index a job and append it to the index file"""
+        job_id = job_details.get('job_id', '')
+        if not job_id:
+            return
+
+        key = self.job_key(job_details)
+        sig = self.hasher.signature(job_details.get('description', ''))
+        self._index(job_id, key, sig)
+
+        try:
+            with open(self.index_file, 'a', encoding='utf-8') as f:
+                f.write(json.dumps({'job_id': job_id, 'key': key, 'sig': sig}) + '\n')
+        except Exception as e:
+            self.logger.warning(f"Error persisting near-duplicate entry for {job_id}: {str(e)}")
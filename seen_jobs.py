@@ -0,0 +1,90 @@
+import hashlib
+import logging
+import math
+from pathlib import Path
+from typing import Set
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter for compact membership checks over large ID histories"""
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        capacity = max(1, capacity)
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        for i in range(self.hash_count):
+            yield (h1 + i * h2) % self.size
+
+    def add(self, item: str) -> None:
+        for pos in self._positions(item):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+
+class SeenJobStore:
+    """Session-wide and persisted set of job IDs already evaluated on a search page"""
+
+    def __init__(self, seen_file: Path, use_bloom: bool = False, bloom_capacity: int = 1000000):
+        self.logger = logging.getLogger(__name__)
+        self.seen_file = seen_file
+        self.seen_file.parent.mkdir(parents=True, exist_ok=True)
+
+        # The session set is always exact; history lives in a set or a Bloom filter
+        self.session_ids: Set[str] = set()
+        self.bloom = BloomFilter(bloom_capacity) if use_bloom else None
+        self.history_ids: Set[str] = set()
+        self.history_count = 0
+
+        if self.seen_file.exists():
+            try:
+                with open(self.seen_file, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        job_id = line.strip()
+                        if job_id:
+                            self._add_to_history(job_id)
+                self.logger.info(f"Loaded {self.history_count} previously seen job IDs")
+            except Exception as e:
+                self.logger.warning(f"Error loading seen job IDs: {str(e)}")
+
+    def _add_to_history(self, job_id: str) -> None:
+        if self.bloom is not None:
+            self.bloom.add(job_id)
+        else:
+            self.history_ids.add(job_id)
+        self.history_count += 1
+
+    def _in_history(self, job_id: str) -> bool:
+        if self.bloom is not None:
+            return job_id in self.bloom
+        return job_id in self.history_ids
+
+    def __contains__(self, job_id: str) -> bool:
+        if not job_id:
+            return False
+        return job_id in self.session_ids or self._in_history(job_id)
+
+    def visit(self, job_id: str) -> None:
+        """Mark a job ID as seen for this session only, so other titles skip it"""
+        if job_id:
+            self.session_ids.add(job_id)
+
+    def add(self, job_id: str) -> None:
+        """Mark a job ID as finished and append it to the history file, so later runs skip it"""
+        if not job_id or self._in_history(job_id):
+            return
+        self.session_ids.add(job_id)
+        self._add_to_history(job_id)
+
+        try:
+            with open(self.seen_file, 'a', encoding='utf-8') as f:
+                f.write(job_id + '\n')
+        except Exception as e:
+            self.logger.warning(f"Error persisting seen job ID {job_id}: {str(e)}")
@@ -0,0 +1,256 @@
+import csv
+import logging
+import sqlite3
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from application_tracker import ApplicationTracker, CSV_COLUMNS
+from tracker_events import CLAIMED, RELEASED
+
+
+class SQLiteApplicationTracker(ApplicationTracker):
+    """Application tracker backed by an indexed SQLite database in WAL mode
+
+    Duplicate checks, recent-application queries and duplicate cleanup run as
+    indexed queries instead of CSV scans. The existing applications.csv is
+    imported once; with mirror_csv the CSV keeps receiving new rows so tools
+    that read it directly continue to work. Statistics stay in statistics.json.
+    Compaction archives old rows into the same monthly segments as the CSV
+    backend and keeps their job IDs in archived_job_ids.
+    """
+
+    def __init__(self, base_dir: Path, mirror_csv: bool = True):
+        self.logger = logging.getLogger(__name__)
+        self.mirror_csv = mirror_csv
+        self.db_file = base_dir / 'tracking' / 'applications.db'
+        self.db_file.parent.mkdir(parents=True, exist_ok=True)
+
+        self.conn = sqlite3.connect(str(self.db_file), timeout=30, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self._create_schema()
+
+        super().__init__(base_dir)
+
+    def _create_schema(self) -> None:
+        columns = ",\n                ".join(f"{column} TEXT NOT NULL DEFAULT ''" for column in CSV_COLUMNS)
+        with self.conn:
+            self.conn.execute(f"""
+                CREATE TABLE IF NOT EXISTS applications (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                {columns}
+                )
+            """)
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_applications_job_id ON applications (job_id)")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_applications_applied_date ON applications (applied_date)")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_applications_status ON applications (status)")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_applications_company ON applications (company)")
+            self.conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+            self.conn.execute("CREATE TABLE IF NOT EXISTS claims (job_id TEXT PRIMARY KEY, claimed_at TEXT)")
+            self.conn.execute("CREATE TABLE IF NOT EXISTS archived_job_ids (job_id TEXT PRIMARY KEY)")
+
+    def _get_meta(self, key: str) -> str:
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row['value'] if row else ''
+
+    def _set_meta(self, key: str, value: str) -> None:
+        with self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def _load_job_ids(self):
+        """Import the CSV history on first use; lookups then go to the job_id index"""
+        # Kept for callers that inspect the in-memory cache; stays empty with this backend
+        self.applied_job_ids = set()
+        if not self._get_meta('csv_imported'):
+            self._import_csv()
+
+    def _import_csv(self) -> None:
+        """Copy existing applications.csv rows into the database in a single transaction"""
+        imported = 0
+        try:
+            if self.tracking_file.exists():
+                with open(self.tracking_file, 'r', newline='') as f:
+                    reader = csv.DictReader(f)
+                    rows = [
+                        tuple(row.get(column) or '' for column in CSV_COLUMNS)
+                        for row in reader
+                    ]
+                placeholders = ", ".join("?" for _ in CSV_COLUMNS)
+                with self.conn:
+                    self.conn.executemany(
+                        f"INSERT INTO applications ({', '.join(CSV_COLUMNS)}) VALUES ({placeholders})",
+                        rows
+                    )
+                imported = len(rows)
+            # Rows the CSV backend already archived still count as applied
+            for segment in self._archive_segments():
+                with self.conn:
+                    self.conn.executemany(
+                        "INSERT OR IGNORE INTO archived_job_ids (job_id) VALUES (?)",
+                        [(row[0],) for row in self._read_segment(segment)[1:] if row[0]]
+                    )
+            self._set_meta('csv_imported', '1')
+            self.logger.info(f"Imported {imported} applications from {self.tracking_file.name} into {self.db_file.name}")
+        except Exception as e:
+            self.logger.warning(f"Error importing applications CSV: {str(e)}")
+
+    def _append_row(self, row: List[str]) -> None:
+        placeholders = ", ".join("?" for _ in CSV_COLUMNS)
+        with self.conn:
+            self.conn.execute(
+                f"INSERT INTO applications ({', '.join(CSV_COLUMNS)}) VALUES ({placeholders})",
+                [value or '' for value in row]
+            )
+
+        if self.mirror_csv:
+            super()._append_row(row)
+
+    def _save_job_ids_state(self) -> None:
+        # The job ID cache is not maintained with this backend, so never mark it as in sync
+        pass
+
+    def _remember_job_id(self, job_id: str) -> bool:
+        # The row insert already made the job ID visible to is_job_applied
+        return True
+
+    def claim_job_id(self, job_id: str) -> bool:
+        """Atomically reserve a job ID; the write transaction serializes competing processes"""
+        if not job_id:
+            return True
+        try:
+            self.conn.execute("BEGIN IMMEDIATE")
+            applied = self.conn.execute(
+                "SELECT 1 FROM applications WHERE job_id = ? "
+                "UNION ALL SELECT 1 FROM archived_job_ids WHERE job_id = ? LIMIT 1", (job_id, job_id)
+            ).fetchone()
+            cursor = self.conn.execute(
+                "INSERT OR IGNORE INTO claims (job_id, claimed_at) VALUES (?, datetime('now'))", (job_id,)
+            )
+            self.conn.commit()
+        except Exception as e:
+            self.conn.rollback()
+            self.logger.warning(f"Error claiming job ID {job_id}: {str(e)}")
+            return False
+
+        claimed = applied is None and cursor.rowcount == 1
+        if claimed:
+            self.record_event(CLAIMED, job_id=job_id)
+        return claimed
+
+    def release_job_id(self, job_id: str) -> None:
+        """Give up a claim whose application ended without a recorded outcome"""
+        if not job_id:
+            return
+        try:
+            with self.conn:
+                cursor = self.conn.execute("DELETE FROM claims WHERE job_id = ?", (job_id,))
+        except Exception as e:
+            self.logger.warning(f"Error releasing job ID {job_id}: {str(e)}")
+            return
+
+        if cursor.rowcount:
+            self.record_event(RELEASED, job_id=job_id)
+            self.flush_statistics()
+
+    def get_job_id_count(self) -> int:
+        row = self.conn.execute(
+            "SELECT COUNT(*) FROM (SELECT job_id FROM applications WHERE job_id != '' "
+            "UNION SELECT job_id FROM archived_job_ids UNION SELECT job_id FROM claims)"
+        ).fetchone()
+        return row[0]
+
+    def is_job_applied(self, job_id: str) -> bool:
+        """Check if a job has been applied to or claimed, with indexed lookups"""
+        if not job_id:
+            return False
+        row = self.conn.execute(
+            "SELECT 1 FROM applications WHERE job_id = ? "
+            "UNION ALL SELECT 1 FROM archived_job_ids WHERE job_id = ? "
+            "UNION ALL SELECT 1 FROM claims WHERE job_id = ? LIMIT 1", (job_id, job_id, job_id)
+        ).fetchone()
+        return row is not None
+
+    def _read_recent_rows(self, limit: int) -> List[Dict]:
+        """Newest rows of the applications table; older ones come from the archive segments"""
+        if limit <= 0:
+            return []
+        rows = self.conn.execute(
+            f"SELECT {', '.join(CSV_COLUMNS)} FROM applications ORDER BY id DESC LIMIT ?", (limit,)
+        ).fetchall()
+        return [dict(row) for row in rows]
+
+    def _iter_rows(self) -> Iterator[Dict]:
+        """Stream every tracked application row as a dict, archived segments first"""
+        for segment in self._archive_segments():
+            for row in self._read_segment(segment)[1:]:
+                yield dict(zip(CSV_COLUMNS, row))
+        for row in self.conn.execute(f"SELECT {', '.join(CSV_COLUMNS)} FROM applications ORDER BY id"):
+            yield dict(row)
+
+    def compact(self, archive_after_days: Optional[int] = None) -> Dict:
+        """Deduplicate the applications table and archive old rows into monthly segments
+
+        Repeated rows for a job ID are deleted, keeping the first application.
+        Rows applied more than archive_after_days ago are merged into
+        tracking/archive/applications-YYYY-MM.csv.gz and deleted in the same
+        write transaction that selected them, so an interrupted run leaves them
+        in the table and re-archiving skips rows a segment already holds.
+        """
+        result = {'duplicates': 0, 'archived': 0, 'live': 0}
+        with self.lock:
+            try:
+                self.conn.execute("BEGIN IMMEDIATE")
+                cursor = self.conn.execute("""
+                    DELETE FROM applications
+                    WHERE job_id != ''
+                      AND id NOT IN (SELECT MIN(id) FROM applications WHERE job_id != '' GROUP BY job_id)
+                """)
+                result['duplicates'] = cursor.rowcount
+
+                if archive_after_days is not None:
+                    cutoff = (datetime.now() - timedelta(days=archive_after_days)).strftime("%Y-%m-%d")
+                    rows = self.conn.execute(
+                        f"SELECT id, {', '.join(CSV_COLUMNS)} FROM applications "
+                        "WHERE job_id != '' AND length(applied_date) >= 10 AND substr(applied_date, 1, 10) < ? "
+                        "ORDER BY id", (cutoff,)
+                    ).fetchall()
+
+                    archive_rows = {}
+                    for row in rows:
+                        archive_rows.setdefault(row['applied_date'][:7], []).append(
+                            [row[column] for column in CSV_COLUMNS]
+                        )
+                    for month, month_rows in sorted(archive_rows.items()):
+                        self._write_segment(month, CSV_COLUMNS, month_rows)
+
+                    self.conn.executemany(
+                        "INSERT OR IGNORE INTO archived_job_ids (job_id) VALUES (?)",
+                        [(row['job_id'],) for row in rows]
+                    )
+                    self.conn.executemany("DELETE FROM applications WHERE id = ?", [(row['id'],) for row in rows])
+                    result['archived'] = len(rows)
+
+                self.conn.commit()
+            except Exception as e:
+                self.conn.rollback()
+                self.logger.warning(f"Error compacting tracker database: {str(e)}")
+                return result
+
+            result['live'] = self.conn.execute("SELECT COUNT(*) FROM applications").fetchone()[0]
+
+            if self.mirror_csv:
+                # Keep the mirror in step; rows already in a segment are not archived twice
+                super().compact(archive_after_days)
+            if result['duplicates']:
+                self._rebuild_rollups()
+
+        return result
+
+    def close(self) -> None:
+        """Close the database connection"""
+        try:
+            self.conn.close()
+        except Exception as e:
+            self.logger.warning(f"Error closing tracker database: {str(e)}")
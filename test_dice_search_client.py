@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Test script for the HTTP search results parser
+Parses the saved Dice results page in test_fixtures/ and checks the extracted cards
+"""
+
+import sys
+from pathlib import Path
+
+# Add the project root to Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from dice_search_client import parse_search_results, parse_search_results_file
+
+FIXTURE = Path(__file__).parent / 'test_fixtures' / 'dice_search_results.html'
+
+EXPECTED_JOBS = [
+    {
+        'job_id': '9f1c2a7e-1b3d-4c55-8e0a-3f6b2d9c1a01',
+        'title': 'Senior Python Developer',
+        'company': 'Acme Corp',
+        'location': 'Remote or Austin, Texas',
+        'easy_apply': True,
+        'applied': False
+    },
+    {
+        'job_id': '2c84e0d5-77aa-4f19-9b2e-5d1e0c6a4b02',
+        'title': 'Backend Engineer & Data Platform',
+        'company': 'Globex',
+        'location': 'New York, NY',
+        'easy_apply': True,
+        'applied': True
+    },
+    {
+        # No data-id on the card, so the id comes from the detail link
+        'job_id': 'c0ffee00-4a2b-4e3c-9d1f-0a9b8c7d6e03',
+        'title': 'Django Developer',
+        'company': 'Initech',
+        'location': 'Remote',
+        'easy_apply': False,
+        'applied': False
+    }
+]
+
+
+def check_jobs(result, label):
+    """Compare parsed cards against the expected fixture contents"""
+    failures = []
+    jobs = result['jobs']
+
+    if len(jobs) != len(EXPECTED_JOBS):
+        failures.append(f"expected {len(EXPECTED_JOBS)} jobs, got {len(jobs)}")
+
+    for expected, job in zip(EXPECTED_JOBS, jobs):
+        for field, value in expected.items():
+            if job[field] != value:
+                failures.append(f"{expected['job_id']} {field}: expected {value!r}, got {job[field]!r}")
+        if not job['url'].startswith('https://www.dice.com/job-detail/' + expected['job_id']):
+            failures.append(f"{expected['job_id']} url: got {job['url']!r}")
+
+    if result['has_next'] is not True:
+        failures.append(f"has_next: expected True, got {result['has_next']!r}")
+
+    if failures:
+        print(f"   ✗ {label}")
+        for failure in failures:
+            print(f"      - {failure}")
+        return False
+
+    print(f"   ✓ {label}: {len(jobs)} jobs")
+    return True
+
+
+def test_parse_file():
+    """Parse the fixture the way debug dumps are parsed"""
+    print("[1/3] Parsing fixture file...")
+    return check_jobs(parse_search_results_file(FIXTURE), "parse_search_results_file")
+
+
+def test_parse_small_chunks():
+    """Feed the fixture in tiny chunks so tags and text are split across reads"""
+    print("[2/3] Parsing fixture in 7-character chunks...")
+    return check_jobs(parse_search_results_file(FIXTURE, chunk_size=7), "chunked parse")
+
+
+def test_last_page():
+    """A disabled Next button means there are no more pages"""
+    print("[3/3] Checking last-page detection...")
+    html = FIXTURE.read_text(encoding='utf-8').replace(
+        'aria-label="Next" class="pagination-next"',
+        'aria-label="Next" aria-disabled="true" class="pagination-next disabled"'
+    )
+    result = parse_search_results(html)
+    if result['has_next'] is False and len(result['jobs']) == len(EXPECTED_JOBS):
+        print("   ✓ has_next is False on the last page")
+        return True
+
+    print(f"   ✗ has_next: expected False, got {result['has_next']!r}")
+    return False
+
+
+def main():
+    """Run all tests"""
+    print("=" * 70)
+    print("Dice Search Results Parser Test")
+    print("=" * 70)
+    print()
+
+    results = [test_parse_file(), test_parse_small_chunks(), test_last_page()]
+
+    print()
+    if all(results):
+        print("✓ All parser tests passed")
+        return 0
+
+    print("✗ Parser tests failed - update the fixture if the Dice markup changed")
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,65 @@
+import logging
+import math
+import random
+from typing import List, Tuple
+
+from crawl_state import CrawlStateStore
+
+
+class TitleScheduler:
+    """UCB1 bandit that splits each cycle's page budget across search titles by observed yield"""
+
+    def __init__(self, crawl_state: CrawlStateStore, pages_per_cycle: int = 30,
+                 max_pages_per_title: int = 50, exploration: float = 0.3):
+        self.logger = logging.getLogger(__name__)
+        self.crawl_state = crawl_state
+        self.pages_per_cycle = pages_per_cycle
+        self.max_pages_per_title = max_pages_per_title
+        self.exploration = exploration
+
+    def score(self, title: str, total_pages: int) -> float:
+        """Upper confidence bound of a title's per-page reward (inf for untried titles)"""
+        stats = self.crawl_state.get_title_stats(title)
+        pages = stats['pages_crawled']
+        if not pages:
+            return math.inf
+
+        bonus = self.exploration * math.sqrt(2 * math.log(max(2, total_pages)) / pages)
+        return stats['mean_reward'] + bonus
+
+    def plan_cycle(self, titles: List[str]) -> List[Tuple[str, int]]:
+        """Return (title, page_budget) pairs for one cycle, best titles first
+
+        Every title gets at least one page so its statistics keep updating;
+        the rest of the budget is split in proportion to the UCB scores.
+        """
+        if not titles:
+            return []
+
+        total_pages = sum(self.crawl_state.get_title_stats(t)['pages_crawled'] for t in titles)
+        scores = {title: self.score(title, total_pages) for title in titles}
+
+        untried = [t for t in titles if math.isinf(scores[t])]
+        fair_share = max(1, self.pages_per_cycle // len(titles))
+        spare_budget = max(0, self.pages_per_cycle - fair_share * len(untried) - (len(titles) - len(untried)))
+        finite_total = sum(scores[t] for t in titles if t not in untried)
+
+        budgets = {}
+        for title in titles:
+            if title in untried:
+                pages = fair_share
+            elif finite_total > 0:
+                pages = 1 + round(spare_budget * scores[title] / finite_total)
+            else:
+                pages = 1
+            budgets[title] = min(self.max_pages_per_title, pages)
+
+        order = list(titles)
+        random.shuffle(order)  # Random tie-break between equal scores
+        order.sort(key=lambda t: scores[t], reverse=True)
+
+        plan = [(title, budgets[title]) for title in order]
+        self.logger.info("Title plan for this cycle: " + ", ".join(
+            f"{title}={pages}p" for title, pages in plan
+        ))
+        return plan
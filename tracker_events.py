@@ -0,0 +1,159 @@
+import copy
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+# Event types of the application lifecycle
+FOUND = 'found'
+CLAIMED = 'claimed'
+RELEASED = 'released'
+RESUME_GENERATED = 'resume_generated'
+APPLIED = 'applied'
+FAILED = 'failed'
+SKIPPED = 'skipped'
+# Snapshot events carry aggregates that predate the log or were recomputed from rows
+BASELINE = 'baseline'
+ROLLUP_SNAPSHOT = 'rollup_snapshot'
+
+# Tracker status -> lifecycle event type
+STATUS_EVENTS = {
+    'success': APPLIED,
+    'failed': FAILED,
+    'skipped': SKIPPED
+}
+
+# Application status -> (total counter, daily counter)
+STATUS_COUNTERS = {
+    'success': ('successful_applications', 'successful'),
+    'failed': ('failed_applications', 'failed'),
+    'skipped': ('skipped_applications', 'skipped')
+}
+
+
+def empty_statistics() -> Dict:
+    """Statistics projection before any event has been applied"""
+    return {
+        'total_jobs_found': 0,
+        'total_applications': 0,
+        'successful_applications': 0,
+        'failed_applications': 0,
+        'skipped_applications': 0,
+        'resumes_generated': 0,
+        'daily_stats': {},
+        'title_stats': {},
+        'company_stats': {},
+        'failure_reasons': {},
+        'events_offset': 0,
+        'last_updated': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    }
+
+
+def get_day_stats(stats: Dict, date: str) -> Dict:
+    """A day's counters within a statistics dict, created on first use"""
+    daily_stats = stats.setdefault('daily_stats', {})
+    if date not in daily_stats:
+        daily_stats[date] = {
+            'jobs_found': 0,
+            'applications': 0,
+            'successful': 0,
+            'failed': 0,
+            'skipped': 0
+        }
+    return daily_stats[date]
+
+
+def apply_event(stats: Dict, event: Dict) -> None:
+    """Fold one lifecycle event into the statistics projection"""
+    event_type = event.get('type')
+
+    if event_type == BASELINE:
+        offset = stats.get('events_offset', 0)
+        stats.clear()
+        stats.update(empty_statistics())
+        stats.update(copy.deepcopy(event.get('stats', {})))
+        stats['events_offset'] = offset
+        return
+
+    if event_type == ROLLUP_SNAPSHOT:
+        stats['title_stats'] = copy.deepcopy(event.get('title_stats', {}))
+        stats['company_stats'] = copy.deepcopy(event.get('company_stats', {}))
+        return
+
+    day_stats = get_day_stats(stats, event.get('ts', '')[:10])
+
+    if event_type == FOUND:
+        stats['total_jobs_found'] = stats.get('total_jobs_found', 0) + 1
+        day_stats['jobs_found'] += 1
+
+    elif event_type == RESUME_GENERATED:
+        stats['resumes_generated'] = stats.get('resumes_generated', 0) + 1
+        day_stats['resumes_generated'] = day_stats.get('resumes_generated', 0) + 1
+
+    elif event_type in (APPLIED, FAILED, SKIPPED):
+        status = event.get('status', '')
+        stats['total_applications'] = stats.get('total_applications', 0) + 1
+        day_stats['applications'] += 1
+        if status in STATUS_COUNTERS:
+            total_key, daily_key = STATUS_COUNTERS[status]
+            stats[total_key] = stats.get(total_key, 0) + 1
+            day_stats[daily_key] += 1
+
+        title_counts = stats.setdefault('title_stats', {}).setdefault(event.get('title', ''), {})
+        title_counts['total'] = title_counts.get('total', 0) + 1
+        if status in STATUS_COUNTERS:
+            title_counts[status] = title_counts.get(status, 0) + 1
+        company_stats = stats.setdefault('company_stats', {})
+        company = event.get('company', '')
+        company_stats[company] = company_stats.get(company, 0) + 1
+
+        if event_type == FAILED and event.get('reason'):
+            reasons = stats.setdefault('failure_reasons', {})
+            reasons[event['reason']] = reasons.get(event['reason'], 0) + 1
+
+
+class EventLog:
+    """Append-only JSON-lines log of application lifecycle events
+
+    Callers hold the tracker lock around appends and reads, so a partial last
+    line can only be left by a crash and is truncated away on the next read.
+    """
+
+    def __init__(self, log_file: Path):
+        self.log_file = log_file
+        self.log_file.parent.mkdir(parents=True, exist_ok=True)
+
+    def exists(self) -> bool:
+        return self.log_file.exists()
+
+    def append(self, events: List[Dict]) -> int:
+        """Append events and return the new end offset of the log"""
+        with open(self.log_file, 'ab') as f:
+            for event in events:
+                f.write(json.dumps(event, separators=(',', ':')).encode('utf-8') + b'\n')
+            f.flush()
+            os.fsync(f.fileno())
+            return f.tell()
+
+    def read_from(self, offset: int) -> Iterator[Tuple[Dict, int]]:
+        """Yield (event, end_offset) pairs for every complete event after offset"""
+        if not self.log_file.exists():
+            return
+
+        with open(self.log_file, 'r+b') as f:
+            if offset > os.fstat(f.fileno()).st_size:
+                offset = 0  # The log was replaced; replay it from the start
+            f.seek(offset)
+            for line in f:
+                if not line.endswith(b'\n'):
+                    f.truncate(offset)
+                    print(f"Dropped a torn event at the end of {self.log_file.name}")
+                    return
+                offset += len(line)
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    print(f"Skipping unreadable event in {self.log_file.name}")
+                    continue
+                yield event, offset
@@ -2,8 +2,10 @@ from flask import Flask, redirect, url_for, render_template
 from config import config
 from extensions import db, login_manager, migrate
 from models.user import User
+from services.user_cache import load_identity
 from sqlalchemy.exc import OperationalError, DBAPIError
 import logging
+import os
 
 def create_app(config_name='development'):
     """Application factory pattern"""
@@ -18,7 +20,16 @@ def create_app(config_name='development'):
     # User loader for Flask-Login
     @login_manager.user_loader
     def load_user(user_id):
-        return User.query.get(int(user_id))
+        # Served from a short-lived identity snapshot; the row loads only when needed
+        return load_identity(user_id)
+
+    # Picks the smallest resized profile picture for a display size
+    from services.profile_images import avatar_variant
+    app.add_template_filter(avatar_variant)
+
+    # Per-request query counting
+    from services.query_budget import init_query_budget
+    init_query_budget(app)
 
     # Register blueprints
     from routes.auth import auth_bp
@@ -29,6 +40,23 @@ def create_app(config_name='development'):
     app.register_blueprint(main_bp)
     app.register_blueprint(dashboard_bp)
 
+    # Full-text index behind the dashboard search
+    from services.search_index import init_search_index
+    init_search_index(app)
+
+    # Background workers; skipped in the debug reloader's parent process, which
+    # serves no requests (the email sender also starts on first use if skipped)
+    run_workers = not app.debug or os.environ.get('WERKZEUG_RUN_MAIN') == 'true'
+    if app.config.get('RESUME_WORKER_ENABLED') and run_workers:
+        from services.resume_worker import get_resume_worker
+        get_resume_worker(app).start()
+    if app.config.get('EMAIL_SENDER_ENABLED') and run_workers:
+        from services.email_outbox import get_email_sender
+        get_email_sender(app).start()
+    if app.config.get('ADMIN_STATS_RECONCILE_HOURS') and run_workers:
+        from services.admin_stats import get_stats_reconciler
+        get_stats_reconciler(app).start()
+
     # Error handlers
     @app.errorhandler(404)
     def not_found_error(error):
@@ -40,10 +40,41 @@ class Config:
     MAIL_USERNAME = os.environ.get('MAIL_USERNAME')
     MAIL_PASSWORD = os.environ.get('MAIL_PASSWORD')
 
+    # Outbox delivery; auth endpoints only queue emails, the sender delivers them
+    EMAIL_SENDER_ENABLED = os.environ.get('EMAIL_SENDER_ENABLED', 'true').lower() in ['true', 'on', '1']
+    EMAIL_BATCH_SIZE = int(os.environ.get('EMAIL_BATCH_SIZE') or 20)
+    EMAIL_MAX_ATTEMPTS = int(os.environ.get('EMAIL_MAX_ATTEMPTS') or 5)
+
     # Application configuration
     ITEMS_PER_PAGE = 20
     MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB max file upload
 
+    # File storage for profile pictures and generated documents: auto, local, supabase or drive
+    STORAGE_BACKEND = os.environ.get('STORAGE_BACKEND', 'auto').lower()
+    STORAGE_LOCAL_ROOT = os.environ.get('STORAGE_LOCAL_ROOT')  # defaults to instance/storage
+    STORAGE_SIGNED_URL_TTL = int(os.environ.get('STORAGE_SIGNED_URL_TTL') or 3600)  # seconds
+    SUPABASE_DOCUMENTS_BUCKET = os.environ.get('SUPABASE_DOCUMENTS_BUCKET')  # private bucket; unset keeps documents local
+
+    # Background resume generation (run_resume_worker.py, or in-process when enabled)
+    RESUME_WORKER_ENABLED = os.environ.get('RESUME_WORKER_ENABLED', 'false').lower() in ['true', 'on', '1']
+    RESUME_WORKER_CONCURRENCY = int(os.environ.get('RESUME_WORKER_CONCURRENCY') or 2)
+    RESUME_WORKER_POLL_INTERVAL = float(os.environ.get('RESUME_WORKER_POLL_INTERVAL') or 2)
+    RESUME_WORKER_TIMEOUT = int(os.environ.get('RESUME_WORKER_TIMEOUT') or 600)  # seconds per resume
+
+    # SQL statements a request may run before it is reported as a likely N+1
+    QUERY_BUDGET = int(os.environ.get('QUERY_BUDGET') or 20)
+    QUERY_BUDGET_STRICT = os.environ.get('QUERY_BUDGET_STRICT', 'false').lower() in ['true', 'on', '1']
+
+    # Bot tracker shared with sync_tracker.py; must match TRACKER_BACKEND and
+    # TRACKER_MIRROR_CSV in the bot's config.py
+    TRACKER_DATA_DIR = os.environ.get('TRACKER_DATA_DIR') or os.path.join(os.path.dirname(basedir), 'data')
+    TRACKER_BACKEND = os.environ.get('TRACKER_BACKEND', 'csv').lower()
+    TRACKER_MIRROR_CSV = os.environ.get('TRACKER_MIRROR_CSV', 'true').lower() in ['true', 'on', '1']
+
+    # Admin dashboard counters are rebuilt from the tables in the background at least
+    # this often (0 disables it; reconcile_stats.py can then run from cron)
+    ADMIN_STATS_RECONCILE_HOURS = int(os.environ.get('ADMIN_STATS_RECONCILE_HOURS') or 24)
+
 class DevelopmentConfig(Config):
     """Development configuration"""
     DEBUG = True
@@ -5,6 +5,9 @@ Run this if you get "relation does not exist" errors
 from app import create_app
 from extensions import db
 from models.user import User, JobDescription, Resume, Application
+from models.sync import SyncWatermark
+from models.stats import DailyStat
+from models.email import EmailOutbox
 
 def create_all_tables():
     """Create all database tables"""
@@ -20,6 +23,9 @@ def create_all_tables():
             print("  - job_descriptions")
             print("  - resumes")
             print("  - applications")
+            print("  - sync_watermarks")
+            print("  - daily_stats")
+            print("  - email_outbox")
 
             # Verify tables exist
             inspector = db.inspect(db.engine)
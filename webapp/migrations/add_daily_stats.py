@@ -0,0 +1,39 @@
+"""
+Migration script to add the daily_stats table behind the admin dashboard counters
+Creates the table (and sync_watermarks, which records the last rebuild) and fills it
+Run this script to update the database schema
+"""
+
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from extensions import db
+from app import create_app
+from models.stats import DailyStat
+from models.sync import SyncWatermark
+
+def add_daily_stats():
+    """Create daily_stats and build its counters from the source tables"""
+    app = create_app()
+    with app.app_context():
+        try:
+            with db.engine.begin() as connection:
+                for model in (SyncWatermark, DailyStat):
+                    model.__table__.create(connection, checkfirst=True)
+                    print(f"[SUCCESS] Table {model.__tablename__} is present")
+        except Exception as e:
+            print(f"[ERROR] Failed to create daily_stats table: {e}")
+            return
+
+        from services.admin_stats import reconcile_daily_stats
+        try:
+            rows = reconcile_daily_stats()
+            print(f"[SUCCESS] Built {rows} daily counter rows")
+        except Exception as e:
+            print(f"[ERROR] Failed to build daily counters: {e}")
+
+if __name__ == '__main__':
+    add_daily_stats()
@@ -0,0 +1,38 @@
+"""
+Migration script to add the indexes behind keyset-paginated listings
+Run this script to update the database schema
+"""
+
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from extensions import db
+from app import create_app
+
+INDEXES = [
+    ('ix_users_created_at', 'users', 'created_at'),
+    ('ix_job_descriptions_user_created', 'job_descriptions', 'user_id, created_at'),
+    ('ix_resumes_user_created', 'resumes', 'user_id, created_at'),
+    ('ix_applications_user_created', 'applications', 'user_id, created_at'),
+]
+
+def add_listing_indexes():
+    """Create the (user_id, created_at) listing indexes"""
+    app = create_app()
+    with app.app_context():
+        try:
+            with db.engine.connect() as connection:
+                for name, table, columns in INDEXES:
+                    connection.execute(db.text(
+                        f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({columns})"
+                    ))
+                    print(f"[SUCCESS] Index {name} on {table}({columns})")
+                connection.commit()
+        except Exception as e:
+            print(f"[ERROR] Failed to create listing indexes: {e}")
+
+if __name__ == '__main__':
+    add_listing_indexes()
@@ -0,0 +1,32 @@
+"""
+Migration script to add started_at to the resumes table
+The resume worker records when it claimed a resume, so workers in other
+processes only requeue resumes whose worker has stopped
+Run this script to update the database schema
+"""
+
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from extensions import db
+from app import create_app
+
+def add_resume_started_at():
+    """Add started_at column to resumes table"""
+    app = create_app()
+    with app.app_context():
+        try:
+            with db.engine.connect() as connection:
+                connection.execute(db.text(
+                    "ALTER TABLE resumes ADD COLUMN started_at TIMESTAMP"
+                ))
+                connection.commit()
+            print("[SUCCESS] Successfully added started_at field to resumes table")
+        except Exception as e:
+            print(f"[WARNING] Migration may have already been applied or error occurred: {e}")
+
+if __name__ == '__main__':
+    add_resume_started_at()
@@ -0,0 +1,84 @@
+"""
+Migration script to make job_descriptions.job_id unique per user instead of globally
+Bot syncs for several users can then hold the same Dice job; applications that were
+linked to another user's job description get a copy owned by their own user
+Run this script to update the database schema
+"""
+
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from extensions import db
+from app import create_app
+
+def scope_job_ids_by_user():
+    """Replace the global job_id unique index with a (user_id, job_id) one"""
+    app = create_app()
+    with app.app_context():
+        try:
+            with db.engine.begin() as connection:
+                if connection.dialect.name == 'postgresql':
+                    # Tables created from SQL carry a named constraint instead of the index
+                    connection.execute(db.text(
+                        "ALTER TABLE job_descriptions DROP CONSTRAINT IF EXISTS job_descriptions_job_id_key"
+                    ))
+                connection.execute(db.text("DROP INDEX IF EXISTS ix_job_descriptions_job_id"))
+                connection.execute(db.text(
+                    "CREATE INDEX IF NOT EXISTS ix_job_descriptions_job_id ON job_descriptions (job_id)"
+                ))
+                connection.execute(db.text(
+                    "CREATE UNIQUE INDEX IF NOT EXISTS uq_job_descriptions_user_job "
+                    "ON job_descriptions (user_id, job_id)"
+                ))
+            print("[SUCCESS] job_descriptions.job_id is now unique per user")
+        except Exception as e:
+            print(f"[ERROR] Failed to update job_descriptions indexes: {e}")
+            return
+
+        try:
+            repaired = relink_foreign_applications()
+            print(f"[SUCCESS] Relinked {repaired} applications to their own user's job descriptions")
+        except Exception as e:
+            db.session.rollback()
+            print(f"[ERROR] Failed to relink applications: {e}")
+
+def relink_foreign_applications():
+    """Point applications at a job description owned by the same user, copying it if needed"""
+    from models.user import Application, JobDescription
+
+    applications = Application.query.join(
+        JobDescription, Application.job_id == JobDescription.id
+    ).filter(Application.user_id != JobDescription.user_id).all()
+
+    copies = {}
+    for application in applications:
+        job = application.job
+        key = (application.user_id, job.job_id)
+        if key not in copies:
+            copies[key] = JobDescription.query.filter_by(
+                user_id=application.user_id, job_id=job.job_id
+            ).first()
+        if copies[key] is None:
+            copies[key] = JobDescription(
+                user_id=application.user_id,
+                job_id=job.job_id,
+                title=job.title,
+                company=job.company,
+                location=job.location,
+                description=job.description,
+                skills=job.skills,
+                source_type=job.source_type,
+                source_url=job.source_url
+            )
+            db.session.add(copies[key])
+            db.session.flush()
+        application.job_id = copies[key].id
+
+    db.session.commit()
+    return len(applications)
+
+if __name__ == '__main__':
+    scope_job_ids_by_user()
@@ -1,3 +1,6 @@
 from .user import User, JobDescription, Resume, Application
+from .sync import SyncWatermark
+from .stats import DailyStat
+from .email import EmailOutbox
 
-__all__ = ['User', 'JobDescription', 'Resume', 'Application']
+__all__ = ['User', 'JobDescription', 'Resume', 'Application', 'SyncWatermark', 'DailyStat', 'EmailOutbox']
@@ -51,6 +51,10 @@ class Admin(UserMixin, db.Model):
         self.last_login = datetime.utcnow()
         db.session.commit()
 
+    def get_id(self):
+        """Session id, prefixed so the user loader can tell admins from users"""
+        return f"admin_{self.id}"
+
     @property
     def is_admin(self):
         """Always True for admin model"""
@@ -0,0 +1,34 @@
+"""
+Email outbox model - messages waiting for background delivery
+"""
+from datetime import datetime
+from extensions import db
+
+
+class EmailOutbox(db.Model):
+    """Rendered email queued by a request and delivered by the email sender"""
+
+    __tablename__ = 'email_outbox'
+    __table_args__ = (
+        db.Index('ix_email_outbox_status_next_attempt', 'status', 'next_attempt_at'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    to_email = db.Column(db.String(120), nullable=False)
+    subject = db.Column(db.String(200), nullable=False)
+    html_body = db.Column(db.Text, nullable=False)
+    text_body = db.Column(db.Text)
+    kind = db.Column(db.String(50))  # 'verification_code', 'password_reset'
+
+    # Delivery state
+    status = db.Column(db.String(20), default='pending')  # pending, sending, sent, failed
+    attempts = db.Column(db.Integer, default=0)
+    next_attempt_at = db.Column(db.DateTime, default=datetime.utcnow)
+    last_error = db.Column(db.Text)
+    provider = db.Column(db.String(20))
+
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    sent_at = db.Column(db.DateTime)
+
+    def __repr__(self):
+        return f'<EmailOutbox {self.id} {self.kind} to {self.to_email} - {self.status}>'
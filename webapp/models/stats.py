@@ -0,0 +1,24 @@
+"""
+Daily stats model - pre-aggregated counters for the admin dashboard
+"""
+from datetime import datetime
+from extensions import db
+
+
+class DailyStat(db.Model):
+    """Number of rows of an entity created on a day that currently have a status
+
+    Totals are the sum over all days, so admin pages read O(days) rows instead
+    of counting whole tables.
+    """
+
+    __tablename__ = 'daily_stats'
+
+    day = db.Column(db.Date, primary_key=True)
+    entity = db.Column(db.String(20), primary_key=True)  # 'user', 'application', 'resume', 'job'
+    status = db.Column(db.String(20), primary_key=True, default='')
+    count = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def __repr__(self):
+        return f'<DailyStat {self.day} {self.entity}/{self.status}={self.count}>'
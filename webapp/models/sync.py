@@ -0,0 +1,33 @@
+"""
+Sync watermark model - progress markers for incremental data syncs
+"""
+from datetime import datetime
+from extensions import db
+
+
+class SyncWatermark(db.Model):
+    """Last position processed by an incremental sync stage"""
+
+    __tablename__ = 'sync_watermarks'
+
+    name = db.Column(db.String(100), primary_key=True)
+    value = db.Column(db.String(100), nullable=False, default='0')
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    @classmethod
+    def get_value(cls, name, default='0'):
+        """Return a watermark value, or default if the stage never ran"""
+        watermark = db.session.get(cls, name)
+        return watermark.value if watermark else default
+
+    @classmethod
+    def set_value(cls, name, value):
+        """Stage a watermark update in the current transaction"""
+        watermark = db.session.get(cls, name)
+        if watermark is None:
+            watermark = cls(name=name)
+            db.session.add(watermark)
+        watermark.value = str(value)
+
+    def __repr__(self):
+        return f'<SyncWatermark {self.name}={self.value}>'
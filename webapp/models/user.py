@@ -7,6 +7,9 @@ class User(UserMixin, db.Model):
     """User model for authentication and profile management"""
 
     __tablename__ = 'users'
+    __table_args__ = (
+        db.Index('ix_users_created_at', 'created_at'),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     supabase_user_id = db.Column(db.String(255), unique=True, index=True)  # UUID from Supabase Auth
@@ -81,10 +84,15 @@ class JobDescription(db.Model):
     """Job description model"""
 
     __tablename__ = 'job_descriptions'
+    __table_args__ = (
+        db.Index('ix_job_descriptions_user_created', 'user_id', 'created_at'),
+        # Two users can hold the same posting; each gets their own row
+        db.Index('uq_job_descriptions_user_job', 'user_id', 'job_id', unique=True),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
-    job_id = db.Column(db.String(64), unique=True, nullable=False, index=True)
+    job_id = db.Column(db.String(64), nullable=False, index=True)
 
     title = db.Column(db.String(200), nullable=False)
     company = db.Column(db.String(200))
@@ -109,6 +117,9 @@ class Resume(db.Model):
     """Resume model"""
 
     __tablename__ = 'resumes'
+    __table_args__ = (
+        db.Index('ix_resumes_user_created', 'user_id', 'created_at'),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
@@ -132,6 +143,9 @@ class Application(db.Model):
     """Application tracking model"""
 
     __tablename__ = 'applications'
+    __table_args__ = (
+        db.Index('ix_applications_user_created', 'user_id', 'created_at'),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
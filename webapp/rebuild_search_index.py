@@ -0,0 +1,29 @@
+"""
+Rebuild the full-text index behind the dashboard search
+Run after restoring a database or if search results look out of date
+"""
+from app import create_app
+from extensions import db
+
+def rebuild_search():
+    """Repopulate search_documents from resumes, jobs and applications"""
+    app = create_app()
+
+    with app.app_context():
+        from services import search_index
+        if not search_index.is_available():
+            print("[ERROR] Full-text search is not available for this database")
+            return False
+
+        try:
+            count = search_index.rebuild_search_index()
+            print(f"[OK] Indexed {count} documents")
+        except Exception as e:
+            db.session.rollback()
+            print(f"[ERROR] Failed to rebuild search index: {e}")
+            return False
+
+    return True
+
+if __name__ == '__main__':
+    rebuild_search()
@@ -0,0 +1,27 @@
+"""
+Rebuild the admin dashboard's daily counters from the source tables
+Schedule it (e.g. nightly cron) to correct drift from writes that bypass the ORM
+"""
+from app import create_app
+from extensions import db
+
+def reconcile_stats():
+    """Recompute the daily_stats table"""
+    app = create_app()
+
+    with app.app_context():
+        # Make sure the counters table exists
+        db.create_all()
+
+        from services.admin_stats import reconcile_daily_stats
+        try:
+            rows = reconcile_daily_stats()
+            print(f"[OK] Rebuilt {rows} daily counter rows")
+        except Exception as e:
+            print(f"[ERROR] Failed to rebuild daily counters: {e}")
+            return False
+
+    return True
+
+if __name__ == '__main__':
+    reconcile_stats()
@@ -41,8 +41,8 @@ def login():
             # Store email in session
             session['pending_verification_email'] = user.email
 
-            # Send verification email
-            email_result = email_service.send_verification_code(user.email, code)
+            # Queue verification email (delivered by the background email sender)
+            email_result = email_service.queue_verification_code(user.email, code)
             if not email_result['success']:
                 print(f"[WARNING] Failed to send email: {email_result['message']}")
                 # Still show the code in console as fallback
@@ -145,8 +145,8 @@ def register():
             # Store email in session for verification
             session['pending_verification_email'] = user.email
 
-            # Send verification email
-            email_result = email_service.send_verification_code(user.email, code)
+            # Queue verification email (delivered by the background email sender)
+            email_result = email_service.queue_verification_code(user.email, code)
             if not email_result['success']:
                 print(f"[WARNING] Failed to send email: {email_result['message']}")
                 # Still show the code in console as fallback
@@ -768,8 +768,8 @@ def resend_verification_code():
     code = user.generate_verification_code()
     db.session.commit()
 
-    # Send verification email
-    email_result = email_service.send_verification_code(user.email, code)
+    # Queue verification email (delivered by the background email sender)
+    email_result = email_service.queue_verification_code(user.email, code)
     if not email_result['success']:
         print(f"[WARNING] Failed to send email: {email_result['message']}")
         # Still show the code in console as fallback
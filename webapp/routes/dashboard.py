@@ -1,10 +1,21 @@
-from flask import Blueprint, render_template, redirect, url_for, flash, request, jsonify
+from flask import Blueprint, render_template, redirect, url_for, flash, request, jsonify, current_app
 from flask_login import login_required, current_user
 from functools import wraps
 from extensions import db
 from models.user import User, JobDescription, Resume, Application
 from datetime import datetime, timedelta
 from sqlalchemy import func
+from services.dashboard_stats import get_index_stats, get_analytics_stats
+from services.admin_stats import get_admin_stats
+from services.pagination import page_args, keyset_paginate
+from services import search_index
+from services.queries import (user_applications_query, recent_applications_query,
+                              user_resumes_query, application_search_query)
+from services.query_budget import query_budget
+
+# Views that render related rows run a fixed number of queries; a per-row
+# relationship load (N+1) pushes them over this budget
+LIST_VIEW_QUERY_BUDGET = 10
 
 dashboard_bp = Blueprint('dashboard', __name__, url_prefix='/dashboard')
 
@@ -16,15 +27,8 @@ def admin_required(f):
             flash('Please log in to access this page.', 'error')
             return redirect(url_for('admin_auth.login'))
 
-        # Check if user is from Admin table
-        from models.admin import Admin
-        is_admin = isinstance(current_user._get_current_object(), Admin)
-
-        # Backwards compatibility: check is_admin flag
-        if not is_admin and hasattr(current_user, 'is_admin'):
-            is_admin = current_user.is_admin
-
-        if not is_admin:
+        # Admin rows and users with the is_admin flag both carry is_admin in their cached identity
+        if not getattr(current_user, 'is_admin', False):
             flash('You do not have permission to access this page.', 'error')
             return redirect(url_for('dashboard.user_index'))
         return f(*args, **kwargs)
@@ -38,54 +42,35 @@ def admin_required(f):
 @login_required
 def index():
     """Main dashboard - redirects based on user type"""
-    # Check if logged in user is from Admin table
-    from models.admin import Admin
-    if isinstance(current_user._get_current_object(), Admin):
-        return redirect(url_for('dashboard.admin_index'))
-    # Check if user has is_admin flag (backwards compatibility)
-    elif hasattr(current_user, 'is_admin') and current_user.is_admin:
+    # Admins (Admin rows, or users with the is_admin flag)
+    if getattr(current_user, 'is_admin', False):
         return redirect(url_for('dashboard.admin_index'))
     # Regular user
     return redirect(url_for('dashboard.user_index'))
 
 @dashboard_bp.route('/user')
 @login_required
+@query_budget(LIST_VIEW_QUERY_BUDGET)
 def user_index():
     """User dashboard homepage with tabs"""
-    # Get user statistics
-    stats = {
-        'total_jobs': current_user.job_descriptions.count(),
-        'total_resumes': current_user.resumes.count(),
-        'total_applications': current_user.applications.count(),
-        'active_applications': current_user.applications.filter(
-            Application.status.in_(['applied', 'interview'])
-        ).count()
-    }
+    # Statistics and status breakdown come from one cached aggregate query
+    index_stats = get_index_stats(current_user.id)
 
     # Get recent applications
-    recent_applications = current_user.applications.order_by(
-        Application.created_at.desc()
-    ).limit(10).all()
-
-    # Get application status breakdown
-    status_breakdown = db.session.query(
-        Application.status,
-        func.count(Application.id)
-    ).filter(
-        Application.user_id == current_user.id
-    ).group_by(Application.status).all()
+    recent_applications = user_applications_query(current_user.id).limit(10).all()
 
     return render_template('dashboard/user/index_tabs.html',
-                         stats=stats,
+                         stats=index_stats['stats'],
                          recent_applications=recent_applications,
-                         status_breakdown=dict(status_breakdown))
+                         status_breakdown=index_stats['status_breakdown'])
 
 @dashboard_bp.route('/user/resumes')
 @login_required
 def user_resumes():
     """User resumes management page"""
-    resumes = current_user.resumes.order_by(Resume.created_at.desc()).all()
-    return render_template('dashboard/user/resumes.html', resumes=resumes)
+    cursor, per_page = page_args()
+    page = keyset_paginate(user_resumes_query(current_user.id), Resume, cursor, per_page)
+    return render_template('dashboard/user/resumes.html', resumes=page.items, page=page)
 
 @dashboard_bp.route('/user/resume-builder')
 @login_required
@@ -101,21 +86,81 @@ def user_resume_builder():
 
     return render_template('dashboard/user/resume_builder.html', job=job)
 
+@dashboard_bp.route('/user/resumes/generate', methods=['POST'])
+@login_required
+def generate_resume():
+    """Queue a tailored resume for one of the user's jobs; the resume worker generates it"""
+    job_id = request.form.get('job_id') or (request.get_json(silent=True) or {}).get('job_id')
+    job = JobDescription.query.filter_by(id=job_id, user_id=current_user.id).first()
+    if not job:
+        return jsonify({'success': False, 'error': 'Job not found'}), 404
+
+    resume = Resume(
+        user_id=current_user.id,
+        job_id=job.id,
+        title=f'{job.title} - {job.company}' if job.company else job.title,
+        status='pending'
+    )
+    db.session.add(resume)
+    db.session.commit()
+
+    from services.resume_worker import get_resume_worker
+    worker = get_resume_worker()
+    if worker:
+        worker.notify()
+
+    return jsonify({'success': True, 'id': resume.id, 'status': resume.status}), 202
+
+@dashboard_bp.route('/user/resumes/<int:resume_id>/status')
+@login_required
+def resume_status(resume_id):
+    """Generation status of one of the user's resumes, for polling"""
+    resume = Resume.query.filter_by(id=resume_id, user_id=current_user.id).first_or_404()
+    return jsonify({
+        'id': resume.id,
+        'status': resume.status,
+        'error': resume.error_message,
+        'file_type': resume.file_type,
+        'completed_at': resume.completed_at.isoformat() if resume.completed_at else None
+    })
+
+@dashboard_bp.route('/user/resumes/<int:resume_id>/download')
+@login_required
+def download_resume(resume_id):
+    """Download one of the user's generated resumes from document storage"""
+    from werkzeug.utils import secure_filename
+    from services.storage import document_response
+
+    resume = Resume.query.filter_by(id=resume_id, user_id=current_user.id).first_or_404()
+    if resume.status != 'completed' or not resume.file_path:
+        flash('This resume is not ready for download yet.', 'warning')
+        return redirect(url_for('dashboard.user_resumes'))
+
+    download_name = secure_filename(f"{resume.title}.{resume.file_type or 'docx'}")
+    try:
+        return document_response(resume.file_path, download_name)
+    except Exception as e:
+        print(f"[ERROR] Could not serve resume {resume.id}: {e}")
+        flash('The resume file could not be found.', 'error')
+        return redirect(url_for('dashboard.user_resumes'))
+
 @dashboard_bp.route('/user/applications')
 @login_required
+@query_budget(LIST_VIEW_QUERY_BUDGET)
 def user_applications():
     """Application tracking page"""
-    applications = current_user.applications.order_by(
-        Application.created_at.desc()
-    ).all()
+    cursor, per_page = page_args()
+    page = keyset_paginate(user_applications_query(current_user.id), Application, cursor, per_page)
     return render_template('dashboard/user/applications.html',
-                         applications=applications)
+                         applications=page.items,
+                         page=page)
 
 @dashboard_bp.route('/user/applications/kanban')
 @login_required
+@query_budget(LIST_VIEW_QUERY_BUDGET)
 def user_applications_kanban():
     """Kanban board view for applications"""
-    applications = current_user.applications.all()
+    applications = user_applications_query(current_user.id).all()
 
     # Organize applications by status
     kanban_data = {
@@ -136,54 +181,20 @@ def user_applications_kanban():
 @login_required
 def user_jobs():
     """Job descriptions management"""
-    jobs = current_user.job_descriptions.order_by(
-        JobDescription.created_at.desc()
-    ).all()
-    return render_template('dashboard/user/jobs.html', jobs=jobs)
+    cursor, per_page = page_args()
+    page = keyset_paginate(current_user.job_descriptions, JobDescription, cursor, per_page)
+    return render_template('dashboard/user/jobs.html', jobs=page.items, page=page)
 
 @dashboard_bp.route('/user/analytics')
 @login_required
 def user_analytics():
     """User statistics and analytics"""
-    # Calculate various statistics
-    stats = {
-        'total_applications': current_user.applications.count(),
-        'success_rate': 0,
-        'avg_response_time': 0,
-        'applications_this_month': 0,
-    }
-
-    # Calculate success rate
-    total = current_user.applications.count()
-    if total > 0:
-        successful = current_user.applications.filter(
-            Application.status.in_(['interview', 'offer'])
-        ).count()
-        stats['success_rate'] = (successful / total) * 100
-
-    # Applications this month
-    first_day_month = datetime.now().replace(day=1, hour=0, minute=0, second=0)
-    stats['applications_this_month'] = current_user.applications.filter(
-        Application.created_at >= first_day_month
-    ).count()
-
-    # Get monthly application data for charts
-    monthly_data = []
-    for i in range(6, 0, -1):
-        month_start = (datetime.now() - timedelta(days=30*i)).replace(day=1)
-        month_end = (month_start + timedelta(days=32)).replace(day=1)
-        count = current_user.applications.filter(
-            Application.created_at >= month_start,
-            Application.created_at < month_end
-        ).count()
-        monthly_data.append({
-            'month': month_start.strftime('%b'),
-            'count': count
-        })
+    # Counters and monthly chart data come from one cached aggregate query
+    analytics = get_analytics_stats(current_user.id)
 
     return render_template('dashboard/user/analytics.html',
-                         stats=stats,
-                         monthly_data=monthly_data)
+                         stats=analytics['stats'],
+                         monthly_data=analytics['monthly_data'])
 
 @dashboard_bp.route('/user/profile', methods=['GET', 'POST'])
 @login_required
@@ -215,57 +226,11 @@ def user_profile():
                     file_ext = file.filename.rsplit('.', 1)[1].lower() if '.' in file.filename else ''
 
                     if file_ext in allowed_extensions:
-                        import os
-                        from werkzeug.utils import secure_filename
-                        from services.supabase_storage import get_storage_service
-
-                        # Generate unique filename
-                        filename = f"user_{current_user.id}_{datetime.utcnow().timestamp()}.{file_ext}"
-                        filename = secure_filename(filename)
-
-                        # Get MIME type
-                        mime_types = {
-                            'png': 'image/png',
-                            'jpg': 'image/jpeg',
-                            'jpeg': 'image/jpeg',
-                            'gif': 'image/gif',
-                            'webp': 'image/webp'
-                        }
-                        mimetype = mime_types.get(file_ext, 'image/jpeg')
-
-                        # Try to upload to Supabase Storage first
-                        storage_service = get_storage_service()
-                        if storage_service.is_available():
-                            # Delete old profile picture from Supabase if exists
-                            if current_user.profile_picture and 'supabase' in current_user.profile_picture:
-                                old_filename = storage_service.get_filename_from_url(current_user.profile_picture)
-                                if old_filename:
-                                    storage_service.delete_file(old_filename)
-
-                            # Upload to Supabase Storage
-                            file_data = file.read()
-                            result = storage_service.upload_file(file_data, filename, mimetype)
-
-                            if result['success']:
-                                # Store Supabase Storage public URL
-                                current_user.profile_picture = result['public_url']
-                                flash('Profile picture uploaded successfully!', 'success')
-                            else:
-                                # Fallback to local storage
-                                file.seek(0)  # Reset file pointer
-                                upload_folder = os.path.join('webapp', 'static', 'uploads', 'profiles')
-                                os.makedirs(upload_folder, exist_ok=True)
-                                filepath = os.path.join(upload_folder, filename)
-                                file.save(filepath)
-                                current_user.profile_picture = f"uploads/profiles/{filename}"
-                                flash('Profile picture uploaded locally (Supabase Storage unavailable).', 'warning')
-                        else:
-                            # Fallback to local storage
-                            upload_folder = os.path.join('webapp', 'static', 'uploads', 'profiles')
-                            os.makedirs(upload_folder, exist_ok=True)
-                            filepath = os.path.join(upload_folder, filename)
-                            file.save(filepath)
-                            current_user.profile_picture = f"uploads/profiles/{filename}"
+                        from services.profile_images import submit_profile_picture
+
+                        # Resized and uploaded in the background; the old picture stays until then
+                        submit_profile_picture(current_app._get_current_object(), current_user.id, file, file_ext)
+                        flash('Your new profile picture is being processed and will appear shortly.', 'info')
                     else:
                         flash('Invalid file type. Please upload an image file (PNG, JPG, JPEG, GIF, WEBP).', 'error')
                         return redirect(url_for('dashboard.user_profile'))
@@ -352,28 +317,13 @@ def delete_profile_picture():
     """Delete user's profile picture"""
     try:
         if current_user.profile_picture:
-            import os
-            from services.supabase_storage import get_storage_service
-
-            # Check if it's a Supabase Storage URL
-            if 'supabase' in current_user.profile_picture:
-                # Delete from Supabase Storage
-                storage_service = get_storage_service()
-                if storage_service.is_available():
-                    filename = storage_service.get_filename_from_url(current_user.profile_picture)
-                    if filename:
-                        storage_service.delete_file(filename)
-                        flash('Profile picture deleted from Supabase Storage successfully!', 'success')
-                    else:
-                        flash('Could not extract filename from URL.', 'warning')
-                else:
-                    flash('Supabase Storage not available. Please try again later.', 'error')
+            from services.profile_images import delete_profile_picture_files
+
+            # Delete the picture and all of its resized variants
+            if delete_profile_picture_files(current_app._get_current_object(), current_user.profile_picture):
+                flash('Profile picture deleted successfully!', 'success')
             else:
-                # Delete from local storage
-                local_path = os.path.join('webapp', 'static', current_user.profile_picture)
-                if os.path.exists(local_path):
-                    os.remove(local_path)
-                    flash('Profile picture deleted successfully!', 'success')
+                flash('Some profile picture files could not be deleted from storage.', 'warning')
 
             # Remove from database
             current_user.profile_picture = None
@@ -398,30 +348,18 @@ def delete_account():
             flash('Account deletion cancelled. Confirmation text did not match.', 'warning')
             return redirect(url_for('dashboard.user_settings'))
 
-        import os
-        from services.supabase_storage import get_storage_service
+        from services.profile_images import delete_profile_picture_files
         from flask_login import logout_user
 
         user_id = current_user.id
         user_email = current_user.email
 
-        # Delete profile picture from storage if exists
+        # Delete profile picture and its resized variants from storage if exists
         if current_user.profile_picture:
-            if 'supabase' in current_user.profile_picture:
-                # Delete from Supabase Storage
-                storage_service = get_storage_service()
-                if storage_service.is_available():
-                    filename = storage_service.get_filename_from_url(current_user.profile_picture)
-                    if filename:
-                        storage_service.delete_file(filename)
-            else:
-                # Delete from local storage
-                local_path = os.path.join('webapp', 'static', current_user.profile_picture)
-                if os.path.exists(local_path):
-                    os.remove(local_path)
+            delete_profile_picture_files(current_app._get_current_object(), current_user.profile_picture)
 
         # Delete user (cascade will handle related data: resumes, applications, job descriptions)
-        db.session.delete(current_user)
+        db.session.delete(db.session.get(User, user_id))
         db.session.commit()
 
         # Logout user
@@ -443,40 +381,13 @@ def delete_account():
 @admin_required
 def admin_index():
     """Admin dashboard homepage"""
-    # System statistics
-    stats = {
-        'total_users': User.query.count(),
-        'active_users': User.query.filter_by(is_active=True).count(),
-        'total_applications': Application.query.count(),
-        'total_resumes': Resume.query.count(),
-        'total_jobs': JobDescription.query.count(),
-    }
-
-    # New users this week
-    week_ago = datetime.now() - timedelta(days=7)
-    stats['new_users_week'] = User.query.filter(
-        User.created_at >= week_ago
-    ).count()
+    # System statistics from the materialized daily counters (rebuilt by the stats reconciler)
+    stats = get_admin_stats()
+    monthly_users = stats.pop('monthly_users')
 
     # Recent activity
     recent_users = User.query.order_by(User.created_at.desc()).limit(10).all()
-    recent_applications = Application.query.order_by(
-        Application.created_at.desc()
-    ).limit(10).all()
-
-    # User growth data
-    monthly_users = []
-    for i in range(6, 0, -1):
-        month_start = (datetime.now() - timedelta(days=30*i)).replace(day=1)
-        month_end = (month_start + timedelta(days=32)).replace(day=1)
-        count = User.query.filter(
-            User.created_at >= month_start,
-            User.created_at < month_end
-        ).count()
-        monthly_users.append({
-            'month': month_start.strftime('%b'),
-            'count': count
-        })
+    recent_applications = recent_applications_query(10).all()
 
     return render_template('dashboard/admin/index.html',
                          stats=stats,
@@ -488,8 +399,9 @@ def admin_index():
 @admin_required
 def admin_users():
     """User management page"""
-    users = User.query.order_by(User.created_at.desc()).all()
-    return render_template('dashboard/admin/users.html', users=users)
+    cursor, per_page = page_args()
+    page = keyset_paginate(User.query, User, cursor, per_page)
+    return render_template('dashboard/admin/users.html', users=page.items, page=page)
 
 @dashboard_bp.route('/admin/users/<int:user_id>')
 @admin_required
@@ -500,6 +412,7 @@ def admin_user_detail(user_id):
 
 @dashboard_bp.route('/admin/system-monitor')
 @admin_required
+@query_budget(LIST_VIEW_QUERY_BUDGET)
 def admin_system_monitor():
     """System monitoring page"""
     # Get system metrics
@@ -514,9 +427,7 @@ def admin_system_monitor():
     recent_activity = []
 
     # Get latest applications as activity
-    applications = Application.query.order_by(
-        Application.created_at.desc()
-    ).limit(20).all()
+    applications = recent_applications_query(20).all()
 
     for app in applications:
         recent_activity.append({
@@ -543,10 +454,11 @@ def admin_payments():
 def admin_analytics():
     """System analytics page"""
     # Calculate system-wide analytics
+    admin_stats = get_admin_stats()
     stats = {
-        'total_users': User.query.count(),
-        'total_applications': Application.query.count(),
-        'total_resumes': Resume.query.count(),
+        'total_users': admin_stats['total_users'],
+        'total_applications': admin_stats['total_applications'],
+        'total_resumes': admin_stats['total_resumes'],
         'avg_applications_per_user': 0
     }
 
@@ -557,6 +469,79 @@ def admin_analytics():
 
     return render_template('dashboard/admin/analytics.html', stats=stats)
 
+# ============================================================================
+# LISTING API (KEYSET-PAGINATED JSON)
+# ============================================================================
+
+def _page_json(page, serialize):
+    """JSON body for one page of a listing"""
+    return jsonify({
+        'items': [serialize(item) for item in page.items],
+        'next_cursor': page.next_cursor
+    })
+
+def _iso(value):
+    return value.isoformat() if value else None
+
+@dashboard_bp.route('/api/applications')
+@login_required
+@query_budget(LIST_VIEW_QUERY_BUDGET)
+def api_applications():
+    """Paginated applications of the current user"""
+    cursor, per_page = page_args()
+    page = keyset_paginate(user_applications_query(current_user.id), Application, cursor, per_page)
+    return _page_json(page, lambda app: {
+        'id': app.id,
+        'status': app.status,
+        'job_title': app.job.title if app.job else None,
+        'company': app.job.company if app.job else None,
+        'applied_date': _iso(app.applied_date),
+        'created_at': _iso(app.created_at)
+    })
+
+@dashboard_bp.route('/api/jobs')
+@login_required
+def api_jobs():
+    """Paginated job descriptions of the current user"""
+    cursor, per_page = page_args()
+    page = keyset_paginate(current_user.job_descriptions, JobDescription, cursor, per_page)
+    return _page_json(page, lambda job: {
+        'id': job.id,
+        'job_id': job.job_id,
+        'title': job.title,
+        'company': job.company,
+        'location': job.location,
+        'created_at': _iso(job.created_at)
+    })
+
+@dashboard_bp.route('/api/resumes')
+@login_required
+def api_resumes():
+    """Paginated resumes of the current user"""
+    cursor, per_page = page_args()
+    page = keyset_paginate(user_resumes_query(current_user.id), Resume, cursor, per_page)
+    return _page_json(page, lambda resume: {
+        'id': resume.id,
+        'title': resume.title,
+        'status': resume.status,
+        'job_title': resume.job.title if resume.job else None,
+        'created_at': _iso(resume.created_at)
+    })
+
+@dashboard_bp.route('/api/admin/users')
+@admin_required
+def api_admin_users():
+    """Paginated users, newest first"""
+    cursor, per_page = page_args()
+    page = keyset_paginate(User.query, User, cursor, per_page)
+    return _page_json(page, lambda user: {
+        'id': user.id,
+        'username': user.username,
+        'email': user.email,
+        'is_active': user.is_active,
+        'created_at': _iso(user.created_at)
+    })
+
 # ============================================================================
 # PRICING PAGE (AVAILABLE TO ALL LOGGED-IN USERS)
 # ============================================================================
@@ -611,8 +596,29 @@ def pricing():
 
     return render_template('dashboard/pricing.html', plans=plans)
 
+def _search_result(doc):
+    """Search result JSON for an indexed resume, job or application"""
+    created = doc['created_at'].strftime("%b %d, %Y") if doc['created_at'] else ''
+    if doc['kind'] == 'resume':
+        description = f'Resume - Created {created}'
+        url = '/dashboard/user/resumes'
+    elif doc['kind'] == 'job':
+        description = f"{doc['detail']} - Added {created}"
+        url = '/dashboard/user/jobs'
+    else:
+        description = f"Status: {doc['detail'].title()} - Applied {created}"
+        url = '/dashboard/user/applications'
+    return {
+        'id': doc['id'],
+        'title': doc['title'],
+        'description': description,
+        'type': doc['kind'],
+        'url': url
+    }
+
 @dashboard_bp.route('/search')
 @login_required
+@query_budget(LIST_VIEW_QUERY_BUDGET)
 def search():
     """Search endpoint for dashboard global search"""
     query = request.args.get('q', '').strip().lower()
@@ -620,21 +626,22 @@ def search():
     if not query or len(query) < 2:
         return jsonify({'results': []})
 
+    # One ranked full-text query across resumes, jobs and applications
+    if search_index.is_available():
+        return jsonify({'results': [_search_result(doc) for doc in search_index.search_documents(current_user.id, query)]})
+
     results = []
 
     # Search user's resumes
     resumes = current_user.resumes.filter(
-        Resume.name.ilike(f'%{query}%')
+        Resume.title.ilike(f'%{query}%')
     ).limit(5).all()
 
     for resume in resumes:
-        results.append({
-            'id': resume.id,
-            'title': resume.name,
-            'description': f'Resume - Created {resume.created_at.strftime("%b %d, %Y")}',
-            'type': 'resume',
-            'url': f'/dashboard/user/resumes'
-        })
+        results.append(_search_result({
+            'kind': 'resume', 'id': resume.id, 'title': resume.title,
+            'detail': '', 'created_at': resume.created_at
+        }))
 
     # Search user's job descriptions
     jobs = current_user.job_descriptions.filter(
@@ -645,16 +652,14 @@ def search():
     ).limit(5).all()
 
     for job in jobs:
-        results.append({
-            'id': job.id,
-            'title': job.title,
-            'description': f'{job.company} - Added {job.created_at.strftime("%b %d, %Y")}',
-            'type': 'job',
-            'url': f'/dashboard/user/jobs'
-        })
+        results.append(_search_result({
+            'kind': 'job', 'id': job.id, 'title': job.title,
+            'detail': job.company or '', 'created_at': job.created_at
+        }))
 
     # Search user's applications
-    applications = current_user.applications.join(JobDescription).filter(
+    applications = application_search_query(
+        current_user.id,
         db.or_(
             JobDescription.title.ilike(f'%{query}%'),
             JobDescription.company.ilike(f'%{query}%'),
@@ -663,15 +668,12 @@ def search():
     ).limit(5).all()
 
     for app in applications:
-        job_title = app.job_description.title if app.job_description else 'Unknown Job'
-        company = app.job_description.company if app.job_description else 'Unknown Company'
-        results.append({
-            'id': app.id,
-            'title': f'{job_title} at {company}',
-            'description': f'Status: {app.status.title()} - Applied {app.created_at.strftime("%b %d, %Y")}',
-            'type': 'application',
-            'url': f'/dashboard/user/applications'
-        })
+        job_title = app.job.title if app.job else 'Unknown Job'
+        company = app.job.company if app.job else 'Unknown Company'
+        results.append(_search_result({
+            'kind': 'application', 'id': app.id, 'title': f'{job_title} at {company}',
+            'detail': app.status or '', 'created_at': app.created_at
+        }))
 
     return jsonify({'results': results})
 
@@ -0,0 +1,37 @@
+"""
+Run the background resume worker
+Picks up pending resumes queued from the dashboard and generates them with the CLI pipeline
+"""
+import argparse
+import time
+from app import create_app
+from extensions import db
+
+def run_resume_worker(concurrency=None):
+    """Process pending resumes until interrupted"""
+    app = create_app()
+    if concurrency:
+        app.config['RESUME_WORKER_CONCURRENCY'] = concurrency
+
+    with app.app_context():
+        # Make sure the resumes table exists
+        db.create_all()
+
+    from services.resume_worker import get_resume_worker
+    worker = get_resume_worker(app)
+    worker.start()
+
+    print("[OK] Waiting for pending resumes (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        print("[OK] Stopping, waiting for running resumes to finish")
+        worker.stop()
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Generate queued resumes in the background')
+    parser.add_argument('--concurrency', type=int, help='Resumes generated at the same time')
+    args = parser.parse_args()
+
+    run_resume_worker(args.concurrency)
@@ -0,0 +1,295 @@
+"""
+Admin Stats Service for materialized daily counters
+"""
+
+import threading
+import time
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import case, delete, event, func, insert, inspect, update
+from sqlalchemy.orm.attributes import get_history
+from extensions import db
+from models.user import User, JobDescription, Resume, Application
+from models.stats import DailyStat
+from models.sync import SyncWatermark
+
+RECONCILE_WATERMARK = 'daily_stats_reconciled_at'
+TABLE_RECHECK_INTERVAL = 60  # seconds between checks for a daily_stats table created meanwhile
+
+# Model -> (entity name, attribute holding the status, or None)
+TRACKED_MODELS = {
+    User: ('user', 'is_active'),
+    Application: ('application', 'status'),
+    Resume: ('resume', 'status'),
+    JobDescription: ('job', None),
+}
+
+
+def _status_value(model, value) -> str:
+    if model is User:
+        return 'active' if value or value is None else 'inactive'
+    return value or ''
+
+
+def _row_day(target) -> date:
+    return (target.created_at or datetime.utcnow()).date()
+
+
+# daily_stats only exists once migrations/add_daily_stats.py (or create_tables.py)
+# ran; until then the hooks do nothing and the dashboard counts the source tables
+_table_exists = False
+_table_checked_at = 0.0
+
+
+def daily_stats_available(connection=None) -> bool:
+    """Whether the daily_stats table exists, rechecked at most once a minute while missing"""
+    global _table_exists, _table_checked_at
+    if _table_exists:
+        return True
+    if time.monotonic() - _table_checked_at < TABLE_RECHECK_INTERVAL:
+        return False
+    _table_checked_at = time.monotonic()
+    try:
+        _table_exists = inspect(connection if connection is not None else db.engine).has_table(DailyStat.__tablename__)
+    except Exception as e:
+        print(f"[WARNING] Could not check for the daily_stats table: {e}")
+    return _table_exists
+
+
+def _apply_deltas(connection, deltas: Dict[Tuple[date, str, str], int]):
+    """Add deltas to daily counters, creating missing rows"""
+    if not daily_stats_available(connection):
+        return
+    table = DailyStat.__table__
+    now = datetime.utcnow()
+    dialect = connection.dialect.name
+
+    for (day, entity, status), delta in deltas.items():
+        if not delta:
+            continue
+        values = {'day': day, 'entity': entity, 'status': status, 'count': delta, 'updated_at': now}
+
+        if dialect in ('postgresql', 'sqlite'):
+            if dialect == 'postgresql':
+                from sqlalchemy.dialects.postgresql import insert as dialect_insert
+            else:
+                from sqlalchemy.dialects.sqlite import insert as dialect_insert
+            connection.execute(
+                dialect_insert(table).values(**values).on_conflict_do_update(
+                    index_elements=['day', 'entity', 'status'],
+                    set_={'count': table.c.count + delta, 'updated_at': now}
+                )
+            )
+            continue
+
+        result = connection.execute(
+            update(table)
+            .where(table.c.day == day, table.c.entity == entity, table.c.status == status)
+            .values(count=table.c.count + delta, updated_at=now)
+        )
+        if result.rowcount == 0:
+            connection.execute(insert(table).values(**values))
+
+
+def record_created(entity: str, day: date, statuses: Dict[str, int]):
+    """Count rows created with Core bulk inserts, which bypass the ORM hooks"""
+    _apply_deltas(db.session.connection(), {
+        (day, entity, status): count for status, count in statuses.items()
+    })
+
+
+def _after_insert(mapper, connection, target):
+    model = mapper.class_
+    entity, status_attr = TRACKED_MODELS[model]
+    status = _status_value(model, getattr(target, status_attr)) if status_attr else ''
+    _apply_deltas(connection, {(_row_day(target), entity, status): 1})
+
+
+def _after_update(mapper, connection, target):
+    model = mapper.class_
+    entity, status_attr = TRACKED_MODELS[model]
+    if not status_attr:
+        return
+    history = get_history(target, status_attr)
+    if not history.has_changes() or not history.deleted:
+        return
+
+    old_status = _status_value(model, history.deleted[0])
+    new_status = _status_value(model, getattr(target, status_attr))
+    if old_status != new_status:
+        day = _row_day(target)
+        _apply_deltas(connection, {(day, entity, old_status): -1, (day, entity, new_status): 1})
+
+
+def _after_delete(mapper, connection, target):
+    model = mapper.class_
+    entity, status_attr = TRACKED_MODELS[model]
+    status = _status_value(model, getattr(target, status_attr)) if status_attr else ''
+    _apply_deltas(connection, {(_row_day(target), entity, status): -1})
+
+
+for _model in TRACKED_MODELS:
+    event.listen(_model, 'after_insert', _after_insert)
+    event.listen(_model, 'after_update', _after_update)
+    event.listen(_model, 'after_delete', _after_delete)
+
+
+def _source_counts() -> List[Dict]:
+    """Daily counter rows computed from the source tables"""
+    queries = {
+        'user': (User, case((User.is_active == False, 'inactive'), else_='active')),  # noqa: E712
+        'application': (Application, func.coalesce(Application.status, '')),
+        'resume': (Resume, func.coalesce(Resume.status, '')),
+        'job': (JobDescription, None),
+    }
+
+    rows = []
+    now = datetime.utcnow()
+    for entity, (model, status_expr) in queries.items():
+        day_expr = func.date(model.created_at)
+        columns = [day_expr, func.count(model.id)]
+        group_by = [day_expr]
+        if status_expr is not None:
+            columns.append(status_expr)
+            group_by.append(status_expr)
+
+        for result in db.session.query(*columns).filter(model.created_at.isnot(None)).group_by(*group_by):
+            day = result[0]
+            if isinstance(day, str):
+                day = date.fromisoformat(day[:10])
+            rows.append({
+                'day': day,
+                'entity': entity,
+                'status': result[2] if status_expr is not None else '',
+                'count': result[1],
+                'updated_at': now
+            })
+    return rows
+
+
+def reconcile_daily_stats() -> int:
+    """Rebuild the daily counters from the source tables; returns rows written
+
+    Catches anything the hooks cannot see: database-level cascades, Core
+    updates and writes from tools that bypass the ORM.
+    """
+    rows = _source_counts()
+    now = datetime.utcnow()
+    try:
+        db.session.execute(delete(DailyStat))
+        if rows:
+            db.session.execute(insert(DailyStat), rows)
+        SyncWatermark.set_value(RECONCILE_WATERMARK, now.isoformat())
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        print(f"[ERROR] Failed to reconcile daily stats: {e}")
+        raise
+    return len(rows)
+
+
+def ensure_reconciled(max_age: Optional[timedelta] = None) -> bool:
+    """Reconcile if the counters were never built or are older than max_age; returns whether it ran"""
+    last = SyncWatermark.get_value(RECONCILE_WATERMARK, '')
+    if not last or (max_age is not None and datetime.utcnow() - datetime.fromisoformat(last) > max_age):
+        reconcile_daily_stats()
+        return True
+    return False
+
+
+class StatsReconciler:
+    """Daemon thread that rebuilds the daily counters once they are older than max_age
+
+    Runs outside request handling so admin pages only ever read the counters.
+    Several processes may run one; the watermark keeps them from repeating
+    each other's work, and a duplicate rebuild produces the same rows.
+    """
+
+    def __init__(self, app, max_age: timedelta, check_interval: float = 3600):
+        self.app = app
+        self.max_age = max_age
+        self.check_interval = check_interval
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(target=self.run, name='stats-reconciler', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+
+    def run(self):
+        while not self._stopped.is_set():
+            try:
+                with self.app.app_context():
+                    if daily_stats_available() and ensure_reconciled(self.max_age):
+                        print("[OK] Rebuilt admin daily counters")
+            except Exception as e:
+                print(f"[ERROR] Admin stats reconcile failed: {e}")
+            self._stopped.wait(self.check_interval)
+
+
+# Singleton instance
+_stats_reconciler = None
+
+def get_stats_reconciler(app=None) -> Optional[StatsReconciler]:
+    """Get the stats reconciler, creating it for app on first use"""
+    global _stats_reconciler
+    if _stats_reconciler is None and app is not None:
+        hours = app.config.get('ADMIN_STATS_RECONCILE_HOURS', 24)
+        _stats_reconciler = StatsReconciler(app, timedelta(hours=hours))
+    return _stats_reconciler
+
+
+def _counter_rows():
+    """(day, entity, status, count) rows from the counters, or the source tables while unmigrated"""
+    if daily_stats_available():
+        return db.session.query(DailyStat.day, DailyStat.entity, DailyStat.status, DailyStat.count).all()
+    return [(row['day'], row['entity'], row['status'], row['count']) for row in _source_counts()]
+
+
+def get_admin_stats(months: int = 6) -> Dict:
+    """Totals, new users this week and monthly user growth from the daily counters"""
+    rows = _counter_rows()
+    totals = defaultdict(int)
+    for _, entity, status, count in rows:
+        totals[(entity, status)] += int(count or 0)
+
+    def entity_total(entity):
+        return sum(count for (name, _), count in totals.items() if name == entity)
+
+    # Daily user signups since the start of the oldest month on the chart
+    today = datetime.utcnow().date()
+    year, month = today.year, today.month
+    for _ in range(months):
+        year, month = (year, month - 1) if month > 1 else (year - 1, 12)
+    since = date(year, month, 1)
+    signups = [(day, count) for day, entity, _, count in rows if entity == 'user' and day >= since]
+
+    week_ago = today - timedelta(days=7)
+    monthly = defaultdict(int)
+    for day, count in signups:
+        monthly[(day.year, day.month)] += int(count or 0)
+
+    monthly_users = []
+    for _ in range(months):
+        monthly_users.append({
+            'month': date(year, month, 1).strftime('%b'),
+            'count': monthly[(year, month)]
+        })
+        year, month = (year, month + 1) if month < 12 else (year + 1, 1)
+
+    return {
+        'total_users': entity_total('user'),
+        'active_users': totals[('user', 'active')],
+        'total_applications': entity_total('application'),
+        'total_resumes': entity_total('resume'),
+        'total_jobs': entity_total('job'),
+        'new_users_week': sum(int(count or 0) for day, count in signups if day >= week_ago),
+        'monthly_users': monthly_users
+    }
@@ -0,0 +1,139 @@
+"""
+Dashboard Stats Service for per-user aggregates with a small result cache
+"""
+
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+from sqlalchemy import case, event, func, select
+from extensions import db
+from models.user import JobDescription, Resume, Application
+
+APPLICATION_STATUSES = ['applied', 'interview', 'offer', 'rejected']
+CACHE_TTL = 60  # seconds; bounds staleness from writers in other processes
+
+
+def _count_if(condition):
+    """Conditional aggregation: count rows matching condition"""
+    return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+
+
+def _month_starts(now: datetime, months: int) -> List[datetime]:
+    """First day of each of the previous months, oldest first, plus the current month"""
+    starts = []
+    year, month = now.year, now.month
+    for _ in range(months + 1):
+        starts.append(datetime(year, month, 1))
+        year, month = (year, month - 1) if month > 1 else (year - 1, 12)
+    return starts[::-1]
+
+
+class DashboardStatsCache:
+    """Per-user cache of dashboard aggregates, invalidated on writes"""
+
+    def __init__(self, ttl: float = CACHE_TTL):
+        self.ttl = ttl
+        self._entries: Dict[Tuple[str, int], Tuple[float, Dict]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, kind: str, user_id: int, compute):
+        key = (kind, user_id)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry and entry[0] > now:
+            return entry[1]
+
+        value = compute()
+        with self._lock:
+            self._entries[key] = (now + self.ttl, value)
+        return value
+
+    def invalidate(self, user_id: int):
+        with self._lock:
+            for key in [key for key in self._entries if key[1] == user_id]:
+                del self._entries[key]
+
+
+_cache = DashboardStatsCache()
+
+
+def invalidate_user_stats(user_id: int):
+    """Drop cached dashboard aggregates of a user"""
+    _cache.invalidate(user_id)
+
+
+def get_index_stats(user_id: int) -> Dict:
+    """Counters and status breakdown for the user dashboard, in one query"""
+    def compute():
+        total_jobs = select(func.count(JobDescription.id)).where(
+            JobDescription.user_id == user_id).scalar_subquery()
+        total_resumes = select(func.count(Resume.id)).where(
+            Resume.user_id == user_id).scalar_subquery()
+
+        row = db.session.query(
+            total_jobs,
+            total_resumes,
+            func.count(Application.id),
+            *[_count_if(Application.status == status) for status in APPLICATION_STATUSES]
+        ).select_from(Application).filter(Application.user_id == user_id).one()
+
+        status_breakdown = {
+            status: int(count) for status, count in zip(APPLICATION_STATUSES, row[3:]) if count
+        }
+        return {
+            'stats': {
+                'total_jobs': row[0] or 0,
+                'total_resumes': row[1] or 0,
+                'total_applications': row[2],
+                'active_applications': status_breakdown.get('applied', 0) + status_breakdown.get('interview', 0)
+            },
+            'status_breakdown': status_breakdown
+        }
+
+    return _cache.get('index', user_id, compute)
+
+
+def get_analytics_stats(user_id: int, months: int = 6) -> Dict:
+    """Analytics counters and monthly buckets for the last months, in one query"""
+    def compute():
+        starts = _month_starts(datetime.now(), months)
+        buckets = [
+            _count_if((Application.created_at >= start) & (Application.created_at < end))
+            for start, end in zip(starts, starts[1:])
+        ]
+
+        row = db.session.query(
+            func.count(Application.id),
+            _count_if(Application.status.in_(['interview', 'offer'])),
+            _count_if(Application.created_at >= starts[-1]),
+            *buckets
+        ).filter(Application.user_id == user_id).one()
+
+        total, successful, this_month = row[0], int(row[1]), int(row[2])
+        return {
+            'stats': {
+                'total_applications': total,
+                'success_rate': (successful / total) * 100 if total > 0 else 0,
+                'avg_response_time': 0,
+                'applications_this_month': this_month,
+            },
+            'monthly_data': [
+                {'month': start.strftime('%b'), 'count': int(count)}
+                for start, count in zip(starts, row[3:])
+            ]
+        }
+
+    return _cache.get('analytics', user_id, compute)
+
+
+def _invalidate_on_write(mapper, connection, target):
+    if target.user_id is not None:
+        invalidate_user_stats(target.user_id)
+
+
+for _model in (Application, Resume, JobDescription):
+    for _event_name in ('after_insert', 'after_update', 'after_delete'):
+        event.listen(_model, _event_name, _invalidate_on_write)
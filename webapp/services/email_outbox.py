@@ -0,0 +1,186 @@
+"""
+Email Outbox Service for delivering queued emails in the background
+"""
+
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, Any, Optional
+
+from extensions import db
+from models.email import EmailOutbox
+
+# A message claimed by a sender that crashed becomes deliverable again after this
+SEND_LEASE = timedelta(minutes=5)
+MAX_BACKOFF = timedelta(hours=1)
+
+
+def enqueue_email(message: Dict[str, Any]) -> Dict[str, Any]:
+    """Store a rendered message in the outbox and wake the sender
+
+    The sender is started here if this process has none running (e.g. debug
+    mode without the reloader, or a forked server worker). When the outbox
+    cannot be used the message is delivered right away instead.
+    """
+    from flask import current_app
+    app = current_app._get_current_object()
+    sender = get_email_sender(app)
+    try:
+        email = EmailOutbox(
+            to_email=message['to'],
+            subject=message['subject'],
+            html_body=message['html'],
+            text_body=message.get('text'),
+            kind=message.get('kind')
+        )
+        db.session.add(email)
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        print(f"[EMAIL SERVICE ERROR] Failed to queue email, sending it now: {str(e)}")
+        return sender.email_service.deliver(message)
+
+    if app.config.get('EMAIL_SENDER_ENABLED', True):
+        sender.start()
+        sender.notify()
+    else:
+        # No background sender in this deployment; deliver due messages in this request
+        sender.send_batch()
+    return {'success': True, 'message': 'Email queued for delivery', 'id': email.id}
+
+
+class EmailSender:
+    """Background thread delivering outbox messages in batches with retry and backoff
+
+    Messages are claimed with a conditional UPDATE, so several web processes
+    can each run a sender against the same database without double sends.
+    Failed deliveries are retried with exponential backoff until max_attempts.
+    """
+
+    def __init__(self, app, email_service=None, batch_size: int = 20, poll_interval: float = 5,
+                 max_attempts: int = 5, base_backoff: float = 30):
+        """Initialize the sender for a Flask app"""
+        from services.email_service import EmailService
+        self.app = app
+        self.email_service = email_service or EmailService()
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.base_backoff = base_backoff
+
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """Start delivering in a daemon thread"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(target=self.run, name='email-sender', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop after the batch in progress"""
+        self._stopped.set()
+        self._wakeup.set()
+        if self._thread:
+            self._thread.join()
+
+    def notify(self):
+        """Wake the sender early, e.g. right after a message was queued"""
+        self._wakeup.set()
+
+    def run(self):
+        """Deliver batches until stopped"""
+        while not self._stopped.is_set():
+            try:
+                with self.app.app_context():
+                    # Keep going while full batches are waiting
+                    while self.send_batch() == self.batch_size and not self._stopped.is_set():
+                        pass
+            except Exception as e:
+                print(f"[EMAIL SERVICE ERROR] Email sender failed: {e}")
+            self._wakeup.wait(self.poll_interval)
+            self._wakeup.clear()
+
+    def _claim_batch(self):
+        """Claim up to batch_size due messages for this sender"""
+        now = datetime.utcnow()
+        candidates = [
+            email_id for (email_id,) in db.session.query(EmailOutbox.id).filter(
+                EmailOutbox.status.in_(['pending', 'sending']),
+                EmailOutbox.next_attempt_at <= now
+            ).order_by(EmailOutbox.next_attempt_at, EmailOutbox.id).limit(self.batch_size)
+        ]
+        claimed = []
+        for email_id in candidates:
+            # 'sending' rows are only due again once a crashed sender's lease ran out
+            count = EmailOutbox.query.filter(
+                EmailOutbox.id == email_id,
+                EmailOutbox.status.in_(['pending', 'sending']),
+                EmailOutbox.next_attempt_at <= now
+            ).update({
+                'status': 'sending',
+                'next_attempt_at': now + SEND_LEASE
+            }, synchronize_session=False)
+            if count:
+                claimed.append(email_id)
+        db.session.commit()
+        return EmailOutbox.query.filter(EmailOutbox.id.in_(claimed)).order_by(EmailOutbox.id).all() if claimed else []
+
+    def send_batch(self) -> int:
+        """Deliver one batch of due messages; returns the number attempted"""
+        emails = self._claim_batch()
+        if not emails:
+            return 0
+
+        results = self.email_service.deliver_batch([{
+            'to': email.to_email,
+            'subject': email.subject,
+            'html': email.html_body,
+            'text': email.text_body or ''
+        } for email in emails])
+
+        now = datetime.utcnow()
+        for email, result in zip(emails, results):
+            email.attempts = (email.attempts or 0) + 1
+            email.provider = result.get('provider')
+            if result['success']:
+                email.status = 'sent'
+                email.sent_at = now
+                email.last_error = None
+            elif email.attempts >= self.max_attempts:
+                email.status = 'failed'
+                email.last_error = result['message']
+                print(f"[EMAIL SERVICE ERROR] Giving up on email {email.id} to {email.to_email}: {result['message']}")
+            else:
+                backoff = timedelta(seconds=self.base_backoff * 2 ** (email.attempts - 1))
+                email.status = 'pending'
+                email.next_attempt_at = now + min(backoff, MAX_BACKOFF)
+                email.last_error = result['message']
+        db.session.commit()
+        return len(emails)
+
+    def drain(self) -> int:
+        """Deliver everything due now, in the calling thread; returns the number attempted"""
+        total = 0
+        with self.app.app_context():
+            while True:
+                attempted = self.send_batch()
+                total += attempted
+                if attempted < self.batch_size:
+                    return total
+
+
+# Singleton instance
+_email_sender = None
+
+def get_email_sender(app=None) -> Optional[EmailSender]:
+    """Get the email sender, creating it for app on first use"""
+    global _email_sender
+    if _email_sender is None and app is not None:
+        _email_sender = EmailSender(
+            app,
+            batch_size=app.config.get('EMAIL_BATCH_SIZE', 20),
+            max_attempts=app.config.get('EMAIL_MAX_ATTEMPTS', 5)
+        )
+    return _email_sender
@@ -1,9 +1,13 @@
 """
 Email service for sending verification codes and other emails
-Uses Supabase Admin API for email delivery with console fallback
+Uses Resend or SMTP for delivery with console fallback; request handlers
+queue messages in the email outbox instead of waiting on the provider
 """
 import os
-from typing import Dict, Any
+import smtplib
+from email.message import EmailMessage
+from typing import Dict, Any, List
+from jinja2 import Environment, FileSystemLoader, select_autoescape
 from supabase_client import get_supabase_client
 
 # Try to import resend for fallback, but don't fail if not available
@@ -13,9 +17,29 @@ try:
 except ImportError:
     RESEND_AVAILABLE = False
 
+# Email templates are compiled once per process and reused for every message
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'templates', 'email')
+_template_env = Environment(
+    loader=FileSystemLoader(TEMPLATE_DIR),
+    autoescape=select_autoescape(['html']),
+    auto_reload=False
+)
+_templates = {}
+
+
+def render_email(name: str, **context) -> Dict[str, str]:
+    """Render the html and text parts of an email template"""
+    if name not in _templates:
+        _templates[name] = (
+            _template_env.get_template(f'{name}.html'),
+            _template_env.get_template(f'{name}.txt')
+        )
+    html_template, text_template = _templates[name]
+    return {'html': html_template.render(**context), 'text': text_template.render(**context)}
+
 
 class EmailService:
-    """Service for sending emails via Supabase with Resend/console fallback"""
+    """Service for sending emails via Resend or SMTP with console fallback"""
 
     def __init__(self):
         self.app_name = "SmartApply Pro"
@@ -40,168 +64,91 @@ class EmailService:
         else:
             self.resend_enabled = False
 
+        # SMTP delivery (a local sink such as smtp_sink.py in development and tests)
+        self.smtp_server = os.environ.get('MAIL_SERVER')
+        self.smtp_port = int(os.environ.get('MAIL_PORT') or 587)
+        self.smtp_use_tls = os.environ.get('MAIL_USE_TLS', 'true').lower() in ['true', 'on', '1']
+        self.smtp_username = os.environ.get('MAIL_USERNAME')
+        self.smtp_password = os.environ.get('MAIL_PASSWORD')
+        self.smtp_enabled = bool(self.smtp_server)
+
         # Determine email method
-        if not self.supabase_enabled and not self.resend_enabled:
+        if not self.resend_enabled and not self.smtp_enabled:
             print(f"[EMAIL SERVICE] Using console fallback for emails")
 
-    def send_verification_code(self, email: str, code: str) -> Dict[str, Any]:
-        """
-        Send verification code email
-
-        Args:
-            email: Recipient email address
-            code: 6-digit verification code
-
-        Returns:
-            Dict with success status and message
-        """
-        try:
-            # Create email content
-            subject = f"Verify Your {self.app_name} Account"
-
-            html_content = f"""
-            <!DOCTYPE html>
-            <html>
-            <head>
-                <meta charset="UTF-8">
-                <meta name="viewport" content="width=device-width, initial-scale=1.0">
-                <style>
-                    body {{
-                        font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif;
-                        line-height: 1.6;
-                        color: #333;
-                        max-width: 600px;
-                        margin: 0 auto;
-                        padding: 20px;
-                    }}
-                    .container {{
-                        background-color: #ffffff;
-                        border-radius: 8px;
-                        padding: 40px;
-                        box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
-                    }}
-                    .header {{
-                        text-align: center;
-                        margin-bottom: 30px;
-                    }}
-                    .logo {{
-                        font-size: 28px;
-                        font-weight: bold;
-                        color: #2d3748;
-                        margin-bottom: 10px;
-                    }}
-                    .code-container {{
-                        background-color: #f7fafc;
-                        border: 2px dashed #cbd5e0;
-                        border-radius: 8px;
-                        padding: 30px;
-                        text-align: center;
-                        margin: 30px 0;
-                    }}
-                    .code {{
-                        font-size: 36px;
-                        font-weight: bold;
-                        letter-spacing: 8px;
-                        color: #2d3748;
-                        font-family: 'Courier New', monospace;
-                    }}
-                    .message {{
-                        color: #4a5568;
-                        margin: 20px 0;
-                    }}
-                    .footer {{
-                        margin-top: 30px;
-                        padding-top: 20px;
-                        border-top: 1px solid #e2e8f0;
-                        color: #718096;
-                        font-size: 14px;
-                        text-align: center;
-                    }}
-                    .warning {{
-                        background-color: #fff5f5;
-                        border-left: 4px solid #fc8181;
-                        padding: 15px;
-                        margin: 20px 0;
-                        border-radius: 4px;
-                    }}
-                </style>
-            </head>
-            <body>
-                <div class="container">
-                    <div class="header">
-                        <div class="logo">{self.app_name}</div>
-                        <p style="color: #718096; margin: 0;">Email Verification</p>
-                    </div>
-
-                    <div class="message">
-                        <p>Hello,</p>
-                        <p>Thank you for registering with {self.app_name}! To complete your registration, please verify your email address using the code below:</p>
-                    </div>
-
-                    <div class="code-container">
-                        <p style="margin: 0 0 10px 0; color: #718096; font-size: 14px;">Your Verification Code</p>
-                        <div class="code">{code}</div>
-                        <p style="margin: 10px 0 0 0; color: #718096; font-size: 12px;">This code will expire in 15 minutes</p>
-                    </div>
-
-                    <div class="message">
-                        <p>If you didn't request this verification code, please ignore this email or contact our support team if you have concerns.</p>
-                    </div>
-
-                    <div class="warning">
-                        <strong>Security Notice:</strong> Never share this code with anyone. {self.app_name} will never ask for your verification code.
-                    </div>
-
-                    <div class="footer">
-                        <p>This is an automated message from {self.app_name}.</p>
-                        <p>Need help? Contact us at <a href="mailto:{self.support_email}">{self.support_email}</a></p>
-                        <p>&copy; 2024 {self.app_name}. All rights reserved.</p>
-                    </div>
-                </div>
-            </body>
-            </html>
-            """
-
-            # Plain text version as fallback
-            text_content = f"""
-            {self.app_name} - Email Verification
-
-            Hello,
-
-            Thank you for registering with {self.app_name}! To complete your registration, please verify your email address using the code below:
-
-            Verification Code: {code}
-
-            This code will expire in 15 minutes.
-
-            If you didn't request this verification code, please ignore this email or contact our support team.
-
-            Security Notice: Never share this code with anyone. {self.app_name} will never ask for your verification code.
-
-            Need help? Contact us at {self.support_email}
-
-            © 2024 {self.app_name}. All rights reserved.
-            """
-
-            # Option 1: Send email using Resend (Direct API - Most Reliable)
-            if self.resend_enabled and RESEND_AVAILABLE:
+    def _context(self, **context) -> Dict[str, Any]:
+        return {'app_name': self.app_name, 'support_email': self.support_email, **context}
+
+    def build_verification_code(self, email: str, code: str) -> Dict[str, Any]:
+        """Verification code message, ready to deliver or queue"""
+        return {
+            'to': email,
+            'subject': f"Verify Your {self.app_name} Account",
+            'kind': 'verification_code',
+            **render_email('verification_code', **self._context(code=code))
+        }
+
+    def build_password_reset(self, email: str, reset_link: str) -> Dict[str, Any]:
+        """Password reset message, ready to deliver or queue"""
+        return {
+            'to': email,
+            'subject': f"Reset Your {self.app_name} Password",
+            'kind': 'password_reset',
+            **render_email('password_reset', **self._context(reset_link=reset_link))
+        }
+
+    def _send_resend(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        params = {
+            "from": self.from_email,
+            "to": [message['to']],
+            "subject": message['subject'],
+            "html": message['html'],
+            "text": message['text']
+        }
+        email_response = resend.Emails.send(params)
+        print(f"[EMAIL SERVICE] Email sent successfully via Resend to {message['to']}")
+        print(f"[EMAIL SERVICE] Resend ID: {email_response.get('id', 'N/A')}")
+        return {'success': True, 'message': 'Email sent successfully', 'provider': 'resend'}
+
+    def _smtp_message(self, message: Dict[str, Any]) -> EmailMessage:
+        mime = EmailMessage()
+        mime['From'] = self.from_email
+        mime['To'] = message['to']
+        mime['Subject'] = message['subject']
+        mime.set_content(message['text'])
+        mime.add_alternative(message['html'], subtype='html')
+        return mime
+
+    def _smtp_connection(self) -> smtplib.SMTP:
+        connection = smtplib.SMTP(self.smtp_server, self.smtp_port, timeout=30)
+        if self.smtp_use_tls:
+            connection.starttls()
+        if self.smtp_username and self.smtp_password:
+            connection.login(self.smtp_username, self.smtp_password)
+        return connection
+
+    def _send_console(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        # Console fallback (for development or when email is not configured)
+        print(f"\n{'='*60}")
+        print(f"[EMAIL SERVICE] CONSOLE FALLBACK - Email details:")
+        print(f"To: {message['to']}")
+        print(f"Subject: {message['subject']}")
+        print(message['text'].strip())
+        print(f"{'='*60}\n")
+        return {'success': True, 'message': 'Email logged to console', 'provider': 'console'}
+
+    def deliver(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """Deliver one message through the first configured provider"""
+        return self.deliver_batch([message])[0]
+
+    def deliver_batch(self, messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Deliver messages, reusing one provider connection for the batch"""
+        results = []
+
+        if self.resend_enabled and RESEND_AVAILABLE:
+            for message in messages:
                 try:
-                    params = {
-                        "from": self.from_email,
-                        "to": [email],
-                        "subject": subject,
-                        "html": html_content
-                    }
-
-                    email_response = resend.Emails.send(params)
-                    print(f"[EMAIL SERVICE] Email sent successfully via Resend to {email}")
-                    print(f"[EMAIL SERVICE] Resend ID: {email_response.get('id', 'N/A')}")
-
-                    return {
-                        'success': True,
-                        'message': 'Verification email sent successfully',
-                        'provider': 'resend'
-                    }
+                    results.append(self._send_resend(message))
                 except Exception as e:
                     error_msg = str(e)
                     print(f"[EMAIL SERVICE ERROR] Resend failed: {error_msg}")
@@ -210,23 +157,42 @@ class EmailService:
                     if "only send testing emails to your own email address" in error_msg.lower():
                         print(f"[EMAIL SERVICE] Resend requires domain verification for this recipient")
                         print(f"[EMAIL SERVICE] Add and verify your domain at: https://resend.com/domains")
-                        print(f"[EMAIL SERVICE] Or send to verified email: zahidsdet@gmail.com")
+                    results.append({'success': False, 'message': f'Resend failed: {error_msg}', 'provider': 'resend'})
+            return results
+
+        if self.smtp_enabled:
+            try:
+                with self._smtp_connection() as connection:
+                    for message in messages:
+                        try:
+                            connection.send_message(self._smtp_message(message))
+                            print(f"[EMAIL SERVICE] Email sent successfully via SMTP to {message['to']}")
+                            results.append({'success': True, 'message': 'Email sent successfully', 'provider': 'smtp'})
+                        except smtplib.SMTPException as e:
+                            results.append({'success': False, 'message': f'SMTP failed: {e}', 'provider': 'smtp'})
+            except (OSError, smtplib.SMTPException) as e:
+                print(f"[EMAIL SERVICE ERROR] SMTP connection failed: {e}")
+                results.extend(
+                    {'success': False, 'message': f'SMTP connection failed: {e}', 'provider': 'smtp'}
+                    for _ in messages[len(results):]
+                )
+            return results
+
+        return [self._send_console(message) for message in messages]
 
-                    # Fall through to console logging
-
-            # Console fallback (for development or when email is not configured)
-            print(f"\n{'='*60}")
-            print(f"[EMAIL SERVICE] CONSOLE FALLBACK - Email details:")
-            print(f"To: {email}")
-            print(f"Subject: {subject}")
-            print(f"Verification Code: {code}")
-            print(f"{'='*60}\n")
+    def send_verification_code(self, email: str, code: str) -> Dict[str, Any]:
+        """
+        Send verification code email now, waiting for the provider
 
-            return {
-                'success': True,
-                'message': 'Verification email sent successfully'
-            }
+        Args:
+            email: Recipient email address
+            code: 6-digit verification code
 
+        Returns:
+            Dict with success status and message
+        """
+        try:
+            return self.deliver(self.build_verification_code(email, code))
         except Exception as e:
             print(f"[EMAIL SERVICE ERROR] Failed to send email: {str(e)}")
             return {
@@ -236,7 +202,7 @@ class EmailService:
 
     def send_password_reset(self, email: str, reset_link: str) -> Dict[str, Any]:
         """
-        Send password reset email
+        Send password reset email now, waiting for the provider
 
         Args:
             email: Recipient email address
@@ -246,75 +212,19 @@ class EmailService:
             Dict with success status and message
         """
         try:
-            subject = f"Reset Your {self.app_name} Password"
-
-            html_content = f"""
-            <!DOCTYPE html>
-            <html>
-            <head>
-                <meta charset="UTF-8">
-                <meta name="viewport" content="width=device-width, initial-scale=1.0">
-                <style>
-                    body {{
-                        font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif;
-                        line-height: 1.6;
-                        color: #333;
-                        max-width: 600px;
-                        margin: 0 auto;
-                        padding: 20px;
-                    }}
-                    .container {{
-                        background-color: #ffffff;
-                        border-radius: 8px;
-                        padding: 40px;
-                        box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
-                    }}
-                    .button {{
-                        display: inline-block;
-                        padding: 12px 30px;
-                        background-color: #4299e1;
-                        color: white;
-                        text-decoration: none;
-                        border-radius: 6px;
-                        margin: 20px 0;
-                    }}
-                    .footer {{
-                        margin-top: 30px;
-                        padding-top: 20px;
-                        border-top: 1px solid #e2e8f0;
-                        color: #718096;
-                        font-size: 14px;
-                        text-align: center;
-                    }}
-                </style>
-            </head>
-            <body>
-                <div class="container">
-                    <h2>Reset Your Password</h2>
-                    <p>We received a request to reset your password for your {self.app_name} account.</p>
-                    <p>Click the button below to reset your password:</p>
-                    <a href="{reset_link}" class="button">Reset Password</a>
-                    <p>This link will expire in 1 hour.</p>
-                    <p>If you didn't request a password reset, please ignore this email.</p>
-                    <div class="footer">
-                        <p>&copy; 2024 {self.app_name}. All rights reserved.</p>
-                    </div>
-                </div>
-            </body>
-            </html>
-            """
-
-            print(f"\n[EMAIL SERVICE] Password reset email")
-            print(f"To: {email}")
-            print(f"Reset Link: {reset_link}\n")
-
-            return {
-                'success': True,
-                'message': 'Password reset email sent successfully'
-            }
-
+            return self.deliver(self.build_password_reset(email, reset_link))
         except Exception as e:
             return {
                 'success': False,
                 'message': f'Failed to send email: {str(e)}'
             }
+
+    def queue_verification_code(self, email: str, code: str) -> Dict[str, Any]:
+        """Queue a verification code email for the background sender"""
+        from services.email_outbox import enqueue_email
+        return enqueue_email(self.build_verification_code(email, code))
+
+    def queue_password_reset(self, email: str, reset_link: str) -> Dict[str, Any]:
+        """Queue a password reset email for the background sender"""
+        from services.email_outbox import enqueue_email
+        return enqueue_email(self.build_password_reset(email, reset_link))
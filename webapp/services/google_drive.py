@@ -10,6 +10,8 @@ from googleapiclient.discovery import build
 from googleapiclient.http import MediaIoBaseUpload
 from googleapiclient.errors import HttpError
 
+DEFAULT_CHUNK_SIZE = 5 * 1024 * 1024  # bytes per resumable upload request
+
 class GoogleDriveService:
     """Google Drive service for file operations"""
 
@@ -51,7 +53,7 @@ class GoogleDriveService:
             print(f"[ERROR] Failed to initialize Google Drive service: {e}")
             self.service = None
 
-    def upload_file(self, file_data, filename, mimetype='image/jpeg'):
+    def upload_file(self, file_data, filename, mimetype='image/jpeg', public=True, chunksize=DEFAULT_CHUNK_SIZE):
         """
         Upload a file to Google Drive
 
@@ -59,6 +61,8 @@ class GoogleDriveService:
             file_data: File data (bytes or file object)
             filename: Name for the file
             mimetype: MIME type of the file
+            public: Whether anyone with the link can view the file
+            chunksize: Bytes sent per request of the resumable upload
 
         Returns:
             dict: {'success': bool, 'file_id': str, 'web_view_link': str, 'direct_link': str}
@@ -81,7 +85,7 @@ class GoogleDriveService:
                 file_data = io.BytesIO(file_data)
 
             # Upload file
-            media = MediaIoBaseUpload(file_data, mimetype=mimetype, resumable=True)
+            media = MediaIoBaseUpload(file_data, mimetype=mimetype, chunksize=chunksize, resumable=True)
             file = self.service.files().create(
                 body=file_metadata,
                 media_body=media,
@@ -91,10 +95,11 @@ class GoogleDriveService:
             file_id = file.get('id')
 
             # Make the file publicly accessible
-            self.service.permissions().create(
-                fileId=file_id,
-                body={'type': 'anyone', 'role': 'reader'}
-            ).execute()
+            if public:
+                self.service.permissions().create(
+                    fileId=file_id,
+                    body={'type': 'anyone', 'role': 'reader'}
+                ).execute()
 
             # Get direct download link
             direct_link = f"https://drive.google.com/uc?export=view&id={file_id}"
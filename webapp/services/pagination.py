@@ -0,0 +1,86 @@
+"""
+Keyset pagination for newest-first listings
+"""
+
+import base64
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from flask import current_app, request
+from sqlalchemy import and_, or_
+
+MAX_PER_PAGE = 100
+
+
+class KeysetPage:
+    """One page of a listing and the cursor of the page after it"""
+
+    def __init__(self, items: List, next_cursor: Optional[str], cursor: Optional[str]):
+        self.items = items
+        self.next_cursor = next_cursor
+        self.cursor = cursor
+
+    @property
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+    @property
+    def is_first(self) -> bool:
+        return not self.cursor
+
+
+def encode_cursor(created_at: Optional[datetime], row_id: int) -> str:
+    """Opaque cursor for the position after a row"""
+    raw = f"{created_at.isoformat() if created_at else ''}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[Tuple[Optional[datetime], int]]:
+    """(created_at, id) of a cursor, or None if it is missing or malformed"""
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode()
+        created_at, row_id = raw.rsplit('|', 1)
+        return (datetime.fromisoformat(created_at) if created_at else None), int(row_id)
+    except (ValueError, UnicodeDecodeError):
+        return None
+
+
+def page_args() -> Tuple[Optional[str], int]:
+    """Cursor and page size from the query string"""
+    default = current_app.config.get('ITEMS_PER_PAGE', 20)
+    per_page = request.args.get('per_page', default, type=int)
+    return request.args.get('cursor'), max(1, min(per_page, MAX_PER_PAGE))
+
+
+def keyset_paginate(query, model, cursor: Optional[str] = None, per_page: int = 20) -> KeysetPage:
+    """Page through query newest first on (created_at, id)
+
+    Each page seeks past the last row of the previous one, so deep pages cost
+    the same as the first with an index on (user_id, created_at). Rows without
+    created_at come first, matching a backward scan of that index.
+    """
+    position = decode_cursor(cursor)
+    if position:
+        created_at, row_id = position
+        if created_at is None:
+            query = query.filter(or_(
+                and_(model.created_at.is_(None), model.id < row_id),
+                model.created_at.isnot(None)
+            ))
+        else:
+            query = query.filter(or_(
+                model.created_at < created_at,
+                and_(model.created_at == created_at, model.id < row_id)
+            ))
+
+    rows = query.order_by(None).order_by(
+        model.created_at.desc().nulls_first(), model.id.desc()
+    ).limit(per_page + 1).all()
+
+    next_cursor = None
+    if len(rows) > per_page:
+        rows = rows[:per_page]
+        next_cursor = encode_cursor(rows[-1].created_at, rows[-1].id)
+    return KeysetPage(rows, next_cursor, cursor if position else None)
@@ -0,0 +1,177 @@
+"""
+Profile Image Service for resizing and publishing profile pictures in the background
+"""
+
+import hashlib
+import io
+import os
+import re
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from extensions import db
+from models.user import User
+
+# Pillow is optional; without it the original image is published unresized
+try:
+    from PIL import Image, ImageOps
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+# Square variants in pixels; the stored profile_picture points at the largest
+VARIANT_SIZES = (64, 128, 512)
+WEBP_QUALITY = 82
+IMMUTABLE_CACHE_CONTROL = '31536000'  # content-hashed names never change
+VARIANT_PATTERN = re.compile(r'_(\d+)\.webp(?=$|\?)')
+
+_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='profile-images')
+
+
+def avatar_variant(url: Optional[str], size='40px') -> Optional[str]:
+    """Template filter: URL of the smallest variant sharp at size on 2x displays"""
+    if not url or not VARIANT_PATTERN.search(url):
+        return url  # Pictures uploaded before variants existed
+    try:
+        needed = int(str(size).rstrip('px')) * 2
+    except ValueError:
+        return url
+    variant = next((s for s in VARIANT_SIZES if s >= needed), VARIANT_SIZES[-1])
+    return VARIANT_PATTERN.sub(f'_{variant}.webp', url)
+
+
+def variant_urls(url: Optional[str]) -> List[str]:
+    """URLs of every variant of a stored profile picture, or just the picture itself"""
+    if not url:
+        return []
+    if not VARIANT_PATTERN.search(url):
+        return [url]
+    return [VARIANT_PATTERN.sub(f'_{size}.webp', url) for size in VARIANT_SIZES]
+
+
+def save_upload(file) -> str:
+    """Stream an uploaded file to a temp file and return its path"""
+    fd, path = tempfile.mkstemp(prefix='profile_', suffix='.upload')
+    with os.fdopen(fd, 'wb') as f:
+        while True:
+            chunk = file.stream.read(64 * 1024)
+            if not chunk:
+                break
+            f.write(chunk)
+    return path
+
+
+def _file_hash(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(64 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()[:16]
+
+
+def _render_variants(path: str) -> Dict[int, bytes]:
+    """WebP bytes of every square variant of the image at path"""
+    with Image.open(path) as image:
+        image.draft('RGB', (VARIANT_SIZES[-1] * 2, VARIANT_SIZES[-1] * 2))  # cheap JPEG downscale while decoding
+        image = ImageOps.exif_transpose(image)
+        image = image.convert('RGBA' if image.mode in ('RGBA', 'LA', 'P') else 'RGB')
+
+        variants = {}
+        for size in sorted(VARIANT_SIZES, reverse=True):
+            image = ImageOps.fit(image, (size, size), Image.LANCZOS)
+            buffer = io.BytesIO()
+            image.save(buffer, 'WEBP', quality=WEBP_QUALITY, method=4)
+            variants[size] = buffer.getvalue()
+        return variants
+
+
+def _save_all(storage, files: Dict) -> Tuple[Optional[Dict], str]:
+    """Save every (filename, data, content_type) in files; on a failure remove what was saved
+
+    Returns ({name: url}, '') or (None, error).
+    """
+    saved_keys = []
+    urls = {}
+    for name, (filename, data, content_type) in files.items():
+        result = storage.save(filename, data, content_type, cache_control=IMMUTABLE_CACHE_CONTROL)
+        if not result['success']:
+            for key in saved_keys:
+                storage.delete(key)
+            return None, result['error']
+        saved_keys.append(result['key'])
+        urls[name] = result['url']
+    return urls, ''
+
+
+def _publish(app, files: Dict, primary) -> str:
+    """Store a set of files on one backend, the configured one or else local disk; returns the primary's URL
+
+    Variant URLs are derived from each other, so a set split across backends
+    would point avatars at files that were never stored. Backends whose keys
+    are not the file names (Drive file ids) get only the primary file, since
+    its variants could neither be found from its URL nor deleted with it.
+    """
+    from services.storage import get_storage
+    storage = get_storage('profiles', app)
+    urls, error = _save_all(storage, files if storage.named_keys else {primary: files[primary]})
+    if urls is None and storage.name != 'local':
+        print(f"[WARNING] Storing profile picture on local disk, {storage.name} upload failed: {error}")
+        urls, error = _save_all(get_storage('profiles', app, 'local'), files)
+    if urls is None:
+        raise RuntimeError(error)
+    return urls[primary]
+
+
+def delete_profile_picture_files(app, url: Optional[str]) -> bool:
+    """Delete a stored profile picture and all of its variants"""
+    from services.storage import storage_for_url
+    deleted = True
+    for variant in variant_urls(url):
+        storage = storage_for_url('profiles', variant, app)
+        key = storage.key_from_url(variant) if storage else None
+        if storage and key:
+            deleted = storage.delete(key) and deleted
+        elif storage:
+            deleted = False
+    return deleted
+
+
+def process_profile_picture(app, user_id: int, path: str, file_ext: str):
+    """Resize, publish and assign an uploaded profile picture; runs on the worker pool"""
+    try:
+        content_hash = _file_hash(path)
+        if PIL_AVAILABLE:
+            files = {
+                size: (f"user_{user_id}_{content_hash}_{size}.webp", data, 'image/webp')
+                for size, data in _render_variants(path).items()
+            }
+            picture = _publish(app, files, VARIANT_SIZES[-1])
+        else:
+            with open(path, 'rb') as f:
+                data = f.read()
+            content_type = 'image/jpeg' if file_ext in ('jpg', 'jpeg') else f'image/{file_ext}'
+            files = {'original': (f"user_{user_id}_{content_hash}.{file_ext}", data, content_type)}
+            picture = _publish(app, files, 'original')
+
+        with app.app_context():
+            user = db.session.get(User, user_id)
+            if user is None:
+                delete_profile_picture_files(app, picture)
+                return
+            old_picture = user.profile_picture
+            user.profile_picture = picture
+            db.session.commit()
+            if old_picture and old_picture != picture:
+                delete_profile_picture_files(app, old_picture)
+        print(f"[SUCCESS] Profile picture for user {user_id} published")
+    except Exception as e:
+        print(f"[ERROR] Failed to process profile picture for user {user_id}: {e}")
+    finally:
+        os.remove(path)
+
+
+def submit_profile_picture(app, user_id: int, file, file_ext: str):
+    """Spool an upload to disk and process it in the background"""
+    path = save_upload(file)
+    _executor.submit(process_profile_picture, app, user_id, path, file_ext)
@@ -0,0 +1,44 @@
+"""
+Eager-loading query helpers for views that render related rows
+"""
+
+from sqlalchemy.orm import configure_mappers, contains_eager, joinedload
+from models.user import Resume, Application
+
+
+def _configured():
+    # Backref attributes such as Application.job exist once mappers are configured
+    configure_mappers()
+
+
+def user_applications_query(user_id):
+    """A user's applications, newest first, with their job descriptions"""
+    _configured()
+    return Application.query.options(
+        joinedload(Application.job)
+    ).filter(Application.user_id == user_id).order_by(Application.created_at.desc())
+
+
+def recent_applications_query(limit):
+    """Latest applications across all users, with their users and job descriptions"""
+    _configured()
+    return Application.query.options(
+        joinedload(Application.user),
+        joinedload(Application.job)
+    ).order_by(Application.created_at.desc()).limit(limit)
+
+
+def user_resumes_query(user_id):
+    """A user's resumes, newest first, with their job descriptions"""
+    _configured()
+    return Resume.query.options(
+        joinedload(Resume.job)
+    ).filter(Resume.user_id == user_id).order_by(Resume.created_at.desc())
+
+
+def application_search_query(user_id, *criteria):
+    """A user's applications joined to their job descriptions, filtered by criteria"""
+    _configured()
+    return Application.query.join(Application.job).options(
+        contains_eager(Application.job)
+    ).filter(Application.user_id == user_id, *criteria)
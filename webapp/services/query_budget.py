@@ -0,0 +1,57 @@
+"""
+Query Budget Service for catching N+1 query regressions per request
+"""
+
+import logging
+from functools import wraps
+
+from flask import g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+
+class QueryBudgetExceeded(RuntimeError):
+    """A view ran more SQL statements than its budget allows"""
+
+
+@event.listens_for(Engine, 'before_cursor_execute')
+def _count_query(conn, cursor, statement, parameters, context, executemany):
+    if has_request_context() and 'query_count' in g:
+        g.query_count += 1
+
+
+def query_budget(limit):
+    """Override the default query budget of one view"""
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            g.query_budget = limit
+            return f(*args, **kwargs)
+        return decorated_function
+    return decorator
+
+
+def init_query_budget(app):
+    """Count SQL statements per request and report views over budget
+
+    Views over QUERY_BUDGET are logged; with QUERY_BUDGET_STRICT (meant for
+    tests) the request fails instead, so N+1 regressions break the build.
+    """
+    @app.before_request
+    def start_query_count():
+        g.query_count = 0
+
+    @app.after_request
+    def check_query_count(response):
+        count = g.get('query_count', 0)
+        budget = g.get('query_budget', app.config.get('QUERY_BUDGET', 20))
+        if count > budget:
+            message = f"{request.endpoint} ran {count} queries (budget {budget})"
+            if app.config.get('QUERY_BUDGET_STRICT'):
+                raise QueryBudgetExceeded(message)
+            logger.warning(message)
+        if app.debug:
+            response.headers['X-Query-Count'] = str(count)
+        return response
@@ -0,0 +1,253 @@
+"""
+Resume Worker Service for generating tailored resumes in the background
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Optional
+
+from sqlalchemy import func, inspect, text
+from extensions import db
+from models.user import Resume
+from services.storage import store_document
+
+# The CLI pipeline lives in the repository root and imports its own config
+# module, so it runs in a child process instead of inside the web app
+REPO_ROOT = Path(__file__).resolve().parents[2]
+SUCCESS_MARKER = 'Resume generated successfully:'
+
+# A processing row is only returned to the queue once it has been running this
+# much longer than the job timeout, i.e. the worker that claimed it is gone
+STALE_GRACE = timedelta(minutes=5)
+REQUEUE_INTERVAL = 60  # seconds between checks for stale processing rows
+
+
+class ResumeWorker:
+    """Database-polling worker pool that turns pending Resume rows into documents
+
+    Routes only insert a pending Resume; this worker claims rows with a
+    conditional UPDATE, runs the CLI tailoring pipeline with bounded
+    concurrency and records the outcome. At most one resume per user is in
+    flight and users are served round-robin, so one user's batch cannot
+    starve everyone else. Claims record when processing started, so several
+    worker processes can share a database: each only requeues rows whose
+    worker must have died, never ones another process is still generating.
+    """
+
+    def __init__(self, app, max_workers: int = 2, poll_interval: float = 2, job_timeout: float = 600):
+        """Initialize the worker for a Flask app"""
+        self.app = app
+        self.max_workers = max_workers
+        self.poll_interval = poll_interval
+        self.job_timeout = job_timeout
+        self.python = os.getenv('RESUME_WORKER_PYTHON') or sys.executable
+
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='resume-worker')
+        self._in_flight: Dict[int, int] = {}  # user_id -> resume_id
+        self._last_served: Dict[int, float] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._has_started_at = False
+        self._last_requeue = 0.0
+
+    def start(self):
+        """Requeue interrupted jobs and start polling in a daemon thread"""
+        if self._thread and self._thread.is_alive():
+            return
+        with self.app.app_context():
+            self._has_started_at = self._ensure_started_at_column()
+            self._requeue_interrupted()
+        self._thread = threading.Thread(target=self.run, name='resume-worker-poller', daemon=True)
+        self._thread.start()
+        print(f"[OK] Resume worker started with {self.max_workers} slots")
+
+    def stop(self, wait: bool = True):
+        """Stop polling and optionally wait for running jobs"""
+        self._stopped.set()
+        self._wakeup.set()
+        self._executor.shutdown(wait=wait)
+
+    def notify(self):
+        """Wake the poller early, e.g. right after a resume was queued"""
+        self._wakeup.set()
+
+    def run(self):
+        """Poll for pending resumes until stopped"""
+        while not self._stopped.is_set():
+            try:
+                with self.app.app_context():
+                    if time.monotonic() - self._last_requeue >= REQUEUE_INTERVAL:
+                        self._requeue_interrupted()
+                    self.dispatch()
+            except Exception as e:
+                print(f"[ERROR] Resume worker poll failed: {e}")
+            self._wakeup.wait(self.poll_interval)
+            self._wakeup.clear()
+
+    @staticmethod
+    def _ensure_started_at_column() -> bool:
+        """Add resumes.started_at if missing (see migrations/add_resume_started_at.py)
+
+        The column is only used through SQL here and is not mapped on Resume,
+        so the rest of the app keeps working on a database without it.
+        """
+        try:
+            columns = {column['name'] for column in inspect(db.engine).get_columns('resumes')}
+            if 'started_at' not in columns:
+                with db.engine.begin() as connection:
+                    connection.execute(text("ALTER TABLE resumes ADD COLUMN started_at TIMESTAMP"))
+                print("[OK] Added resumes.started_at for resume worker claims")
+            return True
+        except Exception as e:
+            print(f"[WARNING] resumes.started_at unavailable, interrupted resumes will not be requeued: {e}")
+            return False
+
+    def _requeue_interrupted(self):
+        """Return rows whose worker stopped mid-generation to the queue"""
+        self._last_requeue = time.monotonic()
+        if not self._has_started_at:
+            return
+        cutoff = datetime.utcnow() - timedelta(seconds=self.job_timeout) - STALE_GRACE
+        # Rows without started_at were claimed before claims were timestamped
+        count = db.session.execute(text(
+            "UPDATE resumes SET status = 'pending' WHERE status = 'processing' "
+            "AND (started_at IS NULL OR started_at < :cutoff)"
+        ), {'cutoff': cutoff}).rowcount
+        db.session.commit()
+        if count:
+            print(f"[WARNING] Requeued {count} resumes interrupted by a stopped worker")
+
+    def dispatch(self) -> int:
+        """Claim pending resumes for free slots; returns the number started"""
+        with self._lock:
+            free_slots = self.max_workers - len(self._in_flight)
+            busy_users = list(self._in_flight)
+        if free_slots <= 0:
+            return 0
+
+        # Oldest pending resume of every user without a job in flight
+        query = db.session.query(Resume.user_id, func.min(Resume.id)).filter(Resume.status == 'pending')
+        if busy_users:
+            query = query.filter(Resume.user_id.notin_(busy_users))
+        candidates = query.group_by(Resume.user_id).all()
+
+        # Round-robin: users served least recently go first, then by queue age
+        candidates.sort(key=lambda row: (self._last_served.get(row[0], 0), row[1]))
+
+        started = 0
+        for user_id, resume_id in candidates:
+            if started >= free_slots:
+                break
+            if not self._claim(resume_id):
+                continue
+            with self._lock:
+                self._in_flight[user_id] = resume_id
+                self._last_served[user_id] = time.monotonic()
+            self._executor.submit(self._process, user_id, resume_id)
+            started += 1
+        return started
+
+    def _claim(self, resume_id: int) -> bool:
+        """Atomically move a resume from pending to processing"""
+        if self._has_started_at:
+            claimed = db.session.execute(text(
+                "UPDATE resumes SET status = 'processing', error_message = NULL, started_at = :now "
+                "WHERE id = :id AND status = 'pending'"
+            ), {'id': resume_id, 'now': datetime.utcnow()}).rowcount
+        else:
+            claimed = Resume.query.filter_by(id=resume_id, status='pending').update(
+                {'status': 'processing', 'error_message': None}, synchronize_session=False
+            )
+        db.session.commit()
+        return claimed == 1
+
+    def _process(self, user_id: int, resume_id: int):
+        """Generate one resume and record the result"""
+        try:
+            with self.app.app_context():
+                resume = db.session.get(Resume, resume_id)
+                try:
+                    if resume.job is None:
+                        raise ValueError('Resume has no job description to tailor to')
+                    resume_path = self._run_pipeline(self._job_details(resume))
+                    resume.file_path = store_document(self.app, user_id, resume_path)
+                    resume.file_type = Path(resume_path).suffix.lstrip('.') or 'docx'
+                    resume.status = 'completed'
+                    resume.completed_at = datetime.utcnow()
+                except Exception as e:
+                    resume.status = 'failed'
+                    resume.error_message = str(e)[:2000]
+                    print(f"[ERROR] Resume {resume_id} failed: {e}")
+                db.session.commit()
+        except Exception as e:
+            print(f"[ERROR] Could not record result of resume {resume_id}: {e}")
+        finally:
+            with self._lock:
+                self._in_flight.pop(user_id, None)
+            self._wakeup.set()
+
+    @staticmethod
+    def _job_details(resume: Resume) -> Dict:
+        """Job details in the format the CLI ResumeHandler expects"""
+        job = resume.job
+        return {
+            'job_id': job.job_id,
+            'title': job.title,
+            'company': job.company or 'Unknown',
+            'location': job.location or '',
+            'description': job.description or '',
+            'url': job.source_url or ''
+        }
+
+    def _run_pipeline(self, job_details: Dict) -> str:
+        """Run the CLI resume pipeline for one job and return the document path"""
+        with tempfile.NamedTemporaryFile('w', suffix='.json', delete=False, encoding='utf-8') as f:
+            json.dump(job_details, f)
+            job_file = f.name
+
+        try:
+            result = subprocess.run(
+                [self.python, 'main.py', '--mode', 'resume', '--job-file', job_file],
+                cwd=str(REPO_ROOT),
+                capture_output=True,
+                text=True,
+                timeout=self.job_timeout
+            )
+        except subprocess.TimeoutExpired:
+            raise RuntimeError(f'Resume generation timed out after {self.job_timeout:.0f}s')
+        finally:
+            os.unlink(job_file)
+
+        for line in result.stdout.splitlines():
+            if line.startswith(SUCCESS_MARKER):
+                resume_path = Path(line[len(SUCCESS_MARKER):].strip())
+                return str(resume_path if resume_path.is_absolute() else REPO_ROOT / resume_path)
+
+        output = (result.stderr or result.stdout).strip().splitlines()
+        raise RuntimeError(output[-1] if output else f'Resume pipeline exited with code {result.returncode}')
+
+
+# Singleton instance
+_resume_worker = None
+
+def get_resume_worker(app=None) -> Optional[ResumeWorker]:
+    """Get the resume worker, creating it for app on first use"""
+    global _resume_worker
+    if _resume_worker is None and app is not None:
+        _resume_worker = ResumeWorker(
+            app,
+            max_workers=app.config.get('RESUME_WORKER_CONCURRENCY', 2),
+            poll_interval=app.config.get('RESUME_WORKER_POLL_INTERVAL', 2),
+            job_timeout=app.config.get('RESUME_WORKER_TIMEOUT', 600)
+        )
+    return _resume_worker
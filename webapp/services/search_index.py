@@ -0,0 +1,244 @@
+"""
+Search Index Service for the dashboard's global typeahead search
+
+Documents for resumes, job descriptions and applications live in one
+search_documents table: an FTS5 virtual table on SQLite and a table with a
+generated tsvector column and GIN index on PostgreSQL. ORM hooks keep it in
+sync on writes; rebuild_search_index() repopulates it from the source tables.
+"""
+
+import re
+from types import SimpleNamespace
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import event, text
+from sqlalchemy.orm.attributes import get_history
+from extensions import db
+from models.user import JobDescription, Resume, Application
+
+# Document ids pack the kind into the low bits so one integer key (the FTS5
+# rowid, the PostgreSQL primary key) addresses a document
+KIND_CODES = {'resume': 1, 'job': 2, 'application': 3}
+KIND_MODELS = {Resume: 'resume', JobDescription: 'job', Application: 'application'}
+
+SQLITE_DDL = [
+    """CREATE VIRTUAL TABLE IF NOT EXISTS search_documents USING fts5(
+        kind UNINDEXED, ref_id UNINDEXED, user_id UNINDEXED,
+        title, body, detail UNINDEXED, created_at UNINDEXED,
+        tokenize = 'unicode61 remove_diacritics 2'
+    )"""
+]
+POSTGRES_DDL = [
+    """CREATE TABLE IF NOT EXISTS search_documents (
+        doc_id BIGINT PRIMARY KEY,
+        kind VARCHAR(20) NOT NULL,
+        ref_id INTEGER NOT NULL,
+        user_id INTEGER NOT NULL,
+        title TEXT NOT NULL DEFAULT '',
+        body TEXT NOT NULL DEFAULT '',
+        detail TEXT NOT NULL DEFAULT '',
+        created_at TIMESTAMP,
+        tsv TSVECTOR GENERATED ALWAYS AS (
+            setweight(to_tsvector('simple', title), 'A') || setweight(to_tsvector('simple', body), 'B')
+        ) STORED
+    )""",
+    "CREATE INDEX IF NOT EXISTS ix_search_documents_tsv ON search_documents USING GIN (tsv)",
+    "CREATE INDEX IF NOT EXISTS ix_search_documents_user ON search_documents (user_id)",
+]
+
+# Set by init_search_index(): 'fts5', 'tsvector', or None when no index exists
+_backend: Optional[str] = None
+
+
+def _doc_id(kind: str, ref_id: int) -> int:
+    return ref_id * 4 + KIND_CODES[kind]
+
+
+def _tokens(query: str) -> List[str]:
+    return re.findall(r'\w+', query.lower())[:8]
+
+
+def init_search_index(app):
+    """Create the search index for the app's database, backfilling it when new"""
+    global _backend
+    with app.app_context():
+        try:
+            dialect = db.engine.dialect.name
+            if dialect not in ('sqlite', 'postgresql'):
+                print(f"[WARNING] No full-text search support for {dialect}; search uses LIKE")
+                return
+
+            existed = db.inspect(db.engine).has_table('search_documents')
+            with db.engine.begin() as connection:
+                for statement in SQLITE_DDL if dialect == 'sqlite' else POSTGRES_DDL:
+                    connection.execute(text(statement))
+            _backend = 'fts5' if dialect == 'sqlite' else 'tsvector'
+
+            if not existed:
+                count = rebuild_search_index()
+                print(f"[OK] Built search index with {count} documents")
+        except Exception as e:
+            db.session.rollback()
+            _backend = None
+            print(f"[WARNING] Full-text search index unavailable, search uses LIKE: {e}")
+
+
+def is_available() -> bool:
+    return _backend is not None
+
+
+def _job_fields(connection, job_id) -> Dict:
+    if job_id is None:
+        return {}
+    row = connection.execute(
+        text("SELECT title, company, location FROM job_descriptions WHERE id = :id"), {'id': job_id}
+    ).first()
+    return dict(row._mapping) if row else {}
+
+
+def _document(connection, kind: str, target) -> Dict:
+    """Searchable fields of one row"""
+    if kind == 'job':
+        title = target.title or ''
+        body = ' '.join(filter(None, [target.company, target.location, target.skills]))
+        detail = target.company or ''
+    elif kind == 'resume':
+        job = _job_fields(connection, target.job_id)
+        title = target.title or ''
+        body = ' '.join(filter(None, [job.get('title'), job.get('company')]))
+        detail = ''
+    else:
+        job = _job_fields(connection, target.job_id)
+        title = f"{job.get('title') or 'Unknown Job'} at {job.get('company') or 'Unknown Company'}"
+        body = ' '.join(filter(None, [target.status, job.get('location'), target.notes]))
+        detail = target.status or ''
+
+    return {
+        'doc_id': _doc_id(kind, target.id),
+        'kind': kind,
+        'ref_id': target.id,
+        'user_id': target.user_id,
+        'title': title,
+        'body': body,
+        'detail': detail,
+        'created_at': target.created_at or datetime.utcnow()
+    }
+
+
+def _delete_document(connection, kind: str, ref_id: int):
+    column = 'rowid' if _backend == 'fts5' else 'doc_id'
+    connection.execute(
+        text(f"DELETE FROM search_documents WHERE {column} = :doc_id"), {'doc_id': _doc_id(kind, ref_id)}
+    )
+
+
+def _write_document(connection, kind: str, target):
+    _delete_document(connection, kind, target.id)
+    document = _document(connection, kind, target)
+    if _backend == 'fts5':
+        if isinstance(document['created_at'], datetime):
+            document['created_at'] = document['created_at'].isoformat(sep=' ')
+        connection.execute(text(
+            "INSERT INTO search_documents (rowid, kind, ref_id, user_id, title, body, detail, created_at) "
+            "VALUES (:doc_id, :kind, :ref_id, :user_id, :title, :body, :detail, :created_at)"
+        ), document)
+    else:
+        connection.execute(text(
+            "INSERT INTO search_documents (doc_id, kind, ref_id, user_id, title, body, detail, created_at) "
+            "VALUES (:doc_id, :kind, :ref_id, :user_id, :title, :body, :detail, :created_at)"
+        ), document)
+
+
+def _after_insert(mapper, connection, target):
+    if _backend:
+        _write_document(connection, KIND_MODELS[mapper.class_], target)
+
+
+def _after_update(mapper, connection, target):
+    if not _backend:
+        return
+    kind = KIND_MODELS[mapper.class_]
+    _write_document(connection, kind, target)
+
+    # Resume and application documents embed their job's title and company
+    if kind == 'job' and any(get_history(target, attr).has_changes() for attr in ('title', 'company', 'location')):
+        dependents = [
+            ('resume', "SELECT id, user_id, job_id, title, created_at FROM resumes WHERE job_id = :id"),
+            ('application', "SELECT id, user_id, job_id, status, notes, created_at FROM applications WHERE job_id = :id"),
+        ]
+        for dependent_kind, query in dependents:
+            for row in connection.execute(text(query), {'id': target.id}).all():
+                _write_document(connection, dependent_kind, SimpleNamespace(**row._mapping))
+
+
+def _after_delete(mapper, connection, target):
+    if _backend:
+        _delete_document(connection, KIND_MODELS[mapper.class_], target.id)
+
+
+for _model in KIND_MODELS:
+    event.listen(_model, 'after_insert', _after_insert)
+    event.listen(_model, 'after_update', _after_update)
+    event.listen(_model, 'after_delete', _after_delete)
+
+
+def index_rows(model, ids: Iterable[int]):
+    """Index rows written with Core statements, which bypass the ORM hooks"""
+    ids = list(ids)
+    if not _backend or not ids:
+        return
+    connection = db.session.connection()
+    kind = KIND_MODELS[model]
+    for row in model.query.filter(model.id.in_(ids)):
+        _write_document(connection, kind, row)
+
+
+def rebuild_search_index() -> int:
+    """Repopulate the index from the source tables; returns the document count"""
+    connection = db.session.connection()
+    connection.execute(text("DELETE FROM search_documents"))
+    count = 0
+    for model, kind in KIND_MODELS.items():
+        for row in model.query.yield_per(1000):
+            _write_document(connection, kind, row)
+            count += 1
+    db.session.commit()
+    return count
+
+
+def search_documents(user_id: int, query: str, limit: int = 15) -> List[Dict]:
+    """Best-ranked documents of a user matching every word of query as a prefix"""
+    tokens = _tokens(query)
+    if not tokens:
+        return []
+
+    if _backend == 'fts5':
+        match = '{title body} : ' + ' '.join(f'"{token}"*' for token in tokens)
+        rows = db.session.execute(text(
+            "SELECT kind, ref_id, title, detail, created_at FROM search_documents "
+            "WHERE search_documents MATCH :match AND user_id = :user_id "
+            "ORDER BY bm25(search_documents, 0, 0, 0, 10.0, 1.0, 0, 0) LIMIT :limit"
+        ), {'match': match, 'user_id': user_id, 'limit': limit})
+    elif _backend == 'tsvector':
+        rows = db.session.execute(text(
+            "SELECT kind, ref_id, title, detail, created_at FROM search_documents "
+            "WHERE user_id = :user_id AND tsv @@ to_tsquery('simple', :match) "
+            "ORDER BY ts_rank(tsv, to_tsquery('simple', :match)) DESC, created_at DESC LIMIT :limit"
+        ), {'match': ' & '.join(f'{token}:*' for token in tokens), 'user_id': user_id, 'limit': limit})
+    else:
+        return []
+
+    results = []
+    for row in rows:
+        created_at = row.created_at
+        if isinstance(created_at, str):
+            created_at = datetime.fromisoformat(created_at)
+        results.append({
+            'kind': row.kind,
+            'id': int(row.ref_id),
+            'title': row.title,
+            'detail': row.detail,
+            'created_at': created_at
+        })
+    return results
@@ -0,0 +1,391 @@
+"""
+Storage Service with one interface over local disk, Supabase Storage and Google Drive
+
+Files live in areas: 'profiles' for public profile pictures and 'documents'
+for generated resumes and cover letters. get_storage(area) returns the
+configured backend for an area (STORAGE_BACKEND: auto, local, supabase or
+drive); 'auto' uses Supabase when it is configured and local disk otherwise,
+and keeps documents on local disk unless SUPABASE_DOCUMENTS_BUCKET is set.
+Backends reuse the process-wide Supabase and Drive clients, stream uploads
+from paths and file objects, and resolve public or signed URLs through a
+read-through cache.
+"""
+
+import io
+import mimetypes
+import os
+import shutil
+import tempfile
+import threading
+import time
+from typing import Dict, Optional, Tuple, Union
+
+# Bytes, a readable file object, or the path of a file to stream
+Source = Union[bytes, str, io.IOBase]
+
+AREAS = ('profiles', 'documents')
+SIGNED_URL_TTL = 3600  # seconds a signed download link stays valid
+DRIVE_CHUNK_SIZE = 5 * 1024 * 1024  # resumable upload and download chunk size
+
+
+class UrlCache:
+    """Read-through TTL cache of URLs keyed by (backend, bucket, key)"""
+
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self._entries: Dict[Tuple, Tuple[float, str]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple, resolve, ttl: Optional[float] = None) -> Optional[str]:
+        """Cached URL for key, calling resolve() on a miss; ttl None caches until invalidated"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry and entry[0] > now:
+            return entry[1]
+
+        url = resolve()
+        if url:
+            with self._lock:
+                if len(self._entries) >= self.max_entries:
+                    self._entries.clear()
+                self._entries[key] = (now + ttl if ttl is not None else float('inf'), url)
+        return url
+
+    def invalidate(self, key: Tuple):
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+_url_cache = UrlCache()
+
+
+def guess_content_type(name: str, default: str = 'application/octet-stream') -> str:
+    return mimetypes.guess_type(name)[0] or default
+
+
+class StorageBackend:
+    """Interface every storage backend implements
+
+    save() returns {'success': bool, 'key': str, 'url': str, 'error': str}. The
+    key addresses the file in later calls; url is what gets stored for public
+    files (None when the file can only be served through open()).
+    """
+
+    name = None
+    # Public URLs never change; signed URLs are dropped well before they expire
+    url_ttl: Optional[float] = None
+    # Keys (and URLs) are the names given to save(), so sibling files can be found by name
+    named_keys = True
+
+    def is_available(self) -> bool:
+        raise NotImplementedError
+
+    def save(self, key: str, source: Source, content_type: Optional[str] = None,
+             cache_control: Optional[str] = None) -> Dict:
+        raise NotImplementedError
+
+    def delete(self, key: str) -> bool:
+        raise NotImplementedError
+
+    def open(self, key: str):
+        """Readable binary file object with the file's contents"""
+        raise NotImplementedError
+
+    def _resolve_url(self, key: str) -> Optional[str]:
+        return None
+
+    def url(self, key: str) -> Optional[str]:
+        """Public or signed URL of a file, or None when it must be served through open()"""
+        return _url_cache.get(self._cache_key(key), lambda: self._resolve_url(key), self.url_ttl)
+
+    def _cache_key(self, key: str) -> Tuple:
+        return (self.name, getattr(self, 'bucket', None), key)
+
+    def owns_url(self, url: str) -> bool:
+        return self.key_from_url(url) is not None
+
+    def key_from_url(self, url: str) -> Optional[str]:
+        return None
+
+
+class LocalStorage(StorageBackend):
+    """Files under a directory; url_prefix makes them servable as static files"""
+
+    name = 'local'
+
+    def __init__(self, root: str, url_prefix: Optional[str] = None):
+        self.root = root
+        self.url_prefix = url_prefix.strip('/') if url_prefix else None
+
+    def is_available(self) -> bool:
+        return True
+
+    def path(self, key: str) -> str:
+        path = os.path.abspath(os.path.join(self.root, key))
+        if not path.startswith(os.path.abspath(self.root) + os.sep):
+            raise ValueError(f'Invalid storage key: {key}')
+        return path
+
+    def save(self, key, source, content_type=None, cache_control=None) -> Dict:
+        try:
+            path = self.path(key)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Write to a temp file first so readers never see a partial file
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.upload_')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    if isinstance(source, bytes):
+                        f.write(source)
+                    elif isinstance(source, str):
+                        with open(source, 'rb') as src:
+                            shutil.copyfileobj(src, f, 1024 * 1024)
+                    else:
+                        shutil.copyfileobj(source, f, 1024 * 1024)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.remove(tmp_path)
+                raise
+            return {'success': True, 'key': key, 'url': self._resolve_url(key)}
+        except Exception as e:
+            print(f"[ERROR] Failed to store {key} on local disk: {e}")
+            return {'success': False, 'error': str(e)}
+
+    def delete(self, key: str) -> bool:
+        try:
+            os.remove(self.path(key))
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"[ERROR] Failed to delete {key} from local disk: {e}")
+            return False
+        return True
+
+    def open(self, key: str):
+        return open(self.path(key), 'rb')
+
+    def _resolve_url(self, key: str) -> Optional[str]:
+        return f"{self.url_prefix}/{key}" if self.url_prefix else None
+
+    def key_from_url(self, url: str) -> Optional[str]:
+        if self.url_prefix and url and url.startswith(self.url_prefix + '/'):
+            return url[len(self.url_prefix) + 1:]
+        return None
+
+
+class SupabaseStorage(StorageBackend):
+    """A Supabase Storage bucket; private buckets hand out signed URLs"""
+
+    name = 'supabase'
+
+    def __init__(self, bucket: str, public: bool = True, signed_url_ttl: int = SIGNED_URL_TTL):
+        from services.supabase_storage import get_storage_service
+        self.service = get_storage_service()  # one client per process
+        self.bucket = bucket
+        self.public = public
+        self.signed_url_ttl = signed_url_ttl
+        self.url_ttl = None if public else signed_url_ttl * 0.8
+
+    def is_available(self) -> bool:
+        return self.service.is_available()
+
+    def _bucket(self):
+        return self.service.client.storage.from_(self.bucket)
+
+    def save(self, key, source, content_type=None, cache_control=None) -> Dict:
+        if not self.is_available():
+            return {'success': False, 'error': 'Supabase Storage service not initialized'}
+        try:
+            # The client streams paths from disk; file objects are read in full
+            if not isinstance(source, (bytes, str)):
+                source = source.read()
+            self._bucket().upload(
+                path=key,
+                file=source,
+                file_options={
+                    'content-type': content_type or guess_content_type(key),
+                    'cache-control': cache_control or '3600',
+                    'upsert': 'true'
+                }
+            )
+            _url_cache.invalidate(self._cache_key(key))
+            return {'success': True, 'key': key, 'url': self.url(key) if self.public else None}
+        except Exception as e:
+            print(f"[ERROR] Failed to upload {key} to Supabase Storage: {e}")
+            return {'success': False, 'error': str(e)}
+
+    def delete(self, key: str) -> bool:
+        if not self.is_available():
+            return False
+        try:
+            self._bucket().remove([key])
+            _url_cache.invalidate(self._cache_key(key))
+            return True
+        except Exception as e:
+            print(f"[ERROR] Failed to delete {key} from Supabase Storage: {e}")
+            return False
+
+    def open(self, key: str):
+        return io.BytesIO(self._bucket().download(key))
+
+    def _resolve_url(self, key: str) -> Optional[str]:
+        if not self.is_available():
+            return None
+        if self.public:
+            return self._bucket().get_public_url(key)
+        result = self._bucket().create_signed_url(key, self.signed_url_ttl)
+        return result.get('signedURL') or result.get('signedUrl')
+
+    def key_from_url(self, url: str) -> Optional[str]:
+        marker = f'/{self.bucket}/'
+        if url and 'supabase' in url and marker in url:
+            return url.split(marker, 1)[1].split('?')[0]
+        return None
+
+
+class DriveStorage(StorageBackend):
+    """A Google Drive folder; keys are Drive file ids"""
+
+    name = 'drive'
+    named_keys = False
+
+    def __init__(self, public: bool = True):
+        from services.google_drive import get_drive_service
+        self.service = get_drive_service()  # one API client per process
+        self.public = public
+
+    def is_available(self) -> bool:
+        return self.service.is_available()
+
+    def save(self, key, source, content_type=None, cache_control=None) -> Dict:
+        content_type = content_type or guess_content_type(key)
+        stream = open(source, 'rb') if isinstance(source, str) else source
+        try:
+            result = self.service.upload_file(stream, os.path.basename(key), content_type,
+                                              public=self.public, chunksize=DRIVE_CHUNK_SIZE)
+        finally:
+            if isinstance(source, str):
+                stream.close()
+        if not result['success']:
+            return result
+        file_id = result['file_id']
+        return {'success': True, 'key': file_id, 'url': result['direct_link'] if self.public else None}
+
+    def delete(self, key: str) -> bool:
+        deleted = self.service.delete_file(key)
+        _url_cache.invalidate(self._cache_key(key))
+        return deleted
+
+    def open(self, key: str):
+        from googleapiclient.http import MediaIoBaseDownload
+        buffer = tempfile.SpooledTemporaryFile(max_size=DRIVE_CHUNK_SIZE)
+        downloader = MediaIoBaseDownload(buffer, self.service.service.files().get_media(fileId=key),
+                                         chunksize=DRIVE_CHUNK_SIZE)
+        done = False
+        while not done:
+            _, done = downloader.next_chunk()
+        buffer.seek(0)
+        return buffer
+
+    def _resolve_url(self, key: str) -> Optional[str]:
+        return f"https://drive.google.com/uc?export=view&id={key}" if self.public else None
+
+    def key_from_url(self, url: str) -> Optional[str]:
+        return self.service.get_file_id_from_url(url) if url else None
+
+
+def _create_backend(app, area: str, backend: str) -> StorageBackend:
+    if backend == 'supabase':
+        if area == 'profiles':
+            return SupabaseStorage('profile-pictures')
+        return SupabaseStorage(app.config.get('SUPABASE_DOCUMENTS_BUCKET') or 'documents', public=False,
+                               signed_url_ttl=app.config.get('STORAGE_SIGNED_URL_TTL', SIGNED_URL_TTL))
+    if backend == 'drive':
+        return DriveStorage(public=area == 'profiles')
+    if area == 'profiles':
+        return LocalStorage(os.path.join(app.static_folder, 'uploads', 'profiles'), 'uploads/profiles')
+    root = app.config.get('STORAGE_LOCAL_ROOT') or os.path.join(app.instance_path, 'storage')
+    return LocalStorage(os.path.join(root, area))
+
+
+# Backend instances per (area, backend)
+_backends: Dict[Tuple[str, str], StorageBackend] = {}
+_backends_lock = threading.Lock()
+
+def get_storage(area: str, app=None, backend: Optional[str] = None) -> StorageBackend:
+    """Get or create the storage backend for an area ('profiles' or 'documents')"""
+    if app is None:
+        from flask import current_app
+        app = current_app._get_current_object()
+    if area not in AREAS:
+        raise ValueError(f'Unknown storage area: {area}')
+
+    backend = backend or app.config.get('STORAGE_BACKEND', 'auto')
+    if backend == 'auto' and area == 'documents' and not app.config.get('SUPABASE_DOCUMENTS_BUCKET'):
+        backend = 'local'  # the private documents bucket has to be created and named explicitly
+    if backend == 'auto':
+        try:
+            backend = 'supabase' if get_storage(area, app, 'supabase').is_available() else 'local'
+        except ImportError:
+            backend = 'local'  # supabase package not installed
+
+    with _backends_lock:
+        if (area, backend) not in _backends:
+            _backends[(area, backend)] = _create_backend(app, area, backend)
+        return _backends[(area, backend)]
+
+
+def storage_for_url(area: str, url: str, app=None) -> Optional[StorageBackend]:
+    """The backend a stored profile picture URL belongs to"""
+    if not url:
+        return None
+    if 'supabase' in url:
+        return get_storage(area, app, 'supabase')
+    if 'drive.google.com' in url:
+        return get_storage(area, app, 'drive')
+    if not url.startswith('http'):
+        return get_storage(area, app, 'local')
+    return None
+
+
+# Documents are referenced as "<backend>:<key>"; older rows hold a plain local path
+def document_ref(backend: StorageBackend, key: str) -> str:
+    return f"{backend.name}:{key}"
+
+
+def parse_document_ref(ref: str) -> Tuple[Optional[str], str]:
+    backend, sep, key = (ref or '').partition(':')
+    if sep and backend in ('local', 'supabase', 'drive'):
+        return backend, key
+    return None, ref
+
+
+def store_document(app, user_id: int, path: str) -> str:
+    """Copy a generated document into document storage; returns its reference"""
+    storage = get_storage('documents', app)
+    key = f"user_{user_id}/{os.path.basename(path)}"
+    result = storage.save(key, path, guess_content_type(path))
+    if not result['success'] and storage.name != 'local':
+        # Same fallback as profile pictures: a generated document is never lost to storage errors
+        storage = get_storage('documents', app, 'local')
+        result = storage.save(key, path, guess_content_type(path))
+    if not result['success']:
+        raise RuntimeError(f"Could not store {os.path.basename(path)}: {result['error']}")
+    return document_ref(storage, result['key'])
+
+
+def document_response(ref: str, download_name: str, app=None):
+    """Flask response serving a stored document: a redirect when the backend has a URL, else the file"""
+    from flask import redirect, send_file
+    backend, key = parse_document_ref(ref)
+    if backend is None:
+        return send_file(key, as_attachment=True, download_name=download_name)
+
+    storage = get_storage('documents', app, backend)
+    url = storage.url(key)
+    if url:
+        return redirect(url)
+    if isinstance(storage, LocalStorage):
+        return send_file(storage.path(key), as_attachment=True, download_name=download_name)
+    return send_file(storage.open(key), as_attachment=True, download_name=download_name,
+                     mimetype=guess_content_type(download_name))
@@ -32,7 +32,8 @@ class SupabaseStorageService:
             print(f"[ERROR] Failed to initialize Supabase Storage service: {e}")
             self.client = None
 
-    def upload_file(self, file_data: bytes, filename: str, content_type: str = 'image/jpeg') -> Dict:
+    def upload_file(self, file_data: bytes, filename: str, content_type: str = 'image/jpeg',
+                    cache_control: str = '3600') -> Dict:
         """
         Upload a file to Supabase Storage
 
@@ -40,6 +41,7 @@ class SupabaseStorageService:
             file_data: File data as bytes
             filename: Name for the file
             content_type: MIME type of the file
+            cache_control: Cache lifetime in seconds for browsers and the CDN
 
         Returns:
             dict: {'success': bool, 'public_url': str, 'path': str, 'error': str}
@@ -57,7 +59,7 @@ class SupabaseStorageService:
                 file=file_data,
                 file_options={
                     'content-type': content_type,
-                    'cache-control': '3600',
+                    'cache-control': cache_control,
                     'upsert': 'true'  # Replace if file already exists
                 }
             )
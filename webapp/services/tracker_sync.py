@@ -0,0 +1,212 @@
+"""
+Tracker Sync Service for exchanging application history with the CLI bot
+"""
+
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from flask import current_app
+from sqlalchemy import insert
+from extensions import db
+from models.user import User, JobDescription, Application
+from models.sync import SyncWatermark
+from services.dashboard_stats import invalidate_user_stats
+from services.admin_stats import record_created
+from services import search_index
+
+# The bot's modules live in the repository root; appended so the web app's own
+# config module keeps precedence
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.append(str(REPO_ROOT))
+
+from application_tracker import create_tracker
+from tracker_events import APPLIED
+
+EVENTS_WATERMARK = 'tracker_events_offset'
+EXPORT_WATERMARK = 'webapp_application_id'
+
+
+class TrackerSyncService:
+    """Incremental, batched sync between the bot's ApplicationTracker and the web app models
+
+    Bot applications are read from the tracker's append-only event log starting
+    at a byte-offset watermark and upserted into JobDescription (keyed on
+    user_id and job_id) and Application rows. Applications created in the web app are
+    claimed in the tracker so the bot never applies to them again. Watermarks
+    are committed in the same transaction as the rows they cover.
+    """
+
+    def __init__(self, user: User, data_dir: Optional[Path] = None, batch_size: int = 500):
+        """Initialize the sync for the user who owns the bot's applications"""
+        config = current_app.config
+        data_dir = data_dir or Path(config.get('TRACKER_DATA_DIR') or REPO_ROOT / 'data')
+        # Same backend as the bot, so claims exported here are the ones it checks
+        self.tracker = create_tracker(
+            data_dir,
+            config.get('TRACKER_BACKEND', 'csv'),
+            config.get('TRACKER_MIRROR_CSV', True)
+        )
+        self.user = user
+        self.batch_size = batch_size
+
+    def _read_applied_events(self, offset: int):
+        """Read up to batch_size applied events after offset; returns (events, end_offset)"""
+        events = []
+        end_offset = offset
+        # Hold the tracker lock only while reading, never during database work
+        with self.tracker.lock:
+            for event, event_end in self.tracker.events.read_from(offset):
+                end_offset = event_end
+                if event.get('type') == APPLIED and event.get('job_id'):
+                    events.append(event)
+                    if len(events) >= self.batch_size:
+                        break
+        return events, end_offset
+
+    def _insert_ignoring_conflicts(self, model, rows: List[Dict], key: List[str]):
+        """Bulk insert rows, skipping ones whose unique key columns already exist"""
+        dialect = db.engine.dialect.name
+        if dialect == 'postgresql':
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        elif dialect == 'sqlite':
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        else:
+            db.session.execute(insert(model), rows)
+            return
+        db.session.execute(dialect_insert(model).on_conflict_do_nothing(index_elements=key), rows)
+
+    def _user_job_pks(self, job_ids: List[str]) -> Dict[str, int]:
+        """Map bot job IDs to this user's JobDescription primary keys"""
+        return dict(
+            db.session.query(JobDescription.job_id, JobDescription.id)
+            .filter(JobDescription.user_id == self.user.id, JobDescription.job_id.in_(job_ids))
+            .all()
+        )
+
+    def _upsert_applications(self, events: List[Dict]) -> int:
+        """Upsert one batch of applied events; returns the number of new applications"""
+        jobs = {}
+        for event in events:
+            jobs[event['job_id']] = {
+                'user_id': self.user.id,
+                'job_id': event['job_id'],
+                'title': event.get('title') or 'Unknown',
+                'company': event.get('company') or None,
+                'location': event.get('location') or None,
+                'source_type': 'bot',
+                'source_url': f"https://www.dice.com/job-detail/{event['job_id']}"
+            }
+
+        # Job descriptions: one lookup for the batch, bulk insert for the rest;
+        # only this user's rows count, other users may hold the same job_id
+        existing = self._user_job_pks(list(jobs))
+        new_jobs = [row for job_id, row in jobs.items() if job_id not in existing]
+        if new_jobs:
+            self._insert_ignoring_conflicts(JobDescription, new_jobs, ['user_id', 'job_id'])
+            known_jobs = set(existing.values())
+            existing = self._user_job_pks(list(jobs))
+            inserted_jobs = set(existing.values()) - known_jobs
+            record_created('job', datetime.utcnow().date(), {'': len(inserted_jobs)})
+            search_index.index_rows(JobDescription, inserted_jobs)
+
+        # Applications: skip jobs this user already has an application for
+        applied_jobs = {
+            job_pk for (job_pk,) in db.session.query(Application.job_id).filter(
+                Application.user_id == self.user.id,
+                Application.job_id.in_(list(existing.values()))
+            )
+        }
+        new_applications = []
+        for event in events:
+            job_pk = existing.get(event['job_id'])
+            if job_pk is None or job_pk in applied_jobs:
+                continue
+            applied_jobs.add(job_pk)
+            applied_date = datetime.strptime(event['ts'], "%Y-%m-%d %H:%M:%S") if event.get('ts') else datetime.utcnow()
+            new_applications.append({
+                'user_id': self.user.id,
+                'job_id': job_pk,
+                'status': 'applied',
+                'applied_date': applied_date,
+                'notes': 'Applied by SmartApplyPro bot'
+            })
+
+        if new_applications:
+            db.session.execute(insert(Application), new_applications)
+            record_created('application', datetime.utcnow().date(), {'applied': len(new_applications)})
+            search_index.index_rows(Application, [
+                application_id for (application_id,) in db.session.query(Application.id).filter(
+                    Application.user_id == self.user.id,
+                    Application.job_id.in_([row['job_id'] for row in new_applications])
+                )
+            ])
+        return len(new_applications)
+
+    def import_from_tracker(self) -> int:
+        """Import bot applications recorded since the last run"""
+        imported = 0
+        while True:
+            offset = int(SyncWatermark.get_value(EVENTS_WATERMARK))
+            events, end_offset = self._read_applied_events(offset)
+            if end_offset == offset:
+                break
+
+            try:
+                if events:
+                    imported += self._upsert_applications(events)
+                SyncWatermark.set_value(EVENTS_WATERMARK, end_offset)
+                db.session.commit()
+            except Exception as e:
+                db.session.rollback()
+                print(f"[ERROR] Failed to import tracker events: {e}")
+                break
+
+        if imported:
+            # Bulk inserts bypass the ORM events that normally invalidate the cache
+            invalidate_user_stats(self.user.id)
+        return imported
+
+    def export_to_tracker(self) -> int:
+        """Claim job IDs of applications created in the web app since the last run"""
+        exported = 0
+        while True:
+            last_id = int(SyncWatermark.get_value(EXPORT_WATERMARK))
+            rows = db.session.query(Application.id, JobDescription.job_id).join(
+                JobDescription, Application.job_id == JobDescription.id
+            ).filter(
+                Application.user_id == self.user.id,
+                Application.id > last_id
+            ).order_by(Application.id).limit(self.batch_size).all()
+            if not rows:
+                break
+
+            for _, job_id in rows:
+                if self.tracker.claim_job_id(job_id):
+                    exported += 1
+
+            SyncWatermark.set_value(EXPORT_WATERMARK, rows[-1][0])
+            db.session.commit()
+
+        if exported:
+            self.tracker.flush()
+        return exported
+
+    def sync_once(self) -> Dict:
+        """Run both directions once"""
+        return {
+            'imported': self.import_from_tracker(),
+            'exported': self.export_to_tracker()
+        }
+
+    def run(self, interval: float = 5):
+        """Keep syncing every interval seconds so dashboards follow bot activity"""
+        while True:
+            result = self.sync_once()
+            if result['imported'] or result['exported']:
+                print(f"[SYNC] Imported {result['imported']} bot applications, "
+                      f"exported {result['exported']} web applications")
+            time.sleep(interval)
@@ -0,0 +1,176 @@
+"""
+User Cache Service for Flask-Login identity lookups
+
+load_user serves a CachedIdentity built from a short-lived, process-local
+snapshot of the fields templates read on every page, so authenticated page
+views skip the user query. Anything else (relationships, methods, writes)
+transparently loads the real model row on first use in the request.
+"""
+
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+from extensions import db
+from models.user import User
+from models.admin import Admin
+
+CACHE_TTL = 60  # seconds; bounds staleness from writers in other processes
+
+MODELS = {'user': User, 'admin': Admin}
+
+# Fields copied into the snapshot; names a model lacks are remembered as missing
+SNAPSHOT_FIELDS = [
+    'id', 'email', 'username', 'full_name', 'profile_picture', 'language', 'gender',
+    'country', 'date_of_birth', 'is_active', 'email_verified', 'created_at', 'last_login',
+    'two_factor_enabled', 'is_admin', 'role'
+]
+
+_MISSING = object()
+
+
+class CachedIdentity:
+    """Flask-Login user backed by a snapshot, loading the model row on demand"""
+
+    is_authenticated = True
+    is_anonymous = False
+
+    def __init__(self, kind: str, snapshot: Dict):
+        self._kind = kind
+        self._snapshot = snapshot
+        self._model = None
+
+    def get_id(self):
+        user_id = self._snapshot['id']
+        return f'admin_{user_id}' if self._kind == 'admin' else str(user_id)
+
+    def has_password(self):
+        return self._snapshot['_has_password']
+
+    def model(self):
+        """The model row behind this identity, loaded into the current session"""
+        if self._model is None:
+            self._model = db.session.get(MODELS[self._kind], self._snapshot['id'])
+        return self._model
+
+    def __getattr__(self, name):
+        # Only called for names not found on the identity itself
+        if name.startswith('__') or name in ('_kind', '_snapshot', '_model'):
+            raise AttributeError(name)
+        value = self._snapshot.get(name, _MISSING) if not name.startswith('_') else _MISSING
+        if value is _MISSING:
+            if name in self._snapshot.get('_missing', ()):
+                raise AttributeError(name)
+            return getattr(self.model(), name)
+        return value
+
+    def __setattr__(self, name, value):
+        if name.startswith('_'):
+            object.__setattr__(self, name, value)
+        else:
+            # Writes go to the model row; committing it invalidates the snapshot
+            setattr(self.model(), name, value)
+            if name in self._snapshot:
+                self._snapshot[name] = value
+
+    def __eq__(self, other):
+        if isinstance(other, CachedIdentity):
+            return other._kind == self._kind and other._snapshot['id'] == self._snapshot['id']
+        return isinstance(other, MODELS[self._kind]) and other.id == self._snapshot['id']
+
+    def __hash__(self):
+        return hash((self._kind, self._snapshot['id']))
+
+    def __repr__(self):
+        return f'<CachedIdentity {self._kind} {self._snapshot.get("username")}>'
+
+
+class IdentityCache:
+    """TTL cache of identity snapshots keyed by (kind, id)"""
+
+    def __init__(self, ttl: float = CACHE_TTL):
+        self.ttl = ttl
+        self._entries: Dict[Tuple[str, int], Tuple[float, Dict]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key) -> Optional[Dict]:
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry and entry[0] > time.monotonic():
+            return entry[1]
+        return None
+
+    def put(self, key, snapshot: Dict):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, snapshot)
+
+    def invalidate(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+_cache = IdentityCache()
+
+
+def _snapshot(obj) -> Dict:
+    snapshot = {'_missing': set()}
+    for name in SNAPSHOT_FIELDS:
+        value = getattr(obj, name, _MISSING)
+        if value is _MISSING:
+            snapshot['_missing'].add(name)
+        else:
+            snapshot[name] = value
+    snapshot.setdefault('is_admin', False)
+    snapshot['_missing'].discard('is_admin')
+    has_password = getattr(obj, 'has_password', None)
+    snapshot['_has_password'] = has_password() if callable(has_password) else bool(getattr(obj, 'password_hash', None))
+    return snapshot
+
+
+def load_identity(user_id: str):
+    """Flask-Login user_loader: a cached identity for a session's user id"""
+    kind = 'admin' if user_id.startswith('admin_') else 'user'
+    try:
+        key = (kind, int(user_id[len('admin_'):] if kind == 'admin' else user_id))
+    except ValueError:
+        return None
+
+    snapshot = _cache.get(key)
+    if snapshot is None:
+        obj = db.session.get(MODELS[kind], key[1])
+        if obj is None:
+            return None
+        snapshot = _snapshot(obj)
+        _cache.put(key, snapshot)
+        identity = CachedIdentity(kind, dict(snapshot))
+        identity._model = obj
+        return identity
+
+    return CachedIdentity(kind, dict(snapshot))
+
+
+def invalidate_identity(kind: str, user_id: int):
+    """Drop the cached snapshot of a user or admin"""
+    _cache.invalidate((kind, user_id))
+
+
+def _invalidate_on_write(mapper, connection, target):
+    key = ('admin' if mapper.class_ is Admin else 'user', target.id)
+    invalidate_identity(*key)
+    # Again after commit, in case another request re-cached the old row meanwhile
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault('identity_invalidations', set()).add(key)
+
+
+def _invalidate_after_commit(session):
+    for key in session.info.pop('identity_invalidations', ()):
+        invalidate_identity(*key)
+
+
+for _model in MODELS.values():
+    event.listen(_model, 'after_update', _invalidate_on_write)
+    event.listen(_model, 'after_delete', _invalidate_on_write)
+event.listen(Session, 'after_commit', _invalidate_after_commit)
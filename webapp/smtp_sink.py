@@ -0,0 +1,90 @@
+"""
+Local SMTP stand-in for development and tests
+Accepts every message and prints it (optionally saving .eml files) instead of delivering it
+Point the app at it with MAIL_SERVER=localhost MAIL_PORT=1025 MAIL_USE_TLS=false
+"""
+import argparse
+import os
+import socketserver
+from datetime import datetime
+from email import message_from_bytes, policy
+
+
+class SMTPSinkHandler(socketserver.StreamRequestHandler):
+    """Minimal SMTP conversation: enough for smtplib.send_message"""
+
+    def reply(self, line):
+        self.wfile.write(f"{line}\r\n".encode())
+
+    def handle(self):
+        self.reply("220 smtp-sink ready")
+        sender, recipients = None, []
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode(errors='replace').strip()
+            verb = command[:4].upper()
+
+            if verb in ('HELO', 'EHLO'):
+                self.reply("250 smtp-sink")
+            elif verb == 'MAIL':
+                sender, recipients = command[10:].strip(), []
+                self.reply("250 OK")
+            elif verb == 'RCPT':
+                recipients.append(command[8:].strip())
+                self.reply("250 OK")
+            elif verb == 'DATA':
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                data = []
+                for data_line in self.rfile:
+                    if data_line in (b".\r\n", b".\n"):
+                        break
+                    data.append(data_line[1:] if data_line.startswith(b"..") else data_line)
+                self.server.deliver(sender, recipients, b"".join(data))
+                self.reply("250 OK queued")
+            elif verb in ('RSET', 'NOOP'):
+                self.reply("250 OK")
+            elif verb == 'QUIT':
+                self.reply("221 Bye")
+                return
+            else:
+                self.reply("502 Command not implemented")
+
+
+class SMTPSink(socketserver.ThreadingTCPServer):
+    """SMTP server that records messages instead of relaying them"""
+
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self, address, save_dir=None):
+        super().__init__(address, SMTPSinkHandler)
+        self.save_dir = save_dir
+        self.messages = []
+        if save_dir:
+            os.makedirs(save_dir, exist_ok=True)
+
+    def deliver(self, sender, recipients, data):
+        message = message_from_bytes(data, policy=policy.default)
+        self.messages.append(message)
+        print(f"[SMTP SINK] {sender} -> {', '.join(recipients)}: {message['Subject']}")
+        if self.save_dir:
+            filename = f"{datetime.now():%Y%m%d_%H%M%S_%f}.eml"
+            with open(os.path.join(self.save_dir, filename), 'wb') as f:
+                f.write(data)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Local SMTP server that prints instead of delivering')
+    parser.add_argument('--host', default='localhost')
+    parser.add_argument('--port', type=int, default=1025)
+    parser.add_argument('--save-dir', help='Directory to save received messages as .eml files')
+    args = parser.parse_args()
+
+    with SMTPSink((args.host, args.port), args.save_dir) as server:
+        print(f"[OK] SMTP sink listening on {args.host}:{args.port} (Ctrl+C to stop)")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,46 @@
+"""
+Sync application history between the CLI bot's tracker and the web app database
+Run once, or with --watch to keep dashboards up to date while the bot runs
+"""
+import argparse
+from app import create_app
+from extensions import db
+from models.user import User
+
+def sync_tracker(email, watch=False, interval=5):
+    """Sync the bot's tracker with the given user's applications"""
+    app = create_app()
+
+    with app.app_context():
+        # Make sure the watermark table exists
+        db.create_all()
+
+        user = User.query.filter_by(email=email).first()
+        if not user:
+            print(f"[ERROR] No user found with email {email}")
+            return False
+
+        from services.tracker_sync import TrackerSyncService
+        sync = TrackerSyncService(user)
+
+        if watch:
+            print(f"[OK] Watching the bot tracker every {interval}s for {email} (Ctrl+C to stop)")
+            try:
+                sync.run(interval)
+            except KeyboardInterrupt:
+                pass
+        else:
+            result = sync.sync_once()
+            print(f"[OK] Imported {result['imported']} bot applications")
+            print(f"[OK] Exported {result['exported']} web applications to the bot tracker")
+
+    return True
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Sync bot applications with the web app')
+    parser.add_argument('--email', required=True, help='Email of the user who owns the bot applications')
+    parser.add_argument('--watch', action='store_true', help='Keep syncing until interrupted')
+    parser.add_argument('--interval', type=float, default=5, help='Seconds between syncs in watch mode')
+    args = parser.parse_args()
+
+    sync_tracker(args.email, args.watch, args.interval)